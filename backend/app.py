@@ -21,6 +21,7 @@ Backend COMPLETO con:
 import asyncio
 import json
 import logging
+import math
 import os
 import re
 import sqlite3
@@ -28,9 +29,13 @@ import sys
 import threading
 import time
 import uuid
+from collections import Counter, UserDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime, timedelta
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -38,12 +43,26 @@ import aiohttp
 import requests
 
 # Flask imports
-from flask import Flask, Response, g, jsonify, request, send_from_directory
+from flask import (
+    Flask,
+    Response,
+    current_app,
+    g,
+    jsonify,
+    request,
+    send_from_directory,
+)
 from flask_cors import CORS
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+# Serializador JSON rápido (opcional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuración de paths
 BACKEND_ROOT = Path(__file__).parent
 PROJECT_ROOT = BACKEND_ROOT.parent
@@ -141,6 +160,110 @@ PROVINCE_CODES = {
     "30": "Exterior",
 }
 
+# Nombres de provincia indexados por el código numérico (None si no existe)
+PROVINCE_NAMES = tuple(PROVINCE_CODES.get(f"{code:02d}") for code in range(31))
+
+
+# Último segundo formateado por iso_now (tupla reemplazada atómicamente)
+_iso_now_cache = (0, "")
+
+
+def iso_now() -> str:
+    """Timestamp ISO local truncado al segundo (se formatea una vez por segundo)"""
+    global _iso_now_cache
+    now = int(time.time())
+    cached_second, cached_iso = _iso_now_cache
+    if now != cached_second:
+        cached_iso = datetime.fromtimestamp(now).isoformat()
+        _iso_now_cache = (now, cached_iso)
+    return cached_iso
+
+
+def _json_default(obj):
+    """Tipos extra serializados igual que orjson: fechas ISO, Enum y dataclasses"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _finite(asdict(obj))
+    return str(obj)
+
+
+def _finite(obj):
+    """Reemplaza NaN/Infinity por None, como hace orjson"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+# Opciones equivalentes para orjson y para el json estándar: claves ordenadas
+# (como jsonify), salida compacta en UTF-8 y sin NaN
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS) if orjson else 0
+_JSON_OPTIONS = {
+    "ensure_ascii": False,
+    "separators": (",", ":"),
+    "sort_keys": True,
+    "allow_nan": False,
+    "default": _json_default,
+}
+
+
+def json_bytes(obj) -> bytes:
+    """Serializar a JSON en bytes (orjson si está disponible, misma salida)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Tipos que orjson no soporta (p. ej. enteros de más de 64 bits)
+            pass
+    try:
+        text = json.dumps(obj, **_JSON_OPTIONS)
+    except ValueError:
+        text = json.dumps(_finite(obj), **_JSON_OPTIONS)
+    return text.encode("utf-8")
+
+
+def ojson(obj, status: int = 200) -> Response:
+    """Respuesta JSON serializada con json_bytes"""
+    return current_app.response_class(
+        json_bytes(obj), status=status, mimetype="application/json"
+    )
+
+
+def build_result_body(session_id: str, consultation: Dict) -> bytes:
+    """Cuerpo JSON de /api/resultado para una consulta completada"""
+    vehicle_data = consultation["result"]
+
+    return json_bytes(
+        {
+            "success": True,
+            "session_id": session_id,
+            "vehicle_data": vehicle_data,
+            "complete_summary": consultation.get("complete_summary", {}),
+            "timestamp": consultation.get("timestamp"),
+            "response_time": vehicle_data.get("tiempo_consulta", 0),
+            "features_extraidas": {
+                "propietario_encontrado": vehicle_data.get(
+                    "propietario_encontrado", False
+                ),
+                "datos_sri_completos": True,
+                "rubros_deuda": len(vehicle_data.get("rubros_deuda", [])),
+                "componentes_analizados": vehicle_data.get(
+                    "total_componentes_analizados", 0
+                ),
+                "historial_pagos": len(vehicle_data.get("historial_pagos", [])),
+                "plan_iacv": len(vehicle_data.get("plan_excepcional_iacv", [])),
+                "total_deudas_sri": vehicle_data.get("total_deudas_sri", 0),
+                "total_pagos_realizados": vehicle_data.get("total_pagos_realizados", 0),
+            },
+        }
+    )
+
 
 @dataclass
 class UserData:
@@ -366,44 +489,75 @@ class VehicleDataSRI:
         }
 
 
-class PlateValidator:
-    """Validador de placas ecuatorianas optimizado"""
+# Expresiones regulares compiladas una sola vez al importar el módulo
+_PLATE_CLEAN_RE = re.compile(r"[^A-Z0-9]")
+_PLATE_3_DIGITS_RE = re.compile(r"([A-Z]{2,3})(\d{3})")
+_PLATE_FORMAT_RE = re.compile(r"[A-Z]{2,3}-?\d{3,4}")
+_CEDULA_DIGITS_RE = re.compile(r"[0-9]{10}")
+_CEDULA_COEFFICIENTS = (2, 1, 2, 1, 2, 1, 2, 1, 2)
 
-    _validation_cache = {}
 
-    @classmethod
-    def normalize_plate(cls, placa: str) -> tuple[str, str, bool]:
-        """Normaliza placas ecuatorianas con cache"""
-        if not placa or not isinstance(placa, str):
-            return placa, placa, False
+@lru_cache(maxsize=4096)
+def _normalize_plate_cached(placa_upper: str) -> tuple[str, str, bool]:
+    """Normalización de una placa ya convertida a mayúsculas (memoizada)"""
+    placa_clean = _PLATE_CLEAN_RE.sub("", placa_upper)
+    placa_original = placa_clean
 
-        cache_key = placa.upper().strip()
-        if cache_key in cls._validation_cache:
-            return cls._validation_cache[cache_key]
+    # Normalización automática ABC123 -> ABC0123
+    match = _PLATE_3_DIGITS_RE.fullmatch(placa_clean)
 
-        placa_clean = re.sub(r"[^A-Z0-9]", "", placa.upper())
-        placa_original = placa_clean
+    if match:
+        letters = match.group(1)
+        numbers = match.group(2)
+        placa_normalizada = f"{letters}0{numbers}"
+        logger.info(f"🔧 Placa normalizada: {placa_original} → {placa_normalizada}")
+        return (placa_original, placa_normalizada, True)
 
-        # Normalización automática ABC123 -> ABC0123
-        pattern_3_digits = r"^([A-Z]{2,3})(\d{3})$"
-        match = re.match(pattern_3_digits, placa_clean)
+    return (placa_original, placa_clean, False)
 
-        if match:
-            letters = match.group(1)
-            numbers = match.group(2)
-            placa_normalizada = f"{letters}0{numbers}"
-            result = (placa_original, placa_normalizada, True)
-            logger.info(f"🔧 Placa normalizada: {placa_original} → {placa_normalizada}")
-        else:
-            result = (placa_original, placa_clean, False)
 
-        cls._validation_cache[cache_key] = result
+@lru_cache(maxsize=4096)
+def _validate_plate_format_cached(placa: str) -> bool:
+    """Validación de formato de placa (memoizada)"""
+    # Equivale a los formatos ABC1234 y ABC-1234
+    return _PLATE_FORMAT_RE.fullmatch(placa.upper()) is not None
 
-        # Limpiar cache si crece mucho
-        if len(cls._validation_cache) > 1000:
-            cls._validation_cache.clear()
 
-        return result
+@lru_cache(maxsize=4096)
+def _validate_ecuadorian_id_cached(cedula: str) -> bool:
+    """Algoritmo oficial de cédula sobre 10 dígitos (memoizado)"""
+    # Verificar código de provincia
+    province_code = cedula[:2]
+    if province_code not in PROVINCE_CODES:
+        return False
+
+    # Dígitos como enteros directamente desde los bytes ASCII (sin int() por carácter)
+    digits = cedula.encode("ascii")
+
+    # Verificar tercer dígito
+    if digits[2] - 48 >= 6:
+        return False
+
+    # Algoritmo de validación (módulo 10 con coeficientes 2,1,2,...)
+    total = 0
+    for i, coefficient in enumerate(_CEDULA_COEFFICIENTS):
+        product = (digits[i] - 48) * coefficient
+        total += product - 9 if product > 9 else product
+
+    check_digit = (10 - total % 10) % 10
+    return check_digit == digits[9] - 48
+
+
+class PlateValidator:
+    """Validador de placas ecuatorianas optimizado"""
+
+    @classmethod
+    def normalize_plate(cls, placa: str) -> tuple[str, str, bool]:
+        """Normaliza placas ecuatorianas con cache"""
+        if not placa or not isinstance(placa, str):
+            return placa, placa, False
+
+        return _normalize_plate_cached(placa.upper())
 
     @staticmethod
     def validate_plate_format(placa: str) -> bool:
@@ -411,57 +565,30 @@ class PlateValidator:
         if not placa or len(placa) < 6 or len(placa) > 8:
             return False
 
-        patterns = [r"^[A-Z]{2,3}\d{3,4}$", r"^[A-Z]{2,3}-\d{3,4}$"]
+        return _validate_plate_format_cached(placa)
 
-        return any(re.match(pattern, placa.upper()) for pattern in patterns)
+    @staticmethod
+    def clear_cache():
+        """Vaciar los caches LRU de validación de placas"""
+        _normalize_plate_cached.cache_clear()
+        _validate_plate_format_cached.cache_clear()
 
 
 class CedulaValidator:
     """Validador de cédulas ecuatorianas optimizado"""
 
-    _validation_cache = {}
-
     @classmethod
     def validate_ecuadorian_id(cls, cedula: str) -> bool:
         """Valida cédula ecuatoriana con algoritmo oficial"""
-        if not cedula or len(cedula) != 10 or not cedula.isdigit():
+        if not cedula or _CEDULA_DIGITS_RE.fullmatch(cedula) is None:
             return False
 
-        if cedula in cls._validation_cache:
-            return cls._validation_cache[cedula]
+        return _validate_ecuadorian_id_cached(cedula)
 
-        # Verificar código de provincia
-        province_code = cedula[:2]
-        if province_code not in PROVINCE_CODES:
-            cls._validation_cache[cedula] = False
-            return False
-
-        # Verificar tercer dígito
-        if int(cedula[2]) >= 6:
-            cls._validation_cache[cedula] = False
-            return False
-
-        # Algoritmo de validación
-        digits = [int(d) for d in cedula]
-        coefficients = [2, 1, 2, 1, 2, 1, 2, 1, 2]
-        total = 0
-
-        for i in range(9):
-            result = digits[i] * coefficients[i]
-            if result > 9:
-                result -= 9
-            total += result
-
-        check_digit = (10 - (total % 10)) % 10
-        is_valid = check_digit == digits[9]
-
-        cls._validation_cache[cedula] = is_valid
-
-        # Limpiar cache si crece mucho
-        if len(cls._validation_cache) > 10000:
-            cls._validation_cache.clear()
-
-        return is_valid
+    @staticmethod
+    def clear_cache():
+        """Vaciar el cache LRU de validación de cédulas"""
+        _validate_ecuadorian_id_cached.cache_clear()
 
 
 class DatabaseManager:
@@ -878,13 +1005,93 @@ class DatabaseManager:
             return 0
 
 
+class ConsultationStore(UserDict):
+    """Consultas activas con expiración por TTL, tamaño acotado y conteo por estado"""
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 86400):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.status_counts = Counter()
+        self.owners_found = 0
+        self._expires = {}
+        self._lock = threading.RLock()
+        super().__init__()
+
+    @staticmethod
+    def _owner_found(consultation) -> int:
+        """1 si la consulta encontró al propietario del vehículo, 0 si no"""
+        return 1 if consultation.get("result", {}).get("propietario_encontrado") else 0
+
+    def __setitem__(self, session_id, consultation):
+        with self._lock:
+            # Reinsertar al final: el dict queda ordenado por última escritura
+            previous = self.data.pop(session_id, None)
+            self._expires.pop(session_id, None)
+            if previous is not None:
+                self.status_counts[previous.get("status")] -= 1
+                self.owners_found -= self._owner_found(previous)
+
+            self.data[session_id] = consultation
+            self._expires[session_id] = time.monotonic() + self.ttl
+            self.status_counts[consultation.get("status")] += 1
+            self.owners_found += self._owner_found(consultation)
+            self._evict()
+
+    def __delitem__(self, session_id):
+        with self._lock:
+            consultation = self.data.pop(session_id)
+            self._expires.pop(session_id, None)
+            self.status_counts[consultation.get("status")] -= 1
+            self.owners_found -= self._owner_found(consultation)
+
+    def stale_sessions(self, max_age: float) -> List[str]:
+        """Sesiones cuya última actualización tiene más de max_age segundos"""
+        # Vencimiento = escritura + ttl; el orden de inserción es el de escritura
+        cutoff = time.monotonic() + self.ttl - max_age
+        stale = []
+        with self._lock:
+            for session_id, expires in self._expires.items():
+                if expires > cutoff:
+                    break
+                stale.append(session_id)
+        return stale
+
+    def _evict(self):
+        """Eliminar consultas expiradas o que exceden el tamaño máximo"""
+        now = time.monotonic()
+        while self.data:
+            oldest = next(iter(self.data))
+            if len(self.data) <= self.maxsize and self._expires[oldest] > now:
+                break
+            del self[oldest]
+
+
+# Pool compartido para las consultas en segundo plano: evita crear un hilo y
+# un event loop por request y acota las consultas simultáneas
+MAX_CONCURRENT_CONSULTATIONS = 8
+consultation_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_CONSULTATIONS, thread_name_prefix="ecplacas-consulta"
+)
+_worker_state = threading.local()
+
+
+def run_in_worker_loop(coro):
+    """Ejecutar una corrutina en el event loop persistente del hilo actual"""
+    loop = getattr(_worker_state, "loop", None)
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _worker_state.loop = loop
+    return loop.run_until_complete(coro)
+
+
 class VehicleConsultantSRI:
     """Consultor SRI COMPLETO + Propietario optimizado"""
 
     def __init__(self):
         self.session = self._create_optimized_session()
         self.db = DatabaseManager()
-        self.active_consultations = {}
+        self.active_consultations = ConsultationStore()
         self._last_request_time = 0
 
     def _create_optimized_session(self) -> requests.Session:
@@ -1905,7 +2112,7 @@ def create_app(config_name: str = "production") -> Flask:
                     "author": "Erick Costa",
                     "project": "Construcción de Software",
                     "theme": "Futurista - Azul Neon",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": iso_now(),
                     "environment": config_name,
                     "features_completas": {
                         "propietario_vehiculo": True,
@@ -1931,7 +2138,7 @@ def create_app(config_name: str = "production") -> Flask:
                         "success": False,
                         "status": "unhealthy",
                         "error": "Error interno del sistema",
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": iso_now(),
                     }
                 ),
                 500,
@@ -2007,36 +2214,40 @@ def create_app(config_name: str = "production") -> Flask:
                 f"🚀 Nueva consulta ECPlacas 2.0 COMPLETA - Placa: {placa}, Session: {session_id}"
             )
 
+            # Marcar como iniciando antes de encolar, para que el estado sea
+            # consultable aunque todos los workers estén ocupados
+            vehicle_consultant_sri.active_consultations[session_id] = {
+                "status": "iniciando",
+                "progress": 5,
+                "message": "🚀 Iniciando consulta SRI COMPLETA + Propietario...",
+                "timestamp": iso_now(),
+            }
+
             # Función para consulta completa
             def run_complete_consultation():
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                    # Marcar como iniciando
-                    vehicle_consultant_sri.active_consultations[session_id] = {
-                        "status": "iniciando",
-                        "progress": 5,
-                        "message": "🚀 Iniciando consulta SRI COMPLETA + Propietario...",
-                        "timestamp": datetime.now().isoformat(),
-                    }
-
                     # Ejecutar consulta SRI completa + propietario
-                    vehicle_data = loop.run_until_complete(
+                    vehicle_data = run_in_worker_loop(
                         vehicle_consultant_sri.consultar_vehiculo_completo(
                             placa, user_data, session_id
                         )
                     )
 
-                    # Marcar como completado
-                    vehicle_consultant_sri.active_consultations[session_id] = {
+                    # Marcar como completado, con la respuesta ya serializada
+                    consultation = {
                         "status": "completado",
                         "progress": 100,
                         "message": "✅ Consulta SRI COMPLETA + Propietario exitosa",
                         "result": vehicle_data.to_dict(),
                         "complete_summary": vehicle_data.get_complete_summary(),
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": iso_now(),
                     }
+                    consultation["response_body"] = build_result_body(
+                        session_id, consultation
+                    )
+                    vehicle_consultant_sri.active_consultations[session_id] = (
+                        consultation
+                    )
 
                     logger.info(
                         f"✅ Consulta COMPLETA finalizada: {session_id} - "
@@ -2053,14 +2264,11 @@ def create_app(config_name: str = "production") -> Flask:
                         "progress": 0,
                         "message": f"Error en consulta COMPLETA: {str(e)}",
                         "error": str(e),
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": iso_now(),
                     }
-                finally:
-                    loop.close()
 
-            # Ejecutar en thread separado
-            thread = threading.Thread(target=run_complete_consultation, daemon=True)
-            thread.start()
+            # Ejecutar en el pool compartido de consultas
+            consultation_executor.submit(run_complete_consultation)
 
             # Normalizar placa para respuesta
             placa_original, placa_normalizada, was_modified = (
@@ -2092,7 +2300,7 @@ def create_app(config_name: str = "production") -> Flask:
                             "estado": f"/api/estado-consulta/{session_id}",
                             "resultado": f"/api/resultado/{session_id}",
                         },
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": iso_now(),
                     }
                 ),
                 202,
@@ -2105,7 +2313,7 @@ def create_app(config_name: str = "production") -> Flask:
                     {
                         "success": False,
                         "error": "Error interno del servidor",
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": iso_now(),
                     }
                 ),
                 500,
@@ -2124,9 +2332,7 @@ def create_app(config_name: str = "production") -> Flask:
                         "status": consultation.get("status", "unknown"),
                         "progress": consultation.get("progress", 0),
                         "message": consultation.get("message", ""),
-                        "timestamp": consultation.get(
-                            "timestamp", datetime.now().isoformat()
-                        ),
+                        "timestamp": consultation.get("timestamp", iso_now()),
                         "result_available": consultation.get("status") == "completado",
                     }
                 )
@@ -2166,88 +2372,49 @@ def create_app(config_name: str = "production") -> Flask:
                     consultation.get("status") == "completado"
                     and "result" in consultation
                 ):
-                    vehicle_data = consultation["result"]
-                    complete_summary = consultation.get("complete_summary", {})
+                    # Cuerpo serializado una sola vez al completar la consulta
+                    body = consultation.get("response_body")
+                    if body is None:
+                        body = build_result_body(session_id, consultation)
 
-                    return jsonify(
+                    return current_app.response_class(body, mimetype="application/json")
+                elif consultation.get("status") == "error":
+                    return ojson(
                         {
-                            "success": True,
+                            "success": False,
+                            "error": consultation.get("error", "Error desconocido"),
                             "session_id": session_id,
-                            "vehicle_data": vehicle_data,
-                            "complete_summary": complete_summary,
-                            "timestamp": consultation.get("timestamp"),
-                            "response_time": vehicle_data.get("tiempo_consulta", 0),
-                            "features_extraidas": {
-                                "propietario_encontrado": vehicle_data.get(
-                                    "propietario_encontrado", False
-                                ),
-                                "datos_sri_completos": True,
-                                "rubros_deuda": len(
-                                    vehicle_data.get("rubros_deuda", [])
-                                ),
-                                "componentes_analizados": vehicle_data.get(
-                                    "total_componentes_analizados", 0
-                                ),
-                                "historial_pagos": len(
-                                    vehicle_data.get("historial_pagos", [])
-                                ),
-                                "plan_iacv": len(
-                                    vehicle_data.get("plan_excepcional_iacv", [])
-                                ),
-                                "total_deudas_sri": vehicle_data.get(
-                                    "total_deudas_sri", 0
-                                ),
-                                "total_pagos_realizados": vehicle_data.get(
-                                    "total_pagos_realizados", 0
-                                ),
-                            },
-                        }
-                    )
-                elif consultation.get("status") == "error":
-                    return (
-                        jsonify(
-                            {
-                                "success": False,
-                                "error": consultation.get("error", "Error desconocido"),
-                                "session_id": session_id,
-                            }
-                        ),
+                        },
                         500,
                     )
                 else:
-                    return (
-                        jsonify(
-                            {
-                                "success": False,
-                                "error": "Consulta aún en proceso",
-                                "status": consultation.get("status"),
-                                "progress": consultation.get("progress", 0),
-                            }
-                        ),
+                    return ojson(
+                        {
+                            "success": False,
+                            "error": "Consulta aún en proceso",
+                            "status": consultation.get("status"),
+                            "progress": consultation.get("progress", 0),
+                        },
                         202,
                     )
             else:
-                return (
-                    jsonify(
-                        {
-                            "success": False,
-                            "error": "Sesión no encontrada",
-                            "session_id": session_id,
-                        }
-                    ),
+                return ojson(
+                    {
+                        "success": False,
+                        "error": "Sesión no encontrada",
+                        "session_id": session_id,
+                    },
                     404,
                 )
 
         except Exception as e:
             logger.error(f"❌ Error obteniendo resultado: {e}")
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error": "Error interno",
-                        "session_id": session_id,
-                    }
-                ),
+            return ojson(
+                {
+                    "success": False,
+                    "error": "Error interno",
+                    "session_id": session_id,
+                },
                 500,
             )
 
@@ -2255,34 +2422,23 @@ def create_app(config_name: str = "production") -> Flask:
     def get_system_statistics():
         """Obtener estadísticas completas del sistema SRI + Propietario"""
         try:
-            # Estadísticas básicas del sistema
+            # Estadísticas básicas del sistema (contadores mantenidos por el store)
+            consultations = vehicle_consultant_sri.active_consultations
+            total_consultas = len(consultations)
+            completadas = consultations.status_counts["completado"]
+            con_error = consultations.status_counts["error"]
+
             basic_stats = {
-                "total_consultas": len(vehicle_consultant_sri.active_consultations),
-                "consultas_activas": sum(
-                    1
-                    for c in vehicle_consultant_sri.active_consultations.values()
-                    if c.get("status") not in ["completado", "error"]
-                ),
-                "consultas_completadas": sum(
-                    1
-                    for c in vehicle_consultant_sri.active_consultations.values()
-                    if c.get("status") == "completado"
-                ),
-                "consultas_con_error": sum(
-                    1
-                    for c in vehicle_consultant_sri.active_consultations.values()
-                    if c.get("status") == "error"
-                ),
-                "ultima_actualizacion": datetime.now().isoformat(),
+                "total_consultas": total_consultas,
+                "consultas_activas": total_consultas - completadas - con_error,
+                "consultas_completadas": completadas,
+                "consultas_con_error": con_error,
+                "ultima_actualizacion": iso_now(),
             }
 
             # Estadísticas de propietarios encontrados
             propietarios_stats = {
-                "propietarios_encontrados": sum(
-                    1
-                    for c in vehicle_consultant_sri.active_consultations.values()
-                    if c.get("result", {}).get("propietario_encontrado", False)
-                ),
+                "propietarios_encontrados": consultations.owners_found,
                 "tasa_exito_propietarios": 0,
             }
 
@@ -2296,7 +2452,7 @@ def create_app(config_name: str = "production") -> Flask:
                     2,
                 )
 
-            return jsonify(
+            return ojson(
                 {
                     "success": True,
                     "estadisticas_generales": basic_stats,
@@ -2305,14 +2461,13 @@ def create_app(config_name: str = "production") -> Flask:
                         "sri_endpoints": list(SRI_ENDPOINTS.keys()),
                         "owner_apis": list(OWNER_APIS.keys()),
                     },
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": iso_now(),
                 }
             )
         except Exception as e:
             logger.error(f"❌ Error obteniendo estadísticas: {e}")
-            return (
-                jsonify({"success": False, "error": "Error obteniendo estadísticas"}),
-                500,
+            return ojson(
+                {"success": False, "error": "Error obteniendo estadísticas"}, 500
             )
 
     @app.route("/api/test-sri-completo", methods=["GET"])
@@ -2383,7 +2538,7 @@ def create_app(config_name: str = "production") -> Flask:
                             "tiempo_consulta": result.get("tiempo_consulta", 0),
                         },
                         "placa_test": placa_test,
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": iso_now(),
                     }
                 )
 
@@ -2398,33 +2553,16 @@ def create_app(config_name: str = "production") -> Flask:
     def clear_system_cache():
         """Limpiar cache del sistema"""
         try:
-            # Limpiar active consultations antiguas (más de 2 horas)
-            current_time = time.time()
-            sessions_to_remove = []
-
-            for (
-                session_id,
-                consultation,
-            ) in vehicle_consultant_sri.active_consultations.items():
-                consultation_time = consultation.get("timestamp")
-                if consultation_time:
-                    try:
-                        consultation_datetime = datetime.fromisoformat(
-                            consultation_time
-                        )
-                        if (
-                            datetime.now() - consultation_datetime
-                        ).total_seconds() > 7200:  # 2 horas
-                            sessions_to_remove.append(session_id)
-                    except:
-                        sessions_to_remove.append(session_id)
+            # Limpiar active consultations antiguas (más de 2 horas sin actualizarse)
+            consultations = vehicle_consultant_sri.active_consultations
+            sessions_to_remove = consultations.stale_sessions(7200)
 
             for session_id in sessions_to_remove:
-                del vehicle_consultant_sri.active_consultations[session_id]
+                consultations.pop(session_id, None)
 
             # Limpiar caches de validación
-            PlateValidator._validation_cache.clear()
-            CedulaValidator._validation_cache.clear()
+            PlateValidator.clear_cache()
+            CedulaValidator.clear_cache()
 
             logger.info(
                 f"🧹 Cache limpiado: {len(sessions_to_remove)} sesiones eliminadas"
@@ -2440,7 +2578,7 @@ def create_app(config_name: str = "production") -> Flask:
                         "cedula_validator",
                         "active_consultations",
                     ],
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": iso_now(),
                 }
             )
 
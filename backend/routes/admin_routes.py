@@ -12,20 +12,56 @@ Versión: 2.0.1
 Rutas administrativas que complementan el panel de admin del app.py
 """
 
-import json
 import logging
 import os
+import platform
 import sqlite3
-from datetime import datetime, timedelta
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-from flask import Blueprint, current_app, jsonify, render_template_string, request
+from flask import Blueprint, current_app, jsonify, request
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _get_process():
+    """Handle compartido del proceso actual; se recrea tras un fork (otro pid)"""
+    return _process_for_pid(os.getpid())
+
+
+@lru_cache(maxsize=1)
+def _process_for_pid(pid: int):
+    """Handle del proceso pid (cpu_percent mide desde la llamada anterior)"""
+    return psutil.Process(pid)
+
+
+__all__ = ["admin_bp"]
 
 # Crear blueprint para rutas de admin
 admin_bp = Blueprint("admin", __name__)
 
 logger = logging.getLogger("ecplacas.admin")
 
+
+def _int_arg(args, key, default, minv=1, maxv=10000):
+    """Leer un parámetro entero de la query acotado a [minv, maxv]"""
+    value = args.get(key)
+    if value is None:
+        return default
+    try:
+        return max(minv, min(maxv, int(value)))
+    except ValueError:
+        return default
+
+
 # ==========================================
 # MIDDLEWARE DE SEGURIDAD
 # ==========================================
@@ -35,9 +71,14 @@ logger = logging.getLogger("ecplacas.admin")
 def admin_security():
     """Middleware de seguridad para rutas admin"""
     # Log de acceso admin
-    logger.warning(
-        f"Admin access attempt: {request.method} {request.path} from {request.remote_addr}"
-    )
+    if logger.isEnabledFor(logging.WARNING):
+        req = request._get_current_object()
+        logger.warning(
+            "Admin access attempt: %s %s from %s",
+            req.method,
+            req.path,
+            req.remote_addr,
+        )
 
     # En producción, aquí iría autenticación real
     # Por ahora solo log de seguridad
@@ -48,28 +89,33 @@ def admin_security():
 # ==========================================
 
 
+@lru_cache(maxsize=1)
+def _get_platform_info():
+    """Información del sistema operativo y de Python (constante por proceso)"""
+    return {
+        "sistema_operativo": {
+            "nombre": platform.system(),
+            "version": platform.version(),
+            "arquitectura": platform.architecture()[0],
+            "procesador": platform.processor(),
+            "nombre_maquina": platform.node(),
+        },
+        "python": {
+            "version": sys.version,
+            "version_info": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+            "executable": sys.executable,
+            "platform": sys.platform,
+        },
+    }
+
+
 @admin_bp.route("/info")
 def system_info():
     """Información detallada del sistema"""
     try:
-        import platform
-        import sys
-
         # Información del sistema
         system_info = {
-            "sistema_operativo": {
-                "nombre": platform.system(),
-                "version": platform.version(),
-                "arquitectura": platform.architecture()[0],
-                "procesador": platform.processor(),
-                "nombre_maquina": platform.node(),
-            },
-            "python": {
-                "version": sys.version,
-                "version_info": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-                "executable": sys.executable,
-                "platform": sys.platform,
-            },
+            **_get_platform_info(),
             "aplicacion": {
                 "nombre": "ECPlacas 2.0 SRI COMPLETO",
                 "version": "2.0.1",
@@ -89,10 +135,8 @@ def system_info():
         }
 
         # Información de memoria (si psutil está disponible)
-        try:
-            import psutil
-
-            process = psutil.Process()
+        if psutil is not None:
+            process = _get_process()
             system_info["recursos"] = {
                 "memoria_proceso_mb": round(process.memory_info().rss / 1024 / 1024, 2),
                 "cpu_percent": process.cpu_percent(),
@@ -101,7 +145,7 @@ def system_info():
                     psutil.disk_usage("/").free / 1024 / 1024 / 1024, 2
                 ),
             }
-        except ImportError:
+        else:
             system_info["recursos"] = {"mensaje": "psutil no disponible"}
 
         return jsonify({"success": True, "system_info": system_info})
@@ -116,6 +160,101 @@ def system_info():
         )
 
 
+# Cache de la información de BD: el panel de admin la consulta por polling
+# y recalcularla implica abrir la BD y contar registros de cada tabla
+_DB_INFO_TTL = 5.0
+_db_info_cache = None
+_db_info_lock = threading.Lock()
+
+
+def _collect_database_info(db_path):
+    """Recolectar información del archivo y contenido de la base de datos"""
+    # Información básica del archivo
+    db_file = Path(db_path)
+    db_stat = db_file.stat()
+    file_size = db_stat.st_size
+
+    # Conectar a la base de datos
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+
+        # Información de SQLite
+        cursor.execute("SELECT sqlite_version()")
+        sqlite_version = cursor.fetchone()[0]
+
+        # Obtener lista de tablas
+        cursor.execute(
+            """
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name NOT LIKE 'sqlite_%'
+            ORDER BY name
+        """
+        )
+        tables = [row[0] for row in cursor.fetchall()]
+
+        # Conteo de registros por tabla
+        table_counts = {}
+        for table in tables:
+            try:
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                table_counts[table] = cursor.fetchone()[0]
+            except Exception as e:
+                table_counts[table] = f"Error: {e}"
+
+        # Configuración PRAGMA
+        pragma_info = {}
+        pragmas = ["journal_mode", "synchronous", "foreign_keys", "cache_size"]
+        for pragma in pragmas:
+            try:
+                cursor.execute(f"PRAGMA {pragma}")
+                pragma_info[pragma] = cursor.fetchone()[0]
+            except:
+                pragma_info[pragma] = "Error"
+
+    return {
+        "success": True,
+        "database": {
+            "path": str(db_path),
+            "size_bytes": file_size,
+            "size_mb": round(file_size / 1024 / 1024, 2),
+            "sqlite_version": sqlite_version,
+            "created": datetime.fromtimestamp(db_stat.st_ctime).isoformat(),
+            "modified": datetime.fromtimestamp(db_stat.st_mtime).isoformat(),
+        },
+        "tables": {
+            "total": len(tables),
+            "list": tables,
+            "record_counts": table_counts,
+        },
+        "configuration": pragma_info,
+    }
+
+
+def _get_database_info(db_path):
+    """Obtener la información de BD, recalculándola como máximo cada _DB_INFO_TTL"""
+    global _db_info_cache
+    now = time.monotonic()
+    with _db_info_lock:
+        cached = _db_info_cache
+        if (
+            cached is not None
+            and cached[0] == db_path
+            and now - cached[1] < _DB_INFO_TTL
+        ):
+            return cached[2]
+
+        db_info = _collect_database_info(db_path)
+        _db_info_cache = (db_path, now, db_info)
+        return db_info
+
+
+def _invalidate_database_info():
+    """Descartar la información de BD cacheada"""
+    global _db_info_cache
+    with _db_info_lock:
+        _db_info_cache = None
+
+
 @admin_bp.route("/database/info")
 def database_info():
     """Información de la base de datos"""
@@ -127,67 +266,9 @@ def database_info():
                 404,
             )
 
-        # Información básica del archivo
-        db_file = Path(db_path)
-        file_size = db_file.stat().st_size
-
-        # Conectar a la base de datos
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-
-            # Información de SQLite
-            cursor.execute("SELECT sqlite_version()")
-            sqlite_version = cursor.fetchone()[0]
-
-            # Obtener lista de tablas
-            cursor.execute(
-                """
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                ORDER BY name
-            """
-            )
-            tables = [row[0] for row in cursor.fetchall()]
-
-            # Conteo de registros por tabla
-            table_counts = {}
-            for table in tables:
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    table_counts[table] = cursor.fetchone()[0]
-                except Exception as e:
-                    table_counts[table] = f"Error: {e}"
-
-            # Configuración PRAGMA
-            pragma_info = {}
-            pragmas = ["journal_mode", "synchronous", "foreign_keys", "cache_size"]
-            for pragma in pragmas:
-                try:
-                    cursor.execute(f"PRAGMA {pragma}")
-                    pragma_info[pragma] = cursor.fetchone()[0]
-                except:
-                    pragma_info[pragma] = "Error"
-
-        db_info = {
-            "success": True,
-            "database": {
-                "path": str(db_path),
-                "size_bytes": file_size,
-                "size_mb": round(file_size / 1024 / 1024, 2),
-                "sqlite_version": sqlite_version,
-                "created": datetime.fromtimestamp(db_file.stat().st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(db_file.stat().st_mtime).isoformat(),
-            },
-            "tables": {
-                "total": len(tables),
-                "list": tables,
-                "record_counts": table_counts,
-            },
-            "configuration": pragma_info,
-            "timestamp": datetime.now().isoformat(),
-        }
+        db_info = _get_database_info(str(db_path))
 
-        return jsonify(db_info)
+        return jsonify({**db_info, "timestamp": datetime.now().isoformat()})
 
     except Exception as e:
         logger.error(f"Error obteniendo info de BD: {e}")
@@ -284,23 +365,25 @@ def view_log(log_name):
             return jsonify({"success": False, "error": "Ruta de archivo inválida"}), 400
 
         # Parámetros de consulta
-        lines = int(request.args.get("lines", 100))
-        offset = int(request.args.get("offset", 0))
-        filter_level = request.args.get("level", "").upper()
-
-        # Leer archivo
+        args = request.args
+        lines = _int_arg(args, "lines", 100)
+        offset = _int_arg(args, "offset", 0, minv=0, maxv=100000)
+        filter_level = args.get("level", "").upper()
+
+        # Leer archivo línea por línea conservando solo la ventana final
+        # (lines + offset), así la memoria no crece con el tamaño del log
+        window = deque(maxlen=max(0, lines + offset))
+        total_lines = 0
         with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-            all_lines = f.readlines()
-
-        # Filtrar por nivel si se especifica
-        if filter_level:
-            all_lines = [line for line in all_lines if filter_level in line.upper()]
+            for line in f:
+                # Filtrar por nivel si se especifica
+                if filter_level and filter_level not in line.upper():
+                    continue
+                total_lines += 1
+                window.append(line)
 
         # Aplicar offset y límite
-        total_lines = len(all_lines)
-        start_idx = max(0, total_lines - lines - offset)
-        end_idx = total_lines - offset
-        selected_lines = all_lines[start_idx:end_idx]
+        selected_lines = list(window)[: len(window) - offset]
 
         return jsonify(
             {
@@ -358,6 +441,7 @@ def clear_cache():
     try:
         # Implementación específica del clear cache
         # Esto dependería del sistema de cache utilizado
+        _invalidate_database_info()
 
         logger.info("Cache cleared by admin request")
 
@@ -533,13 +617,58 @@ def view_config():
 # RUTAS DE MONITOREO
 # ==========================================
 
+# Último porcentaje de CPU medido por el hilo de muestreo
+_LATEST_CPU_PERCENT = None
+_cpu_sampler_lock = threading.Lock()
+_cpu_sampler_stop = threading.Event()
+_cpu_sampler_thread = None
+
+
+def _cpu_sampler():
+    """Medir el uso de CPU en segundo plano (una muestra por segundo)"""
+    global _LATEST_CPU_PERCENT
+    psutil.cpu_percent(interval=None)
+    while not _cpu_sampler_stop.wait(1):
+        _LATEST_CPU_PERCENT = psutil.cpu_percent(interval=None)
+
+
+def _ensure_cpu_sampler():
+    """Iniciar el hilo de muestreo de CPU si no está corriendo (p. ej. tras un fork)"""
+    global _cpu_sampler_thread
+    with _cpu_sampler_lock:
+        if _cpu_sampler_thread is None or not _cpu_sampler_thread.is_alive():
+            _cpu_sampler_stop.clear()
+            _cpu_sampler_thread = threading.Thread(
+                target=_cpu_sampler, name="ecplacas-cpu-sampler", daemon=True
+            )
+            _cpu_sampler_thread.start()
+
+
+def stop_cpu_sampler(timeout=None):
+    """Detener el hilo de muestreo de CPU; vuelve a iniciarse en la próxima request"""
+    global _cpu_sampler_thread, _LATEST_CPU_PERCENT
+    with _cpu_sampler_lock:
+        thread, _cpu_sampler_thread = _cpu_sampler_thread, None
+        _cpu_sampler_stop.set()
+    if thread is not None:
+        thread.join(timeout)
+    _LATEST_CPU_PERCENT = None
+
+
+def get_cpu_percent():
+    """Último uso de CPU medido por el hilo de muestreo (None hasta la primera)
+
+    psutil.cpu_percent(interval=None) mide desde la llamada anterior del mismo
+    hilo, por lo que solo el hilo de muestreo obtiene un valor con sentido.
+    """
+    _ensure_cpu_sampler()
+    return _LATEST_CPU_PERCENT
+
 
 @admin_bp.route("/monitoring/performance")
 def performance_metrics():
     """Métricas de performance del sistema"""
     try:
-        import time
-
         start_time = time.time()
 
         # Métricas básicas
@@ -550,50 +679,45 @@ def performance_metrics():
         }
 
         # Si psutil está disponible, agregar métricas detalladas
-        try:
-            import psutil
+        if psutil is not None:
+            process = _get_process()
 
-            process = psutil.Process()
+            # Lectura instantánea del muestreo en segundo plano; None mientras
+            # el hilo toma su primera muestra
+            cpu_percent = get_cpu_percent()
+
+            # Una sola lectura por recurso (cada llamada es un syscall)
+            cpu_freq = psutil.cpu_freq()
+            vm = psutil.virtual_memory()
+            du = psutil.disk_usage("/")
+            net_io = psutil.net_io_counters()
 
             metrics.update(
                 {
                     "cpu": {
-                        "percent": psutil.cpu_percent(interval=1),
+                        "percent": cpu_percent,
+                        "status": "measuring" if cpu_percent is None else "ok",
                         "count": psutil.cpu_count(),
-                        "frequency": (
-                            psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None
-                        ),
+                        "frequency": cpu_freq._asdict() if cpu_freq else None,
                     },
                     "memory": {
-                        "total_gb": round(
-                            psutil.virtual_memory().total / 1024 / 1024 / 1024, 2
-                        ),
-                        "available_gb": round(
-                            psutil.virtual_memory().available / 1024 / 1024 / 1024, 2
-                        ),
-                        "percent_used": psutil.virtual_memory().percent,
+                        "total_gb": round(vm.total / 1024 / 1024 / 1024, 2),
+                        "available_gb": round(vm.available / 1024 / 1024 / 1024, 2),
+                        "percent_used": vm.percent,
                         "process_mb": round(process.memory_info().rss / 1024 / 1024, 2),
                     },
                     "disk": {
-                        "total_gb": round(
-                            psutil.disk_usage("/").total / 1024 / 1024 / 1024, 2
-                        ),
-                        "free_gb": round(
-                            psutil.disk_usage("/").free / 1024 / 1024 / 1024, 2
-                        ),
-                        "percent_used": psutil.disk_usage("/").percent,
+                        "total_gb": round(du.total / 1024 / 1024 / 1024, 2),
+                        "free_gb": round(du.free / 1024 / 1024 / 1024, 2),
+                        "percent_used": du.percent,
                     },
                     "network": {
                         "connections": len(process.connections()),
-                        "io_counters": (
-                            psutil.net_io_counters()._asdict()
-                            if psutil.net_io_counters()
-                            else None
-                        ),
+                        "io_counters": net_io._asdict() if net_io else None,
                     },
                 }
             )
-        except ImportError:
+        else:
             metrics["note"] = "psutil no disponible - métricas limitadas"
 
         return jsonify(metrics)
@@ -13,13 +13,33 @@ Rutas adicionales de API que complementan app.py
 Estas rutas se integran con las principales del sistema
 """
 
+import hashlib
 import json
 import logging
+import os
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, current_app, g, jsonify, request
 from werkzeug.exceptions import BadRequest, NotFound
 
+from backend.app import PROVINCE_NAMES, CedulaValidator, PlateValidator, ojson
+from backend.routes.admin_routes import get_cpu_percent
+
+# Parser JSON rápido (opcional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Métricas del sistema (opcional)
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # Crear blueprint para rutas de API adicionales
 api_bp = Blueprint("api_additional", __name__)
 
@@ -30,17 +50,46 @@ logger = logging.getLogger("ecplacas.api")
 # ==========================================
 
 
+# Métodos cuyo cuerpo debe enviarse como JSON
+_JSON_BODY_METHODS = frozenset({"POST", "PUT"})
+
+# Health-checks consultados por monitores de uptime: no se registran en el log
+_NO_LOG_PATHS = frozenset({"/api/ping", "/api/time"})
+
+
+def _is_json_content_type(content_type: str) -> bool:
+    """Verificar si el Content-Type corresponde a JSON"""
+    return content_type.startswith("application/json")
+
+
+def _request_timestamp() -> str:
+    """Timestamp ISO de la request actual (calculado una vez por request)"""
+    timestamp = g.get("request_iso")
+    if timestamp is None:
+        g.request_dt = datetime.now()
+        timestamp = g.request_iso = g.request_dt.isoformat()
+    return timestamp
+
+
 @api_bp.before_request
 def before_api_request():
     """Middleware para todas las rutas de API"""
-    # Log de todas las requests API
-    logger.info(
-        f"API Request: {request.method} {request.path} from {request.remote_addr}"
-    )
+    g.request_dt = datetime.now()
+    g.request_iso = g.request_dt.isoformat()
+
+    # Los health-checks son GET sin cuerpo: no requieren log ni validación
+    if request.path in _NO_LOG_PATHS:
+        return None
+
+    # Log de todas las requests API (sin formatear si INFO está deshabilitado)
+    if logger.isEnabledFor(logging.INFO):
+        req = request._get_current_object()
+        logger.info("API Request: %s %s from %s", req.method, req.path, req.remote_addr)
 
     # Verificar Content-Type para requests POST/PUT
-    if request.method in ["POST", "PUT"] and request.content_type:
-        if not request.content_type.startswith("application/json"):
+    if request.method in _JSON_BODY_METHODS:
+        content_type = request.content_type
+        if content_type and not _is_json_content_type(content_type):
             return (
                 jsonify(
                     {
@@ -72,45 +121,139 @@ def after_api_request(response):
 # ==========================================
 
 
+# Contenido estático de /version y /features: se construye una sola vez
+# por proceso y cada request solo agrega los campos dinámicos
+VERSION_INFO = {
+    "success": True,
+    "version": "2.0.1",
+    "name": "ECPlacas 2.0 SRI COMPLETO",
+    "author": "Erick Costa",
+    "project": "Construcción de Software",
+    "theme": "Futurista - Azul Neon",
+    "release_date": "2024-12-15",
+    "features": {
+        "sri_completo": True,
+        "propietario_vehiculo": True,
+        "rubros_detallados": True,
+        "componentes_fiscales": True,
+        "historial_pagos": True,
+        "plan_iacv": True,
+        "analisis_consolidado": True,
+        "cache_inteligente": True,
+        "rate_limiting": True,
+        "logs_rotativos": True,
+    },
+    "apis_disponibles": {
+        "consulta_completa": "/api/consultar-vehiculo",
+        "estado_consulta": "/api/estado-consulta/<session_id>",
+        "resultado_completo": "/api/resultado/<session_id>",
+        "estadisticas": "/api/estadisticas",
+        "validar_placa": "/api/validar-placa",
+        "validar_cedula": "/api/validar-cedula",
+        "test_sri": "/api/test-sri-completo",
+    },
+}
+
+FEATURES_INFO = {
+    "success": True,
+    "sistema": "ECPlacas 2.0 SRI COMPLETO + PROPIETARIO",
+    "caracteristicas_principales": [
+        {
+            "categoria": "Consultas SRI",
+            "descripcion": "Consultas completas al Sistema de Rentas Internas",
+            "funcionalidades": [
+                "Información básica del vehículo",
+                "Rubros de deuda detallados",
+                "Componentes fiscales específicos",
+                "Historial completo de pagos",
+                "Plan IACV (Impuesto Ambiental)",
+                "Estados legales y prohibiciones",
+            ],
+        },
+        {
+            "categoria": "Propietario del Vehículo",
+            "descripcion": "Información del propietario actual",
+            "funcionalidades": [
+                "Nombre completo del propietario",
+                "Cédula de identidad",
+                "Múltiples fuentes de datos",
+                "Validación cruzada",
+            ],
+        },
+        {
+            "categoria": "Análisis Consolidado",
+            "descripcion": "Análisis inteligente de toda la información",
+            "funcionalidades": [
+                "Puntuación SRI (0-100)",
+                "Riesgo tributario",
+                "Estado legal consolidado",
+                "Recomendaciones tributarias",
+                "Estimación de valor",
+            ],
+        },
+        {
+            "categoria": "Performance",
+            "descripcion": "Optimizaciones para máximo rendimiento",
+            "funcionalidades": [
+                "Cache inteligente",
+                "Rate limiting",
+                "Pool de conexiones",
+                "Logs rotativos",
+                "Consultas asíncronas",
+            ],
+        },
+    ],
+    "tecnologias": {
+        "backend": "Flask + Python 3.8+",
+        "frontend": "HTML5 + CSS3 + JavaScript ES6+",
+        "base_datos": "SQLite con WAL mode",
+        "apis_externas": "SRI Ecuador + Propietarios",
+        "cache": "Memory-based con TTL",
+        "logs": "Rotating file handlers",
+    },
+}
+
+
+def _payload_etag(payload) -> str:
+    """ETag fuerte calculado sobre el contenido estático de un payload"""
+    body = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _etag_response(payload, etag: str):
+    """Responder 304 si el cliente ya tiene el ETag, o el payload con su ETag"""
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify({**payload, "timestamp": _request_timestamp()})
+    response.set_etag(etag)
+    return response
+
+
+FEATURES_ETAG = _payload_etag(FEATURES_INFO)
+
+
+@lru_cache(maxsize=8)
+def _get_version_payload(python_version: str, flask_version: str):
+    """Payload de versión y su ETag para los valores de configuración dados"""
+    payload = {
+        **VERSION_INFO,
+        "python_version": python_version,
+        "flask_version": flask_version,
+    }
+    return payload, _payload_etag(payload)
+
+
 @api_bp.route("/version", methods=["GET"])
 def get_version():
     """Obtener información de versión del sistema"""
     try:
-        version_info = {
-            "success": True,
-            "version": "2.0.1",
-            "name": "ECPlacas 2.0 SRI COMPLETO",
-            "author": "Erick Costa",
-            "project": "Construcción de Software",
-            "theme": "Futurista - Azul Neon",
-            "release_date": "2024-12-15",
-            "python_version": f"{current_app.config.get('PYTHON_VERSION', 'Unknown')}",
-            "flask_version": f"{current_app.config.get('FLASK_VERSION', 'Unknown')}",
-            "features": {
-                "sri_completo": True,
-                "propietario_vehiculo": True,
-                "rubros_detallados": True,
-                "componentes_fiscales": True,
-                "historial_pagos": True,
-                "plan_iacv": True,
-                "analisis_consolidado": True,
-                "cache_inteligente": True,
-                "rate_limiting": True,
-                "logs_rotativos": True,
-            },
-            "apis_disponibles": {
-                "consulta_completa": "/api/consultar-vehiculo",
-                "estado_consulta": "/api/estado-consulta/<session_id>",
-                "resultado_completo": "/api/resultado/<session_id>",
-                "estadisticas": "/api/estadisticas",
-                "validar_placa": "/api/validar-placa",
-                "validar_cedula": "/api/validar-cedula",
-                "test_sri": "/api/test-sri-completo",
-            },
-            "timestamp": datetime.now().isoformat(),
-        }
+        version_info, etag = _get_version_payload(
+            f"{current_app.config.get('PYTHON_VERSION', 'Unknown')}",
+            f"{current_app.config.get('FLASK_VERSION', 'Unknown')}",
+        )
 
-        return jsonify(version_info)
+        return _etag_response(version_info, etag)
 
     except Exception as e:
         logger.error(f"Error obteniendo versión: {e}")
@@ -121,67 +264,7 @@ def get_version():
 def get_features():
     """Obtener lista completa de características"""
     try:
-        features = {
-            "success": True,
-            "sistema": "ECPlacas 2.0 SRI COMPLETO + PROPIETARIO",
-            "caracteristicas_principales": [
-                {
-                    "categoria": "Consultas SRI",
-                    "descripcion": "Consultas completas al Sistema de Rentas Internas",
-                    "funcionalidades": [
-                        "Información básica del vehículo",
-                        "Rubros de deuda detallados",
-                        "Componentes fiscales específicos",
-                        "Historial completo de pagos",
-                        "Plan IACV (Impuesto Ambiental)",
-                        "Estados legales y prohibiciones",
-                    ],
-                },
-                {
-                    "categoria": "Propietario del Vehículo",
-                    "descripcion": "Información del propietario actual",
-                    "funcionalidades": [
-                        "Nombre completo del propietario",
-                        "Cédula de identidad",
-                        "Múltiples fuentes de datos",
-                        "Validación cruzada",
-                    ],
-                },
-                {
-                    "categoria": "Análisis Consolidado",
-                    "descripcion": "Análisis inteligente de toda la información",
-                    "funcionalidades": [
-                        "Puntuación SRI (0-100)",
-                        "Riesgo tributario",
-                        "Estado legal consolidado",
-                        "Recomendaciones tributarias",
-                        "Estimación de valor",
-                    ],
-                },
-                {
-                    "categoria": "Performance",
-                    "descripcion": "Optimizaciones para máximo rendimiento",
-                    "funcionalidades": [
-                        "Cache inteligente",
-                        "Rate limiting",
-                        "Pool de conexiones",
-                        "Logs rotativos",
-                        "Consultas asíncronas",
-                    ],
-                },
-            ],
-            "tecnologias": {
-                "backend": "Flask + Python 3.8+",
-                "frontend": "HTML5 + CSS3 + JavaScript ES6+",
-                "base_datos": "SQLite con WAL mode",
-                "apis_externas": "SRI Ecuador + Propietarios",
-                "cache": "Memory-based con TTL",
-                "logs": "Rotating file handlers",
-            },
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        return jsonify(features)
+        return _etag_response(FEATURES_INFO, FEATURES_ETAG)
 
     except Exception as e:
         logger.error(f"Error obteniendo características: {e}")
@@ -193,74 +276,102 @@ def get_features():
 # ==========================================
 
 
+# Cuerpo de /ping pre-serializado: solo el timestamp cambia por request
+_PING_PREFIX = (
+    b'{"message":"pong","server":"ECPlacas 2.0 SRI COMPLETO",'
+    b'"success":true,"timestamp":"'
+)
+_PING_SUFFIX = b'"}\n'
+
+
 @api_bp.route("/ping", methods=["GET"])
 def ping():
     """Endpoint simple de ping/pong"""
-    return jsonify(
-        {
-            "success": True,
-            "message": "pong",
-            "timestamp": datetime.now().isoformat(),
-            "server": "ECPlacas 2.0 SRI COMPLETO",
-        }
-    )
+    body = _PING_PREFIX + _request_timestamp().encode("ascii") + _PING_SUFFIX
+    return current_app.response_class(body, mimetype="application/json")
+
+
+# Zona horaria del servidor (Ecuador no aplica horario de verano)
+_TZ_STR = str(datetime.now().astimezone().tzinfo)
 
 
 @api_bp.route("/time", methods=["GET"])
 def get_server_time():
     """Obtener hora del servidor"""
-    now = datetime.now()
+    now = g.request_dt
     return jsonify(
         {
             "success": True,
-            "server_time": now.isoformat(),
+            "server_time": g.request_iso,
             "unix_timestamp": int(now.timestamp()),
-            "timezone": str(now.astimezone().tzinfo),
+            "timezone": _TZ_STR,
             "formatted": now.strftime("%Y-%m-%d %H:%M:%S"),
         }
     )
 
 
+def _build_endpoints_payload(app):
+    """Construir el listado agrupado de endpoints de la aplicación"""
+    # Tabla endpoint -> descripción, resuelta una vez por vista y no por regla
+    endpoint_docs = {
+        endpoint: (getattr(view, "__doc__", None) or "Sin descripción")
+        for endpoint, view in app.view_functions.items()
+    }
+    excluded_methods = {"HEAD", "OPTIONS"}
+
+    # Agrupar por prefijo en una sola pasada sobre el url_map
+    grouped = {"api": [], "admin": [], "frontend": []}
+    for rule in app.url_map.iter_rules():
+        if rule.endpoint == "static":
+            continue
+
+        path = str(rule)
+        if path.startswith("/api/"):
+            bucket = "api"
+        elif path.startswith("/admin/"):
+            bucket = "admin"
+        else:
+            bucket = "frontend"
+
+        grouped[bucket].append(
+            {
+                "endpoint": rule.endpoint,
+                "methods": sorted(rule.methods - excluded_methods),
+                "path": path,
+                "description": endpoint_docs.get(rule.endpoint, "Sin descripción"),
+            }
+        )
+
+    endpoints_por_categoria = {k: len(v) for k, v in grouped.items()}
+
+    return {
+        "success": True,
+        "total_endpoints": sum(endpoints_por_categoria.values()),
+        "endpoints_por_categoria": endpoints_por_categoria,
+        "endpoints": grouped,
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_endpoints_payload(app, rules_count):
+    """Listado de endpoints memoizado por aplicación y número de reglas
+
+    El url_map solo cambia al registrar rutas, por lo que el recorrido se
+    hace una vez por proceso y se invalida si cambia la cantidad de reglas.
+    Retorna el payload junto con su ETag.
+    """
+    payload = _build_endpoints_payload(app)
+    return payload, _payload_etag(payload)
+
+
 @api_bp.route("/endpoints", methods=["GET"])
 def list_endpoints():
     """Listar todos los endpoints disponibles"""
     try:
-        from flask import current_app
-
-        endpoints = []
-        for rule in current_app.url_map.iter_rules():
-            if rule.endpoint != "static":
-                endpoints.append(
-                    {
-                        "endpoint": rule.endpoint,
-                        "methods": sorted(rule.methods - {"HEAD", "OPTIONS"}),
-                        "path": str(rule),
-                        "description": getattr(
-                            current_app.view_functions.get(rule.endpoint),
-                            "__doc__",
-                            "Sin descripción",
-                        ),
-                    }
-                )
+        app = current_app._get_current_object()
+        payload, etag = _get_endpoints_payload(app, len(app.url_map._rules))
 
-        # Agrupar por prefijo
-        grouped = {
-            "api": [e for e in endpoints if e["path"].startswith("/api/")],
-            "admin": [e for e in endpoints if e["path"].startswith("/admin/")],
-            "frontend": [
-                e for e in endpoints if not e["path"].startswith(("/api/", "/admin/"))
-            ],
-        }
-
-        return jsonify(
-            {
-                "success": True,
-                "total_endpoints": len(endpoints),
-                "endpoints_por_categoria": {k: len(v) for k, v in grouped.items()},
-                "endpoints": grouped,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+        return _etag_response(payload, etag)
 
     except Exception as e:
         logger.error(f"Error listando endpoints: {e}")
@@ -272,17 +383,91 @@ def list_endpoints():
 # ==========================================
 
 
+_TRUTHY_ARGS = frozenset({"1", "true", "si", "yes"})
+_CEDULA_ALGORITHM = "Validación oficial Ecuador"
+
+# Tamaño máximo del cuerpo de /validate/batch (50 placas + 50 cédulas sobran)
+_MAX_BATCH_BYTES = 64_000
+
+
+def _parse_json_body(raw: bytes):
+    """Parsear el cuerpo JSON de la request (orjson si está disponible)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Error genérico por elemento del lote (el detalle solo va al log)
+_ITEM_ERROR = "Entrada inválida"
+
+
+def _validate_placa(placa):
+    """Validar una placa del lote
+
+    Retorna (original, normalizada, fue_modificada, es_valida, error).
+    """
+    try:
+        original, normalizada, modificada = PlateValidator.normalize_plate(placa)
+        es_valida = PlateValidator.validate_plate_format(normalizada)
+    except Exception as e:
+        logger.debug("Placa inválida en lote %r: %s", placa, e)
+        return None, None, False, False, _ITEM_ERROR
+
+    return original, normalizada, modificada, es_valida, None
+
+
+def _validate_cedula(cedula):
+    """Validar una cédula del lote
+
+    Retorna (es_valida, provincia, error).
+    """
+    try:
+        es_valida = CedulaValidator.validate_ecuadorian_id(cedula)
+    except Exception as e:
+        logger.debug("Cédula inválida en lote %r: %s", cedula, e)
+        return False, None, _ITEM_ERROR
+
+    provincia_info = None
+    if es_valida:
+        # Una cédula válida tiene un código de provincia existente
+        codigo_provincia = cedula[:2]
+        provincia_info = {
+            "codigo": codigo_provincia,
+            "nombre": PROVINCE_NAMES[int(codigo_provincia)] or "Desconocida",
+        }
+
+    return es_valida, provincia_info, None
+
+
 @api_bp.route("/validate/batch", methods=["POST"])
 def validate_batch():
     """Validar múltiples placas y cédulas en lote"""
     try:
+        # Rechazar cuerpos grandes antes de leerlos y parsearlos
+        content_length = request.content_length
+        if content_length is not None and content_length > _MAX_BATCH_BYTES:
+            return ojson({"success": False, "error": "Payload demasiado grande"}, 413)
+
         if not request.is_json:
             return (
                 jsonify({"success": False, "error": "Contenido debe ser JSON válido"}),
                 400,
             )
 
-        data = request.get_json()
+        raw = request.get_data(cache=False)
+        if len(raw) > _MAX_BATCH_BYTES:
+            return ojson({"success": False, "error": "Payload demasiado grande"}, 413)
+
+        try:
+            data = _parse_json_body(raw)
+        except ValueError:
+            data = None
+
+        if not isinstance(data, dict):
+            return ojson(
+                {"success": False, "error": "Contenido debe ser JSON válido"}, 400
+            )
+
         placas = data.get("placas", [])
         cedulas = data.get("cedulas", [])
 
@@ -297,71 +482,105 @@ def validate_batch():
                 400,
             )
 
-        # Importar validadores (asumiendo que están en app.py)
-        from backend.app import CedulaValidator, PlateValidator
+        # Modo compacto: columnas paralelas en lugar de un dict por elemento
+        compact = request.args.get("compact", "").lower() in _TRUTHY_ARGS
+
+        if compact:
+            placas_out = {
+                "entrada": [],
+                "original": [],
+                "normalizada": [],
+                "fue_modificada": [],
+                "es_valida": [],
+            }
+            cedulas_out = {"entrada": [], "es_valida": [], "provincia": []}
+            errores = {"placas": {}, "cedulas": {}}
+        else:
+            placas_out = {}
+            cedulas_out = {}
 
-        resultados = {"placas": {}, "cedulas": {}}
+        placas_validas = 0
+        cedulas_validas = 0
 
         # Validar placas
-        for placa in placas[:50]:  # Límite de 50 por seguridad
-            try:
-                original, normalizada, modificada = PlateValidator.normalize_plate(
-                    placa
-                )
-                es_valida = PlateValidator.validate_plate_format(normalizada)
-
-                resultados["placas"][placa] = {
-                    "original": original,
-                    "normalizada": normalizada,
-                    "fue_modificada": modificada,
-                    "es_valida": es_valida,
-                    "formato": (
-                        "Ecuatoriana estándar" if es_valida else "Formato inválido"
-                    ),
-                }
-            except Exception as e:
-                resultados["placas"][placa] = {"error": str(e), "es_valida": False}
+        # Entradas repetidas se validan una sola vez (se conserva el orden)
+        for placa in dict.fromkeys(placas[:50]):  # Límite de 50 por seguridad
+            original, normalizada, modificada, es_valida, error = _validate_placa(placa)
+
+            if es_valida:
+                placas_validas += 1
+
+            if compact:
+                placas_out["entrada"].append(placa)
+                placas_out["original"].append(original)
+                placas_out["normalizada"].append(normalizada)
+                placas_out["fue_modificada"].append(modificada)
+                placas_out["es_valida"].append(es_valida)
+                if error is not None:
+                    errores["placas"][placa] = error
+            else:
+                if error is not None:
+                    placas_out[placa] = {"error": error, "es_valida": False}
+                else:
+                    placas_out[placa] = {
+                        "original": original,
+                        "normalizada": normalizada,
+                        "fue_modificada": modificada,
+                        "es_valida": es_valida,
+                        "formato": (
+                            "Ecuatoriana estándar" if es_valida else "Formato inválido"
+                        ),
+                    }
 
         # Validar cédulas
-        for cedula in cedulas[:50]:  # Límite de 50 por seguridad
-            try:
-                es_valida = CedulaValidator.validate_ecuadorian_id(cedula)
-                provincia_info = None
-
-                if es_valida and len(cedula) >= 2:
-                    from backend.app import PROVINCE_CODES
-
-                    codigo_provincia = cedula[:2]
-                    provincia_info = {
-                        "codigo": codigo_provincia,
-                        "nombre": PROVINCE_CODES.get(codigo_provincia, "Desconocida"),
+        for cedula in dict.fromkeys(cedulas[:50]):  # Límite de 50 por seguridad
+            es_valida, provincia_info, error = _validate_cedula(cedula)
+
+            if es_valida:
+                cedulas_validas += 1
+
+            if compact:
+                cedulas_out["entrada"].append(cedula)
+                cedulas_out["es_valida"].append(es_valida)
+                cedulas_out["provincia"].append(
+                    provincia_info["nombre"] if provincia_info else None
+                )
+                if error is not None:
+                    errores["cedulas"][cedula] = error
+            else:
+                if error is not None:
+                    cedulas_out[cedula] = {"error": error, "es_valida": False}
+                else:
+                    cedulas_out[cedula] = {
+                        "es_valida": es_valida,
+                        "provincia": provincia_info,
+                        "algoritmo": _CEDULA_ALGORITHM,
                     }
 
-                resultados["cedulas"][cedula] = {
-                    "es_valida": es_valida,
-                    "provincia": provincia_info,
-                    "algoritmo": "Validación oficial Ecuador",
-                }
-            except Exception as e:
-                resultados["cedulas"][cedula] = {"error": str(e), "es_valida": False}
+        if compact:
+            placas_procesadas = len(placas_out["entrada"])
+            cedulas_procesadas = len(cedulas_out["entrada"])
+        else:
+            placas_procesadas = len(placas_out)
+            cedulas_procesadas = len(cedulas_out)
 
-        return jsonify(
-            {
-                "success": True,
-                "resultados": resultados,
-                "resumen": {
-                    "placas_procesadas": len(resultados["placas"]),
-                    "cedulas_procesadas": len(resultados["cedulas"]),
-                    "placas_validas": sum(
-                        1 for r in resultados["placas"].values() if r.get("es_valida")
-                    ),
-                    "cedulas_validas": sum(
-                        1 for r in resultados["cedulas"].values() if r.get("es_valida")
-                    ),
-                },
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+        response = {
+            "success": True,
+            "resultados": {"placas": placas_out, "cedulas": cedulas_out},
+            "resumen": {
+                "placas_procesadas": placas_procesadas,
+                "cedulas_procesadas": cedulas_procesadas,
+                "placas_validas": placas_validas,
+                "cedulas_validas": cedulas_validas,
+            },
+            "timestamp": _request_timestamp(),
+        }
+        if compact:
+            response["algoritmo_cedulas"] = _CEDULA_ALGORITHM
+            if errores["placas"] or errores["cedulas"]:
+                response["errores"] = errores
+
+        return ojson(response)
 
     except Exception as e:
         logger.error(f"Error en validación por lotes: {e}")
@@ -398,7 +617,7 @@ def debug_config():
             "database_path": current_app.config.get("DATABASE_PATH"),
             "cache_enabled": current_app.config.get("CACHE_ENABLED"),
             "rate_limit_enabled": current_app.config.get("RATELIMIT_ENABLED"),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _request_timestamp(),
         }
 
         return jsonify(config_info)
@@ -413,79 +632,90 @@ def debug_config():
 # ==========================================
 
 
+def _json_prefix(static_fields):
+    """Serializar los campos fijos de una respuesta sin la llave de cierre"""
+    serialized = json.dumps(static_fields, ensure_ascii=False, separators=(",", ":"))
+    return serialized[:-1].encode("utf-8")
+
+
+def _error_response(prefix, status, **fields):
+    """Completar una respuesta de error pre-serializada con sus campos dinámicos"""
+    dynamic = json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+    body = prefix + b"," + dynamic[1:].encode("utf-8") + b"\n"
+    return current_app.response_class(body, status=status, mimetype="application/json")
+
+
+# Mensajes fijos por código: no se expone la descripción interna del error
+_ERR_MSG = {
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+# Porción fija de las respuestas de error, serializada una vez al importar
+_ERR_400_PREFIX = _json_prefix(
+    {"success": False, "error": "Solicitud inválida", "message": _ERR_MSG[400]}
+)
+_ERR_404_PREFIX = _json_prefix(
+    {
+        "success": False,
+        "error": "Endpoint no encontrado",
+        "message": _ERR_MSG[404],
+        "available_endpoints": "/api/endpoints",
+    }
+)
+_ERR_405_PREFIX = _json_prefix(
+    {"success": False, "error": "Método no permitido", "message": _ERR_MSG[405]}
+)
+_ERR_500_PREFIX = _json_prefix(
+    {
+        "success": False,
+        "error": "Error interno del servidor",
+        "message": _ERR_MSG[500],
+        "support": "Contacte al desarrollador: Erick Costa",
+    }
+)
+
+
 @api_bp.errorhandler(400)
 def bad_request(error):
     """Manejo de errores 400"""
-    return (
-        jsonify(
-            {
-                "success": False,
-                "error": "Solicitud inválida",
-                "message": (
-                    str(error.description)
-                    if hasattr(error, "description")
-                    else "Bad Request"
-                ),
-                "timestamp": datetime.now().isoformat(),
-            }
-        ),
-        400,
-    )
+    return _error_response(_ERR_400_PREFIX, 400, timestamp=_request_timestamp())
 
 
 @api_bp.errorhandler(404)
 def not_found(error):
     """Manejo de errores 404"""
-    return (
-        jsonify(
-            {
-                "success": False,
-                "error": "Endpoint no encontrado",
-                "path": request.path,
-                "method": request.method,
-                "available_endpoints": "/api/endpoints",
-                "timestamp": datetime.now().isoformat(),
-            }
-        ),
+    return _error_response(
+        _ERR_404_PREFIX,
         404,
+        path=request.path,
+        method=request.method,
+        timestamp=_request_timestamp(),
     )
 
 
 @api_bp.errorhandler(405)
 def method_not_allowed(error):
     """Manejo de errores 405"""
-    return (
-        jsonify(
-            {
-                "success": False,
-                "error": "Método no permitido",
-                "method": request.method,
-                "path": request.path,
-                "allowed_methods": (
-                    error.valid_methods if hasattr(error, "valid_methods") else []
-                ),
-                "timestamp": datetime.now().isoformat(),
-            }
-        ),
+    return _error_response(
+        _ERR_405_PREFIX,
         405,
+        method=request.method,
+        path=request.path,
+        allowed_methods=(
+            list(error.valid_methods) if getattr(error, "valid_methods", None) else []
+        ),
+        timestamp=_request_timestamp(),
     )
 
 
 @api_bp.errorhandler(500)
 def internal_error(error):
     """Manejo de errores 500"""
-    logger.error(f"Error interno en API: {error}")
-    return (
-        jsonify(
-            {
-                "success": False,
-                "error": "Error interno del servidor",
-                "timestamp": datetime.now().isoformat(),
-                "support": "Contacte al desarrollador: Erick Costa",
-            }
-        ),
-        500,
-    )
+    logger.error("Error interno en API: %s", error)
+    return _error_response(_ERR_500_PREFIX, 500, timestamp=_request_timestamp())
 
 
 # ==========================================
@@ -493,50 +723,95 @@ def internal_error(error):
 # ==========================================
 
 
+@lru_cache(maxsize=1)
+def _get_boot_time() -> float:
+    """Hora de arranque del sistema (constante mientras no se reinicie)"""
+    return psutil.boot_time()
+
+
+def _get_process():
+    """Handle compartido del proceso actual; se recrea tras un fork (otro pid)"""
+    return _process_for_pid(os.getpid())
+
+
+@lru_cache(maxsize=1)
+def _process_for_pid(pid: int):
+    """Handle del proceso pid, con la medición de CPU ya iniciada"""
+    process = psutil.Process(pid)
+    # La primera llamada a cpu_percent siempre retorna 0.0: inicializar aquí
+    process.cpu_percent(interval=None)
+    return process
+
+
+# Snapshot de recursos compartido entre requests de monitoreo
+_MONITORING_TTL = 2.0
+_monitoring_cache = {"t": 0.0, "data": None}
+_monitoring_lock = threading.Lock()
+
+
+def _collect_monitoring_snapshot():
+    """Tomar una lectura de memoria, CPU, disco y proceso"""
+    # Una sola lectura por recurso (cada llamada es un syscall)
+    vm = psutil.virtual_memory()
+    du = psutil.disk_usage("/")
+    process = _get_process()
+
+    return {
+        "memory": {
+            "total": vm.total,
+            "available": vm.available,
+            "percent": vm.percent,
+        },
+        # Lectura del hilo de muestreo: cpu_percent(interval=None) mide desde
+        # la llamada anterior del mismo hilo, que aquí sería cualquier request
+        "cpu_percent": get_cpu_percent(),
+        "disk": {
+            "total": du.total,
+            "free": du.free,
+            "percent": du.percent,
+        },
+        "process": {
+            "pid": os.getpid(),
+            "memory_mb": process.memory_info().rss / 1024 / 1024,
+            "cpu_percent": process.cpu_percent(interval=None),
+        },
+    }
+
+
 @api_bp.route("/monitoring/status", methods=["GET"])
 def monitoring_status():
     """Estado del sistema para monitoreo"""
-    try:
-        import os
+    if psutil is None:
+        # Si psutil no está disponible, retornar información básica
+        return jsonify(
+            {
+                "success": True,
+                "status": "healthy",
+                "message": "Monitoreo básico (psutil no disponible)",
+                "timestamp": _request_timestamp(),
+            }
+        )
 
-        import psutil
+    try:
+        now = time.monotonic()
+        with _monitoring_lock:
+            snapshot = _monitoring_cache["data"]
+            if snapshot is None or now - _monitoring_cache["t"] >= _MONITORING_TTL:
+                snapshot = _collect_monitoring_snapshot()
+                _monitoring_cache["data"] = snapshot
+                _monitoring_cache["t"] = now
 
         # Información básica del sistema
         status = {
             "success": True,
             "status": "healthy",
-            "uptime": time.time() - psutil.boot_time(),
-            "memory": {
-                "total": psutil.virtual_memory().total,
-                "available": psutil.virtual_memory().available,
-                "percent": psutil.virtual_memory().percent,
-            },
-            "cpu_percent": psutil.cpu_percent(interval=1),
-            "disk": {
-                "total": psutil.disk_usage("/").total,
-                "free": psutil.disk_usage("/").free,
-                "percent": psutil.disk_usage("/").percent,
-            },
-            "process": {
-                "pid": os.getpid(),
-                "memory_mb": psutil.Process().memory_info().rss / 1024 / 1024,
-                "cpu_percent": psutil.Process().cpu_percent(),
-            },
-            "timestamp": datetime.now().isoformat(),
+            "uptime": time.time() - _get_boot_time(),
+            **snapshot,
+            "timestamp": _request_timestamp(),
         }
 
         return jsonify(status)
 
-    except ImportError:
-        # Si psutil no está disponible, retornar información básica
-        return jsonify(
-            {
-                "success": True,
-                "status": "healthy",
-                "message": "Monitoreo básico (psutil no disponible)",
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
     except Exception as e:
         logger.error(f"Error en monitoreo: {e}")
         return (
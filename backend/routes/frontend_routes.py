@@ -13,15 +13,36 @@ Rutas que complementan las del app.py para servir archivos estáticos
 y manejar el frontend de manera optimizada
 """
 
+import gzip
+import hashlib
+import itertools
+import json
 import logging
 import mimetypes
 import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-from flask import Blueprint, abort, current_app, request, send_file, send_from_directory
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    request,
+    send_from_directory,
+)
 from werkzeug.exceptions import NotFound
+from werkzeug.http import is_resource_modified
+from werkzeug.wsgi import wrap_file
 
-# Crear blueprint para rutas de frontend
+__all__ = ["frontend_bp"]
+
+# Crear blueprint para rutas de frontend (única definición del proceso)
 frontend_bp = Blueprint("frontend", __name__)
 
 logger = logging.getLogger("ecplacas.frontend")
@@ -33,12 +54,18 @@ logger = logging.getLogger("ecplacas.frontend")
 
 def get_frontend_path():
     """Obtener path del directorio frontend"""
+    return _resolve_frontend_path(current_app.root_path)
+
+
+@lru_cache(maxsize=8)
+def _resolve_frontend_path(root_path):
+    """Buscar el directorio frontend una sola vez por root_path de la app"""
     # Buscar en varios lugares posibles
     possible_paths = [
-        Path(current_app.root_path).parent / "frontend",  # ../frontend desde backend
-        Path(current_app.root_path) / "frontend",  # ./frontend desde raíz
-        Path(current_app.root_path) / "static",  # ./static como fallback
-        Path(current_app.root_path) / ".." / ".." / "frontend",  # ../../frontend
+        Path(root_path).parent / "frontend",  # ../frontend desde backend
+        Path(root_path) / "frontend",  # ./frontend desde raíz
+        Path(root_path) / "static",  # ./static como fallback
+        Path(root_path) / ".." / ".." / "frontend",  # ../../frontend
     ]
 
     for path in possible_paths:
@@ -66,6 +93,360 @@ def get_static_path():
     return static_paths[0]
 
 
+# ==========================================
+# ÍNDICE DE ARCHIVOS ESTÁTICOS
+# ==========================================
+
+# Directorios candidatos de cada familia de rutas, en orden de precedencia,
+# como prefijos relativos al directorio frontend
+_CSS_PREFIXES = ("css/", "assets/css/", "")
+_JS_PREFIXES = ("js/", "assets/js/", "")
+_IMG_PREFIXES = ("img/", "images/", "assets/img/", "assets/images/", "")
+_ASSETS_PREFIXES = ("assets/", "")
+_FAVICON_PREFIXES = ("", "img/", "assets/img/")
+_ROOT_PREFIXES = ("",)
+
+# Prefijos de URL de archivos estáticos (sin fallback SPA)
+_STATIC_URL_PREFIXES = ("/css/", "/js/", "/img/", "/assets/")
+
+# Extensión -> (MIME type, Cache-Control) de los archivos estáticos conocidos
+_CACHE_DAY = "public, max-age=86400"  # 24 horas
+_CACHE_WEEK = "public, max-age=604800"  # 7 días
+_CACHE_HOUR = "public, max-age=3600"
+_NO_CACHE = "no-cache"
+_EXT_TABLE = {
+    ".css": ("text/css", _CACHE_DAY),
+    ".js": ("application/javascript", _CACHE_DAY),
+    ".png": ("image/png", _CACHE_WEEK),
+    ".jpg": ("image/jpeg", _CACHE_WEEK),
+    ".jpeg": ("image/jpeg", _CACHE_WEEK),
+    ".gif": ("image/gif", _CACHE_WEEK),
+    ".ico": ("image/x-icon", _CACHE_WEEK),
+    ".svg": ("image/svg+xml", _CACHE_WEEK),
+    ".webp": ("image/webp", _CACHE_WEEK),
+    ".json": ("application/json", _CACHE_HOUR),
+    ".html": ("text/html", _CACHE_HOUR),
+    ".woff": ("font/woff", _CACHE_HOUR),
+    ".woff2": ("font/woff2", _CACHE_HOUR),
+}
+
+
+@lru_cache(maxsize=1024)
+def _meta(ext):
+    """Resolver (MIME type, Cache-Control) de una extensión una sola vez"""
+    if ext in _EXT_TABLE:
+        return _EXT_TABLE[ext]
+    mimetype, _ = mimetypes.guess_type("archivo" + ext)
+    return mimetype or "application/octet-stream", _CACHE_HOUR
+
+
+@dataclass(frozen=True)
+class StaticFile:
+    """Archivo indexado del frontend con sus validadores HTTP"""
+
+    path: Path
+    size: int
+    etag: str
+    last_modified: datetime
+
+
+def _static_file(path, st):
+    """Crear la entrada del índice a partir del stat del archivo"""
+    mtime = int(st.st_mtime)
+    return StaticFile(
+        path=Path(path),
+        size=st.st_size,
+        etag=f"{mtime:x}-{st.st_size:x}",
+        last_modified=datetime.fromtimestamp(mtime, timezone.utc),
+    )
+
+
+# Índice en memoria del frontend: ruta relativa -> StaticFile. Se reconstruye
+# cada _STATIC_INDEX_TTL segundos (o antes si un archivo no coincide con su
+# entrada) para que un despliegue no sirva tamaños ni ETags viejos
+_STATIC_INDEX_TTL = 30.0
+_static_index = None
+_static_index_expires = 0.0
+_static_counts = None
+# Tablas planas por familia de rutas: prefijos -> {filename: StaticFile}
+_family_tables = {}
+_static_index_lock = threading.Lock()
+
+
+def _build_static_index(root):
+    """Recorrer el frontend con os.scandir y mapear rutas relativas a archivos"""
+    index = {}
+    pending = [("", os.fspath(root))]
+
+    while pending:
+        prefix, directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((relative + "/", entry.path))
+                    elif entry.is_file():
+                        index[relative] = _static_file(entry.path, entry.stat())
+        except OSError as e:
+            logger.warning(f"No se pudo indexar {directory}: {e}")
+
+    return index
+
+
+def get_static_index():
+    """Obtener el índice de archivos estáticos (se construye en el primer uso)"""
+    global _static_index, _static_index_expires, _static_counts
+    index = _static_index
+    if index is None or time.monotonic() >= _static_index_expires:
+        with _static_index_lock:
+            if _static_index is None or time.monotonic() >= _static_index_expires:
+                first_build = _static_index is None
+                _static_index = _build_static_index(get_frontend_path())
+                _static_index_expires = time.monotonic() + _STATIC_INDEX_TTL
+                _static_counts = None
+                _family_tables.clear()
+                if first_build:
+                    logger.info(f"Índice estático: {len(_static_index)} archivos")
+            index = _static_index
+    return index
+
+
+def _expire_static_index():
+    """Marcar el índice como vencido: se reconstruye en la próxima consulta"""
+    global _static_index_expires
+    _static_index_expires = 0.0
+
+
+def _count_files(index, prefix, suffix=""):
+    """Contar archivos directos de un directorio del índice"""
+    start = len(prefix)
+    return sum(
+        1
+        for relative in index
+        if relative.startswith(prefix)
+        and "/" not in relative[start:]
+        and relative.endswith(suffix)
+    )
+
+
+def get_static_counts():
+    """Conteo de archivos estáticos para el healthcheck, calculado por índice"""
+    global _static_counts
+    index = get_static_index()
+    counts = _static_counts
+    if counts is None:
+        counts = {
+            "css": _count_files(index, "css/", ".css"),
+            "js": _count_files(index, "js/", ".js"),
+            "images": _count_files(index, "img/"),
+        }
+        with _static_index_lock:
+            if _static_index is index:
+                _static_counts = counts
+    return counts
+
+
+def invalidate_static_index():
+    """Descartar el índice para que se reconstruya en la próxima request"""
+    global _static_index, _static_counts
+    with _static_index_lock:
+        _static_index = None
+        _static_counts = None
+        _family_tables.clear()
+        _resolve_frontend_path.cache_clear()
+    _clear_body_cache()
+
+
+def _get_family_table(prefixes):
+    """Tabla {filename: StaticFile} de una familia de rutas, ya resuelta
+
+    Se recorren los directorios candidatos de menor a mayor precedencia para
+    que el primero de la lista gane, igual que al probarlos en orden.
+    """
+    index = get_static_index()
+    table = _family_tables.get(prefixes)
+    if table is None:
+        table = {}
+        for prefix in reversed(prefixes):
+            start = len(prefix)
+            for relative, static_file in index.items():
+                if relative.startswith(prefix):
+                    table[relative[start:]] = static_file
+        with _static_index_lock:
+            if _static_index is index:
+                _family_tables[prefixes] = table
+    return table
+
+
+def find_static_file(filename, prefixes):
+    """Buscar un archivo de una familia de rutas con una sola consulta
+
+    Solo se sirven rutas presentes en el índice, por lo que segmentos como
+    '..' nunca resuelven fuera del frontend.
+    """
+    # Rechazar traversal antes de consultar el índice
+    if filename.startswith("/") or ".." in filename.split("/"):
+        return None
+
+    return _get_family_table(prefixes).get(filename)
+
+
+# Cuerpos de CSS/JS/imágenes pequeños en memoria, LRU acotado por entradas y bytes.
+# La clave es la entrada del índice, así que un archivo modificado (nuevo
+# ETag tras refrescar el índice) nunca reutiliza un cuerpo viejo
+_BODY_CACHE_MAX_ENTRIES = 128
+_BODY_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_BODY_CACHE_MAX_FILE = 64 * 1024
+# El index.html de la SPA se sirve en cada fallback, así que se admite mayor
+_SPA_INDEX_MAX_FILE = 512 * 1024
+_COMPRESSIBLE = frozenset({".css", ".js", ".svg", ".json", ".txt", ".html", ".map"})
+_body_cache = OrderedDict()
+_body_cache_bytes = 0
+_body_cache_lock = threading.Lock()
+
+
+def _body_cache_get(key):
+    """Leer una entrada del LRU marcándola como usada recientemente"""
+    with _body_cache_lock:
+        body = _body_cache.get(key)
+        if body is not None:
+            _body_cache.move_to_end(key)
+        return body
+
+
+def _body_cache_put(key, body):
+    """Guardar una entrada en el LRU expulsando las más antiguas"""
+    global _body_cache_bytes
+    with _body_cache_lock:
+        if key in _body_cache:
+            return
+        _body_cache[key] = body
+        _body_cache_bytes += len(body)
+        while (
+            len(_body_cache) > _BODY_CACHE_MAX_ENTRIES
+            or _body_cache_bytes > _BODY_CACHE_MAX_BYTES
+        ):
+            _, evicted = _body_cache.popitem(last=False)
+            _body_cache_bytes -= len(evicted)
+
+
+def _cached_body(static_file):
+    """Obtener el contenido de un archivo pequeño desde el LRU en memoria"""
+    body = _body_cache_get(static_file)
+    if body is None:
+        with open(static_file.path, "rb") as f:
+            body = f.read()
+        if len(body) != static_file.size:
+            # El archivo cambió desde que se indexó: no asociarlo a la entrada vieja
+            _expire_static_index()
+            return body
+        _body_cache_put(static_file, body)
+    return body
+
+
+def _cached_gzip(static_file):
+    """Obtener la variante gzip de un archivo pequeño (b"" si no reduce tamaño)"""
+    key = (static_file, "gzip")
+    body = _body_cache_get(key)
+    if body is None:
+        raw = _cached_body(static_file)
+        if len(raw) != static_file.size:
+            # Archivo cambiado desde que se indexó: sin variante gzip bajo el
+            # ETag viejo (la respuesta sale sin comprimir)
+            return b""
+        body = gzip.compress(raw, compresslevel=6, mtime=0)
+        if len(body) >= len(raw):
+            body = b""
+        _body_cache_put(key, body)
+    return body
+
+
+def _clear_body_cache():
+    """Vaciar el LRU de cuerpos en memoria"""
+    global _body_cache_bytes
+    with _body_cache_lock:
+        _body_cache.clear()
+        _body_cache_bytes = 0
+
+
+def _sendfile(
+    static_file,
+    mimetype,
+    cache_control,
+    in_memory=False,
+    memory_limit=_BODY_CACHE_MAX_FILE,
+):
+    """Enviar un archivo estático dejando la copia del cuerpo al servidor WSGI
+
+    Responde 304 si el cliente ya tiene la versión indexada y a HEAD solo con
+    cabeceras. Con in_memory los archivos de hasta memory_limit bytes se
+    sirven desde el LRU de cuerpos, comprimidos con gzip si el cliente lo
+    acepta. El resto se envía con wsgi.file_wrapper (gunicorn y uWSGI usan
+    sendfile(2)) o con el FileWrapper de Werkzeug, igual que send_file.
+    Range/If-Range se resuelven con make_conditional de Werkzeug.
+    """
+    in_memory = in_memory and static_file.size <= memory_limit
+    compressible = in_memory and static_file.path.suffix.lower() in _COMPRESSIBLE
+
+    # La variante gzip lleva su propio ETag para no confundirla con la original
+    body = None
+    etag = static_file.etag
+    if compressible and "gzip" in request.accept_encodings:
+        if request.method == "HEAD":
+            # HEAD no lee ni comprime: solo usa la variante gzip ya cacheada
+            body = _body_cache_get((static_file, "gzip")) or None
+        else:
+            body = _cached_gzip(static_file) or None
+        if body is not None:
+            etag += "-gz"
+
+    if not is_resource_modified(
+        request.environ, etag=etag, last_modified=static_file.last_modified
+    ):
+        response = Response(status=304)
+    elif request.method == "HEAD":
+        # Solo cabeceras: la longitud sale del índice, sin abrir el archivo
+        response = Response(mimetype=mimetype)
+        response.content_length = static_file.size if body is None else len(body)
+        if body is not None:
+            response.content_encoding = "gzip"
+    elif body is not None:
+        response = Response(body, mimetype=mimetype)
+        response.content_encoding = "gzip"
+    elif in_memory:
+        response = Response(_cached_body(static_file), mimetype=mimetype)
+    else:
+        f = open(static_file.path, "rb")
+        response = Response(
+            wrap_file(request.environ, f, 65536),
+            mimetype=mimetype,
+            direct_passthrough=True,
+        )
+        st = os.fstat(f.fileno())
+        # La longitud sale del archivo abierto, no del índice
+        response.content_length = st.st_size
+        if _static_file(static_file.path, st) != static_file:
+            _expire_static_index()
+
+    if compressible:
+        response.vary.add("Accept-Encoding")
+    response.set_etag(etag)
+    response.last_modified = static_file.last_modified
+    response.headers["Cache-Control"] = cache_control
+
+    if response.status_code == 200 and request.method == "GET":
+        try:
+            response.make_conditional(
+                request, accept_ranges=True, complete_length=response.content_length
+            )
+        except Exception:
+            # Rango no satisfacible u otro error: liberar el archivo abierto
+            response.close()
+            raise
+    return response
+
+
 # ==========================================
 # MIDDLEWARE
 # ==========================================
@@ -75,7 +456,7 @@ def get_static_path():
 def before_frontend_request():
     """Middleware para requests de frontend"""
     # Log solo para requests importantes
-    if not request.path.startswith(("/css/", "/js/", "/img/", "/assets/")):
+    if not request.path.startswith(_STATIC_URL_PREFIXES):
         logger.info(
             f"Frontend: {request.method} {request.path} from {request.remote_addr}"
         )
@@ -84,13 +465,16 @@ def before_frontend_request():
 @frontend_bp.after_request
 def after_frontend_request(response):
     """Middleware de respuesta para frontend"""
-    # Headers de cache optimizados según tipo de archivo
-    if request.path.endswith((".css", ".js")):
-        response.headers["Cache-Control"] = "public, max-age=86400"  # 24 horas
-    elif request.path.endswith((".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg")):
-        response.headers["Cache-Control"] = "public, max-age=604800"  # 7 días
-    elif request.path.endswith(".html"):
-        response.headers["Cache-Control"] = "public, max-age=300"  # 5 minutos
+    # Headers de cache optimizados según tipo de archivo (los errores no se
+    # cachean)
+    if response.status_code < 400:
+        path = request.path
+        if path.endswith((".css", ".js")):
+            response.headers["Cache-Control"] = _CACHE_DAY
+        elif path.endswith((".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg")):
+            response.headers["Cache-Control"] = _CACHE_WEEK
+        elif path.endswith(".html"):
+            response.headers["Cache-Control"] = "public, max-age=300"  # 5 minutos
 
     # Headers de seguridad
     response.headers["X-Content-Type-Options"] = "nosniff"
@@ -105,56 +489,63 @@ def after_frontend_request(response):
 # ==========================================
 
 
+# Los 404 de estáticos (a menudo bots) no pasan por el errorhandler y solo
+# se registra 1 de cada _STATIC_MISS_LOG_EVERY
+_STATIC_404_HEADERS = {"Cache-Control": "no-store"}
+_STATIC_MISS_LOG_EVERY = 100
+_static_misses = itertools.count(1)
+
+
+def _static_not_found(label, filename):
+    """Respuesta 404 de archivo estático con log muestreado"""
+    misses = next(_static_misses)
+    if misses % _STATIC_MISS_LOG_EVERY == 1:
+        logger.warning(f"{label} file not found: {filename} ({misses} misses)")
+    return Response(status=404, headers=_STATIC_404_HEADERS)
+
+
+def _serve_static(
+    filename, prefixes, label, mimetype=None, cache_control=None, in_memory=False
+):
+    """Resolver y enviar un archivo estático sin excepciones en el camino normal
+
+    Sin mimetype/cache_control explícitos se usan los de la extensión.
+    """
+    static_file = find_static_file(filename, prefixes)
+    if static_file is None:
+        return _static_not_found(label, filename)
+
+    if mimetype is None or cache_control is None:
+        ext_mimetype, ext_cache_control = _meta(static_file.path.suffix.lower())
+        mimetype = mimetype or ext_mimetype
+        cache_control = cache_control or ext_cache_control
+
+    try:
+        return _sendfile(static_file, mimetype, cache_control, in_memory)
+    except OSError as e:
+        logger.error(f"Error serving {label} {filename}: {e}")
+        abort(500)
+
+
 @frontend_bp.route("/css/<path:filename>")
 def serve_css(filename):
     """Servir archivos CSS optimizados"""
-    try:
-        frontend_path = get_frontend_path()
-        css_paths = [
-            frontend_path / "css",
-            frontend_path / "assets" / "css",
-            frontend_path,
-        ]
-
-        for css_path in css_paths:
-            file_path = css_path / filename
-            if file_path.exists():
-                response = send_file(file_path, mimetype="text/css")
-                response.headers["Cache-Control"] = "public, max-age=86400"
-                return response
-
-        logger.warning(f"CSS file not found: {filename}")
-        abort(404)
-
-    except Exception as e:
-        logger.error(f"Error serving CSS {filename}: {e}")
-        abort(500)
+    return _serve_static(
+        filename, _CSS_PREFIXES, "CSS", "text/css", _CACHE_DAY, in_memory=True
+    )
 
 
 @frontend_bp.route("/js/<path:filename>")
 def serve_js(filename):
     """Servir archivos JavaScript optimizados"""
-    try:
-        frontend_path = get_frontend_path()
-        js_paths = [
-            frontend_path / "js",
-            frontend_path / "assets" / "js",
-            frontend_path,
-        ]
-
-        for js_path in js_paths:
-            file_path = js_path / filename
-            if file_path.exists():
-                response = send_file(file_path, mimetype="application/javascript")
-                response.headers["Cache-Control"] = "public, max-age=86400"
-                return response
-
-        logger.warning(f"JS file not found: {filename}")
-        abort(404)
-
-    except Exception as e:
-        logger.error(f"Error serving JS {filename}: {e}")
-        abort(500)
+    return _serve_static(
+        filename,
+        _JS_PREFIXES,
+        "JS",
+        "application/javascript",
+        _CACHE_DAY,
+        in_memory=True,
+    )
 
 
 @frontend_bp.route("/img/<path:filename>")
@@ -162,68 +553,16 @@ def serve_js(filename):
 @frontend_bp.route("/assets/img/<path:filename>")
 def serve_images(filename):
     """Servir archivos de imagen optimizados"""
-    try:
-        frontend_path = get_frontend_path()
-        img_paths = [
-            frontend_path / "img",
-            frontend_path / "images",
-            frontend_path / "assets" / "img",
-            frontend_path / "assets" / "images",
-            frontend_path,
-        ]
-
-        for img_path in img_paths:
-            file_path = img_path / filename
-            if file_path.exists():
-                # Detectar MIME type automáticamente
-                mimetype, _ = mimetypes.guess_type(str(file_path))
-                response = send_file(file_path, mimetype=mimetype)
-                response.headers["Cache-Control"] = "public, max-age=604800"  # 7 días
-                return response
-
-        logger.warning(f"Image file not found: {filename}")
-        abort(404)
-
-    except Exception as e:
-        logger.error(f"Error serving image {filename}: {e}")
-        abort(500)
+    return _serve_static(
+        filename, _IMG_PREFIXES, "Image", cache_control=_CACHE_WEEK, in_memory=True
+    )
 
 
 @frontend_bp.route("/assets/<path:filename>")
 def serve_assets(filename):
     """Servir archivos de assets generales"""
-    try:
-        frontend_path = get_frontend_path()
-        assets_paths = [frontend_path / "assets", frontend_path]
-
-        for assets_path in assets_paths:
-            file_path = assets_path / filename
-            if file_path.exists():
-                # Detectar MIME type
-                mimetype, _ = mimetypes.guess_type(str(file_path))
-                if not mimetype:
-                    mimetype = "application/octet-stream"
-
-                response = send_file(file_path, mimetype=mimetype)
-
-                # Cache según extensión
-                if filename.endswith((".css", ".js")):
-                    response.headers["Cache-Control"] = "public, max-age=86400"
-                elif filename.endswith(
-                    (".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg")
-                ):
-                    response.headers["Cache-Control"] = "public, max-age=604800"
-                else:
-                    response.headers["Cache-Control"] = "public, max-age=3600"
-
-                return response
-
-        logger.warning(f"Asset file not found: {filename}")
-        abort(404)
-
-    except Exception as e:
-        logger.error(f"Error serving asset {filename}: {e}")
-        abort(500)
+    # MIME type y cache según extensión
+    return _serve_static(filename, _ASSETS_PREFIXES, "Asset")
 
 
 # ==========================================
@@ -231,99 +570,97 @@ def serve_assets(filename):
 # ==========================================
 
 
-@frontend_bp.route("/favicon.ico")
-def favicon():
-    """Servir favicon"""
-    try:
-        frontend_path = get_frontend_path()
-        favicon_paths = [
-            frontend_path / "favicon.ico",
-            frontend_path / "img" / "favicon.ico",
-            frontend_path / "assets" / "img" / "favicon.ico",
-        ]
-
-        for favicon_path in favicon_paths:
-            if favicon_path.exists():
-                response = send_file(favicon_path, mimetype="image/x-icon")
-                response.headers["Cache-Control"] = "public, max-age=604800"
-                return response
-
-        # Generar favicon básico si no existe
-        return generate_basic_favicon()
+def _body_etag(body):
+    """ETag fuerte calculado sobre un cuerpo pre-renderizado"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
 
-    except Exception as e:
-        logger.error(f"Error serving favicon: {e}")
-        abort(404)
 
+def _bytes_response(body, etag, mimetype, cache_control):
+    """Responder un cuerpo pre-renderizado, o 304 si el cliente ya lo tiene"""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    return response
 
-@frontend_bp.route("/robots.txt")
-def robots_txt():
-    """Servir robots.txt"""
-    try:
-        frontend_path = get_frontend_path()
-        robots_path = frontend_path / "robots.txt"
 
-        if robots_path.exists():
-            return send_file(robots_path, mimetype="text/plain")
-        else:
-            # Generar robots.txt básico
-            robots_content = """User-agent: *
+# Respuestas por defecto cuando el frontend no trae su propio archivo; se
+# construyen una sola vez al importar el módulo
+_ROBOTS_BYTES = b"""User-agent: *
 Allow: /
 Disallow: /api/
 Disallow: /admin/
 Sitemap: /sitemap.xml
 """
-            from flask import Response
 
-            return Response(robots_content, mimetype="text/plain")
+_MANIFEST_BYTES = json.dumps(
+    {
+        "name": "ECPlacas 2.0 SRI COMPLETO",
+        "short_name": "ECPlacas 2.0",
+        "description": "Sistema de Consulta Vehicular SRI + Propietario",
+        "start_url": "/",
+        "display": "standalone",
+        "background_color": "#000033",
+        "theme_color": "#00ffff",
+        "icons": [
+            {"src": "/img/icon-192.png", "sizes": "192x192", "type": "image/png"},
+            {"src": "/img/icon-512.png", "sizes": "512x512", "type": "image/png"},
+        ],
+    },
+    separators=(",", ":"),
+).encode("utf-8")
+
+# Favicon básico de 16x16 en formato ICO (placeholder, en producción usar
+# un favicon real)
+_FAVICON_BYTES = b"\x00\x00\x01\x00\x01\x00\x10\x10\x00\x00\x01\x00\x20\x00\x68\x04\x00\x00\x16\x00\x00\x00"
+
+_ROBOTS_ETAG = _body_etag(_ROBOTS_BYTES)
+_MANIFEST_ETAG = _body_etag(_MANIFEST_BYTES)
+_FAVICON_ETAG = _body_etag(_FAVICON_BYTES)
 
-    except Exception as e:
-        logger.error(f"Error serving robots.txt: {e}")
-        abort(500)
+
+@frontend_bp.route("/favicon.ico")
+def favicon():
+    """Servir favicon"""
+    static_file = find_static_file("favicon.ico", _FAVICON_PREFIXES)
+    if static_file is not None:
+        try:
+            return _sendfile(static_file, "image/x-icon", _CACHE_WEEK, in_memory=True)
+        except OSError as e:
+            logger.error(f"Error serving favicon: {e}")
+
+    # Generar favicon básico si no existe
+    return generate_basic_favicon()
+
+
+@frontend_bp.route("/robots.txt")
+def robots_txt():
+    """Servir robots.txt"""
+    static_file = find_static_file("robots.txt", _ROOT_PREFIXES)
+    if static_file is not None:
+        try:
+            return _sendfile(static_file, "text/plain", _CACHE_HOUR)
+        except OSError as e:
+            logger.error(f"Error serving robots.txt: {e}")
+
+    return _bytes_response(_ROBOTS_BYTES, _ROBOTS_ETAG, "text/plain", _CACHE_HOUR)
 
 
 @frontend_bp.route("/manifest.json")
 def manifest():
     """Servir manifest.json para PWA"""
-    try:
-        frontend_path = get_frontend_path()
-        manifest_path = frontend_path / "manifest.json"
+    static_file = find_static_file("manifest.json", _ROOT_PREFIXES)
+    if static_file is not None:
+        try:
+            return _sendfile(static_file, "application/json", _CACHE_DAY)
+        except OSError as e:
+            logger.error(f"Error serving manifest.json: {e}")
 
-        if manifest_path.exists():
-            return send_file(manifest_path, mimetype="application/json")
-        else:
-            # Generar manifest básico
-            manifest_data = {
-                "name": "ECPlacas 2.0 SRI COMPLETO",
-                "short_name": "ECPlacas 2.0",
-                "description": "Sistema de Consulta Vehicular SRI + Propietario",
-                "start_url": "/",
-                "display": "standalone",
-                "background_color": "#000033",
-                "theme_color": "#00ffff",
-                "icons": [
-                    {
-                        "src": "/img/icon-192.png",
-                        "sizes": "192x192",
-                        "type": "image/png",
-                    },
-                    {
-                        "src": "/img/icon-512.png",
-                        "sizes": "512x512",
-                        "type": "image/png",
-                    },
-                ],
-            }
-
-            from flask import jsonify
-
-            response = jsonify(manifest_data)
-            response.headers["Cache-Control"] = "public, max-age=86400"
-            return response
-
-    except Exception as e:
-        logger.error(f"Error serving manifest.json: {e}")
-        abort(500)
+    return _bytes_response(
+        _MANIFEST_BYTES, _MANIFEST_ETAG, "application/json", _CACHE_DAY
+    )
 
 
 # ==========================================
@@ -333,21 +670,7 @@ def manifest():
 
 def generate_basic_favicon():
     """Generar favicon básico si no existe"""
-    try:
-        # Crear un favicon básico de 16x16 en formato ICO
-        # Esto es un placeholder - en producción usar un favicon real
-        from flask import Response
-
-        # ICO file header para 16x16 favicon básico (azul)
-        ico_data = b"\x00\x00\x01\x00\x01\x00\x10\x10\x00\x00\x01\x00\x20\x00\x68\x04\x00\x00\x16\x00\x00\x00"
-
-        response = Response(ico_data, mimetype="image/x-icon")
-        response.headers["Cache-Control"] = "public, max-age=86400"
-        return response
-
-    except Exception as e:
-        logger.error(f"Error generating basic favicon: {e}")
-        abort(404)
+    return _bytes_response(_FAVICON_BYTES, _FAVICON_ETAG, "image/x-icon", _CACHE_DAY)
 
 
 # ==========================================
@@ -359,24 +682,27 @@ def generate_basic_favicon():
 def frontend_not_found(error):
     """Manejo de 404 para archivos estáticos"""
     # Para archivos estáticos, retornar 404 normal
-    if request.path.startswith(("/css/", "/js/", "/img/", "/assets/")):
+    if request.path.startswith(_STATIC_URL_PREFIXES):
         logger.warning(f"Static file not found: {request.path}")
-        abort(404)
+        return error
 
-    # Para otras rutas, podría redirigir al index.html (SPA)
-    try:
-        frontend_path = get_frontend_path()
-        index_path = frontend_path / "index.html"
-
-        if index_path.exists():
-            logger.info(f"SPA fallback: {request.path} -> index.html")
-            return send_file(index_path, mimetype="text/html")
-        else:
-            abort(404)
+    # Para otras rutas, redirigir al index.html (SPA)
+    static_file = find_static_file("index.html", _ROOT_PREFIXES)
+    if static_file is None:
+        return error
 
-    except Exception as e:
+    try:
+        logger.info(f"SPA fallback: {request.path} -> index.html")
+        return _sendfile(
+            static_file,
+            "text/html",
+            _NO_CACHE,
+            in_memory=True,
+            memory_limit=_SPA_INDEX_MAX_FILE,
+        )
+    except OSError as e:
         logger.error(f"Error in frontend 404 handler: {e}")
-        abort(404)
+        return error
 
 
 # ==========================================
@@ -387,36 +713,18 @@ def frontend_not_found(error):
 @frontend_bp.route("/healthcheck")
 def frontend_healthcheck():
     """Healthcheck específico para frontend"""
-    try:
-        frontend_path = get_frontend_path()
-        index_exists = (frontend_path / "index.html").exists()
-
-        return {
-            "success": True,
-            "frontend_available": index_exists,
-            "frontend_path": str(frontend_path),
-            "static_files": {
-                "css": (
-                    len(list((frontend_path / "css").glob("*.css")))
-                    if (frontend_path / "css").exists()
-                    else 0
-                ),
-                "js": (
-                    len(list((frontend_path / "js").glob("*.js")))
-                    if (frontend_path / "js").exists()
-                    else 0
-                ),
-                "images": (
-                    len(list((frontend_path / "img").glob("*")))
-                    if (frontend_path / "img").exists()
-                    else 0
-                ),
-            },
-        }
-
-    except Exception as e:
-        logger.error(f"Error in frontend healthcheck: {e}")
-        return {"success": False, "error": str(e)}, 500
+    # ?refresh=1 reconstruye el índice tras desplegar archivos nuevos
+    if request.args.get("refresh") == "1":
+        invalidate_static_index()
+
+    # Conteos leídos del índice estático, sin recorrer el disco (los errores
+    # de lectura del directorio ya se registran al construir el índice)
+    return {
+        "success": True,
+        "frontend_available": "index.html" in get_static_index(),
+        "frontend_path": str(get_frontend_path()),
+        "static_files": get_static_counts(),
+    }
 
 
 if __name__ == "__main__":
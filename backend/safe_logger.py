@@ -3,78 +3,128 @@
 """
 Safe Logger para Windows - ECPlacas 2.0
 """
+import atexit
 import logging
+import queue
 import re
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Se evalúa una sola vez, no por cada registro
+_IS_WINDOWS = sys.platform.startswith("win")
+
+# Emojis comunes reemplazados con texto; el selector de variante U+FE0F
+# (p. ej. en "⚠️") se descarta
+_EMOJI_TEXT = {
+    "✅": "[OK]",
+    "❌": "[ERROR]",
+    "⚠️": "[WARNING]",
+    "⚠": "[WARNING]",
+    "\ufe0f": "",
+    "🔨": "[BUILD]",
+    "🔍": "[LINT]",
+    "🧪": "[TEST]",
+    "🐳": "[DOCKER]",
+    "🚀": "[DEPLOY]",
+    "📁": "[DIR]",
+    "📄": "[FILE]",
+    "💻": "[TECH]",
+    "🎯": "[TARGET]",
+}
+
+# Rangos de emojis que se remueven
+_EMOJI_RANGES = (
+    r"[\U0001F600-\U0001F64F]|"  # emoticons
+    r"[\U0001F300-\U0001F5FF]|"  # symbols & pictographs
+    r"[\U0001F680-\U0001F6FF]|"  # transport & map symbols
+    r"[\U0001F1E0-\U0001F1FF]|"  # flags
+    r"[\U00002600-\U000027BF]|"  # misc symbols
+    r"[\U0001F900-\U0001F9FF]|"  # supplemental symbols
+    r"[\U0001FA70-\U0001FAFF]"  # symbols and pictographs extended-a
+)
+
+# Una sola alternancia: primero los emojis con texto (los más largos antes)
+# y luego los rangos, para recorrer cada mensaje una única vez
+_EMOJI_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_EMOJI_TEXT, key=len, reverse=True))
+    + "|"
+    + _EMOJI_RANGES
+)
+
+
+def _emoji_text(match):
+    """Texto de reemplazo de un emoji (vacío si no tiene uno asignado)"""
+    return _EMOJI_TEXT.get(match.group(), "")
 
 
 class SafeWindowsFormatter(logging.Formatter):
     """Formatter que remueve emojis en Windows"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Regex para remover emojis
-        self.emoji_pattern = re.compile(
-            r"[\U0001F600-\U0001F64F]|"  # emoticons
-            r"[\U0001F300-\U0001F5FF]|"  # symbols & pictographs
-            r"[\U0001F680-\U0001F6FF]|"  # transport & map symbols
-            r"[\U0001F1E0-\U0001F1FF]|"  # flags
-            r"[\U00002600-\U000027BF]|"  # misc symbols
-            r"[\U0001F900-\U0001F9FF]|"  # supplemental symbols
-            r"[\U0001FA70-\U0001FAFF]"  # symbols and pictographs extended-a
-        )
+    emoji_pattern = _EMOJI_RE
 
     def format(self, record):
         # Formatear el mensaje
         msg = super().format(record)
 
-        # En Windows, remover emojis
-        if sys.platform.startswith("win"):
-            msg = self.emoji_pattern.sub("", msg)
-            # Reemplazar algunos emojis comunes con texto
-            replacements = {
-                "✅": "[OK]",
-                "❌": "[ERROR]",
-                "⚠️": "[WARNING]",
-                "🔨": "[BUILD]",
-                "🔍": "[LINT]",
-                "🧪": "[TEST]",
-                "🐳": "[DOCKER]",
-                "🚀": "[DEPLOY]",
-                "📁": "[DIR]",
-                "📄": "[FILE]",
-                "💻": "[TECH]",
-                "🎯": "[TARGET]",
-            }
-            for emoji, text in replacements.items():
-                msg = msg.replace(emoji, text)
+        # En Windows, reemplazar emojis comunes con texto y remover el resto;
+        # los mensajes ASCII no pueden contener emojis
+        if _IS_WINDOWS and not msg.isascii():
+            msg = _EMOJI_RE.sub(_emoji_text, msg)
 
         return msg
 
 
+# Cola compartida: los loggers solo encolan y un hilo de fondo formatea y
+# escribe en consola/archivo
+_LOG_QUEUE = queue.SimpleQueue()
+_listener = None
+_logger_lock = threading.Lock()
+
+
+def _start_listener():
+    """Crear los handlers reales y arrancar el QueueListener (llamar con lock)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    # Formatter seguro
+    formatter = SafeWindowsFormatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    # Handler para consola
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    # Handler para archivo (rotativo; se abre con el primer registro)
+    file_handler = RotatingFileHandler(
+        "logs/ecplacas_safe.log",
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5,
+        encoding="utf-8",
+        delay=True,
+    )
+    file_handler.setFormatter(formatter)
+
+    _listener = QueueListener(_LOG_QUEUE, console_handler, file_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
 def get_safe_logger(name, level=logging.INFO):
     """Crear logger seguro para Windows"""
     logger = logging.getLogger(name)
 
-    if not logger.handlers:
-        # Handler para consola
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-
-        # Handler para archivo
-        file_handler = logging.FileHandler("logs/ecplacas_safe.log", encoding="utf-8")
-        file_handler.setLevel(level)
-
-        # Formatter seguro
-        formatter = SafeWindowsFormatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+    with _logger_lock:
+        if not logger.handlers:
+            _start_listener()
 
-        console_handler.setFormatter(formatter)
-        file_handler.setFormatter(formatter)
+            queue_handler = QueueHandler(_LOG_QUEUE)
+            queue_handler.setLevel(level)
 
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
-        logger.setLevel(level)
+            logger.addHandler(queue_handler)
+            logger.setLevel(level)
 
     return logger
@@ -9,21 +9,36 @@ Módulo especializado para consultas a APIs externas de datos vehiculares
 """
 
 import asyncio
-import hashlib
+import copy
+import heapq
+import itertools
 import json
 import logging
+import os
 import random
+import re
+import sqlite3
+import sys
+import threading
 import time
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import aiohttp
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
-from .models import ValidadorEcuatoriano, VehiculoCompleto
+# Parser JSON rápido (opcional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .models import DatosVehicularesCompletos
 
 logger = logging.getLogger(__name__)
 
@@ -62,159 +77,452 @@ class VehicleScraperConfig:
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     ]
 
+    # Cantidad de juegos de headers aleatorios precalculados
+    HEADER_POOL_SIZE = 256
+
+    # Headers por defecto de la sesión HTTP
+    DEFAULT_HEADERS = {
+        "Accept": "application/json, text/html, application/xhtml+xml, application/xml;q=0.9, */*;q=0.8",
+        "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+        "Cache-Control": "no-cache",
+        "Pragma": "no-cache",
+        "Upgrade-Insecure-Requests": "1",
+    }
+
+    # Pool de conexiones compartido por todas las consultas
+    CONNECTOR_CONFIG = {
+        "limit": 50,
+        "limit_per_host": 10,
+        "ttl_dns_cache": 300,
+        "keepalive_timeout": 60,
+    }
+
+    # Códigos HTTP que se reintentan con backoff exponencial
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    # Backoff exponencial con jitter: base * 2**intento, con tope en segundos
+    RETRY_BACKOFF_BASE = 1.0
+    RETRY_BACKOFF_CAP = 10.0
+
+    # Segundos de espera antes de lanzar la siguiente API en paralelo (hedging)
+    HEDGE_DELAY = 0.5
+
     # Configuración de cache
     CACHE_CONFIG = {
         "enabled": True,
         "ttl_hours": 24,  # Time to live en horas
         "max_entries": 1000,
+        # SQLite compartido entre procesos y reinicios. Opcional: guarda datos
+        # personales sin límite de tamaño, se activa con la variable de entorno
+        # ECPLACAS_SCRAPER_CACHE_PATH (None = solo memoria)
+        "persist_path": os.getenv("ECPLACAS_SCRAPER_CACHE_PATH") or None,
     }
 
 
+# Caracteres separadores que se eliminan de la placa antes de validarla
+_PLACA_CLEAN = str.maketrans("", "", " -")
+_PLACA_FORMAT_RE = re.compile(r"[A-Z]{2,3}\d{3,4}")
+_PLACA_3_DIGITOS_RE = re.compile(r"([A-Z]{2,3})(\d{3})")
+
+
+@lru_cache(maxsize=4096)
+def _validar_placa(placa_limpia: str) -> Tuple[bool, str, str]:
+    """Valida una placa ya limpia (memoizada); la normalizada queda internada"""
+    if not _PLACA_FORMAT_RE.fullmatch(placa_limpia):
+        return False, placa_limpia, "formato esperado ABC1234"
+
+    # Normalización automática ABC123 -> ABC0123
+    match = _PLACA_3_DIGITOS_RE.fullmatch(placa_limpia)
+    if match:
+        placa_limpia = f"{match.group(1)}0{match.group(2)}"
+    return True, sys.intern(placa_limpia), ""
+
+
+@dataclass
+class VehiculoCompleto(DatosVehicularesCompletos):
+    """Datos vehiculares junto con la respuesta cruda de la API de la ANT"""
+
+    datos_api: Dict[str, Any] = field(default_factory=dict)
+
+    def procesar_datos_api(self, data: Dict[str, Any]):
+        """Guardar la respuesta de la API y copiar los campos de texto conocidos"""
+        self.datos_api = data
+        for grupo in data.get("campos", {}).values():
+            for registro in grupo if isinstance(grupo, list) else [grupo]:
+                if not isinstance(registro, dict):
+                    continue
+                for nombre, valor in registro.items():
+                    if isinstance(getattr(self, nombre, None), str) and valor:
+                        setattr(self, nombre, str(valor))
+
+
+def _random_ip() -> str:
+    """Genera una IP aleatoria para los headers de reenvío"""
+    return ".".join(str(random.randint(1, 255)) for _ in range(4))
+
+
+def _random_headers(user_agents: List[str]) -> Dict[str, str]:
+    """Genera un juego de headers aleatorios para evitar detección"""
+    return {
+        "User-Agent": random.choice(user_agents),
+        "X-Forwarded-For": _random_ip(),
+        "X-Real-IP": _random_ip(),
+    }
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parsea JSON con orjson si está disponible (cae a json si no es UTF-8)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            pass
+    return json.loads(raw)
+
+
+@dataclass(frozen=True)
+class _ApiTemplate:
+    """Vista precalculada de la configuración de una API"""
+
+    url: str
+    base_params: Dict[str, str]
+    timeout: aiohttp.ClientTimeout
+    timeout_seconds: float
+    rate_limit: float
+    retries: int
+
+
+def _build_api_template(api_config: Dict) -> _ApiTemplate:
+    """Construye la plantilla inmutable de una API a partir de su configuración"""
+    timeout = api_config.get("timeout", 30)
+    return _ApiTemplate(
+        url=f"{api_config['base_url']}{api_config['endpoint']}",
+        base_params=dict(api_config.get("params", {})),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        timeout_seconds=timeout,
+        rate_limit=api_config.get("rate_limit", 1.0),
+        retries=max(1, api_config.get("retry_attempts", 3)),
+    )
+
+
+@dataclass
+class _CacheEntry:
+    """Entrada del cache vehicular (con __slots__ para ahorrar memoria)"""
+
+    __slots__ = ("data", "stored_at", "expires_at", "placa", "api")
+
+    data: Dict
+    stored_at: float
+    expires_at: float
+    placa: str
+    api: str
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serializa a JSON en bytes con orjson si está disponible"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+
+
+class _PersistentCacheStore:
+    """Respaldo SQLite (WAL) del cache vehicular, con conexión por hilo"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._get_connection() as conn:
+            conn.execute("""CREATE TABLE IF NOT EXISTS vehicle_cache (
+                    placa TEXT NOT NULL,
+                    api TEXT NOT NULL,
+                    data BLOB NOT NULL,
+                    expires REAL NOT NULL,
+                    PRIMARY KEY (placa, api)
+                ) WITHOUT ROWID""")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Obtener conexión thread-local"""
+        if not hasattr(self.local, "connection"):
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            self.local.connection = conn
+        return self.local.connection
+
+    def get(self, placa: str, api_name: str) -> Optional[Tuple[Any, float]]:
+        """Retorna (datos, vencimiento en epoch) si la entrada sigue vigente"""
+        row = (
+            self._get_connection()
+            .execute(
+                "SELECT data, expires FROM vehicle_cache "
+                "WHERE placa = ? AND api = ? AND expires > ?",
+                (placa, api_name, time.time()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return _json_loads(row[0]), row[1]
+
+    def set(self, placa: str, api_name: str, data: Any, expires: float):
+        """Guarda o reemplaza una entrada"""
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO vehicle_cache (placa, api, data, expires) "
+                "VALUES (?, ?, ?, ?)",
+                (placa, api_name, _json_dumps(data), expires),
+            )
+
+    def purge_expired(self) -> int:
+        """Elimina las entradas vencidas; retorna cuántas"""
+        with self._get_connection() as conn:
+            return conn.execute(
+                "DELETE FROM vehicle_cache WHERE expires <= ?", (time.time(),)
+            ).rowcount
+
+    def clear(self):
+        """Vacía la tabla"""
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM vehicle_cache")
+
+
 class VehicleCache:
-    """Cache inteligente para consultas vehiculares"""
+    """Cache inteligente para consultas vehiculares
+
+    LRU sobre un OrderedDict: las entradas usadas se mueven al final y se
+    expulsan desde el principio. Un min-heap de vencimientos permite purgar
+    solo las entradas realmente expiradas. Con persist_path, las entradas se
+    escriben también en SQLite y sobreviven a reinicios y entre procesos.
+    """
 
-    def __init__(self, ttl_hours: int = 24, max_entries: int = 1000):
-        self.cache = {}
+    # Límites (en segundos) de los rangos de edad de get_stats
+    AGE_BOUNDS = (1 * 3600, 6 * 3600, 12 * 3600, 24 * 3600)
+    AGE_LABELS = ("0-1h", "1-6h", "6-12h", "12-24h", "+24h")
+
+    def __init__(
+        self,
+        ttl_hours: int = 24,
+        max_entries: int = 1000,
+        persist_path: Optional[str] = None,
+    ):
+        self.cache: "OrderedDict[Tuple[str, str], _CacheEntry]" = OrderedDict()
         self.ttl_hours = ttl_hours
         self.max_entries = max_entries
-        self.access_times = {}
-
-    def _generate_key(self, placa: str, api_name: str) -> str:
-        """Genera clave única para cache"""
-        return hashlib.md5(f"{placa}_{api_name}".encode()).hexdigest()
+        # (vencimiento monotónico, clave); puede tener entradas obsoletas
+        self.expiry_heap: List[Tuple[float, Tuple[str, str]]] = []
+        # Protege el LRU y el heap: el scraper corre en varios hilos (un event
+        # loop por hilo de worker). Las consultas a SQLite quedan fuera del lock
+        self._lock = threading.Lock()
+        self.store: Optional[_PersistentCacheStore] = None
+        if persist_path:
+            try:
+                self.store = _PersistentCacheStore(persist_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.error(f"❌ Cache persistente no disponible: {e}")
+
+    def _generate_key(self, placa: str, api_name: str) -> Tuple[str, str]:
+        """Genera clave única para cache (tupla simple, sin digest)"""
+        return (placa, api_name)
+
+    def _expire(self, now: float) -> int:
+        """Elimina las entradas vencidas según el heap (con el lock tomado)"""
+        heap = self.expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Ignorar elementos obsoletos (clave reemplazada o ya expulsada)
+            if entry is not None and entry.expires_at <= now:
+                del self.cache[key]
+                removed += 1
+        return removed
 
     def get(self, placa: str, api_name: str) -> Optional[Dict]:
         """Obtiene datos del cache si están vigentes"""
-        try:
-            key = self._generate_key(placa, api_name)
-
-            if key in self.cache:
-                entry = self.cache[key]
-                timestamp = entry["timestamp"]
-
-                # Verificar si no ha expirado
-                age_hours = (datetime.now() - timestamp).total_seconds() / 3600
-                if age_hours < self.ttl_hours:
-                    self.access_times[key] = datetime.now()
-                    logger.info(f"🎯 Cache HIT para {placa} (edad: {age_hours:.1f}h)")
-                    return entry["data"]
+        key = self._generate_key(placa, api_name)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self.cache.move_to_end(key)
                 else:
-                    # Expired, remove
-                    del self.cache[key]
-                    if key in self.access_times:
-                        del self.access_times[key]
-                    logger.info(f"⏰ Cache EXPIRED para {placa}")
+                    self._expire(now)
 
-            return None
+        if entry is not None:
+            if entry.expires_at > now:
+                age_hours = (now - entry.stored_at) / 3600
+                logger.info(f"🎯 Cache HIT para {placa} (edad: {age_hours:.1f}h)")
+                return entry.data
+            logger.info(f"⏰ Cache EXPIRED para {placa}")
 
-        except Exception as e:
-            logger.error(f"❌ Error obteniendo del cache: {e}")
-            return None
+        # Buscar en el respaldo persistente (otro proceso o antes del reinicio)
+        if self.store is not None:
+            try:
+                row = self.store.get(placa, api_name)
+            except (sqlite3.Error, ValueError) as e:
+                logger.error(f"❌ Error leyendo cache persistente: {e}")
+                row = None
+            if row is not None:
+                data, expires = row
+                expires_at = now + (expires - time.time())
+                with self._lock:
+                    overflow = self._store_local(key, data, placa, api_name, expires_at)
+                if overflow:
+                    self._cleanup_cache()
+                logger.info(f"🎯 Cache HIT persistente para {placa}")
+                return data
+
+        return None
 
     def set(self, placa: str, api_name: str, data: Dict):
         """Almacena datos en cache"""
-        try:
-            key = self._generate_key(placa, api_name)
-
-            # Limpiar cache si está lleno
-            if len(self.cache) >= self.max_entries:
-                self._cleanup_cache()
-
-            self.cache[key] = {
-                "data": data,
-                "timestamp": datetime.now(),
-                "placa": placa,
-                "api": api_name,
-            }
-            self.access_times[key] = datetime.now()
+        key = self._generate_key(placa, api_name)
+        ttl_seconds = self.ttl_hours * 3600
+        with self._lock:
+            overflow = self._store_local(
+                key, data, placa, api_name, time.monotonic() + ttl_seconds
+            )
+        if overflow:
+            self._cleanup_cache()
 
-            logger.info(f"💾 Cache SET para {placa}")
+        if self.store is not None:
+            try:
+                self.store.set(placa, api_name, data, time.time() + ttl_seconds)
+            except sqlite3.Error as e:
+                logger.error(f"❌ Error guardando en cache persistente: {e}")
+
+        logger.info(f"💾 Cache SET para {placa}")
+
+    def _store_local(
+        self,
+        key: Tuple[str, str],
+        data: Dict,
+        placa: str,
+        api_name: str,
+        expires_at: float,
+    ) -> bool:
+        """Inserta una entrada en el LRU (con el lock); True si superó el límite"""
+        stored_at = expires_at - self.ttl_hours * 3600
+        self.cache[key] = _CacheEntry(data, stored_at, expires_at, placa, api_name)
+        self.cache.move_to_end(key)
+        heapq.heappush(self.expiry_heap, (expires_at, key))
+
+        # Reconstruir el heap si acumula demasiados elementos obsoletos
+        if len(self.expiry_heap) > 2 * self.max_entries:
+            self.expiry_heap = [
+                (entry.expires_at, k) for k, entry in self.cache.items()
+            ]
+            heapq.heapify(self.expiry_heap)
 
-        except Exception as e:
-            logger.error(f"❌ Error guardando en cache: {e}")
+        # El llamador limpia el cache, ya sin el lock
+        return len(self.cache) > self.max_entries
 
     def _cleanup_cache(self):
         """Limpia entradas antiguas del cache"""
-        try:
+        with self._lock:
             # Remover entradas expiradas
-            current_time = datetime.now()
-            expired_keys = []
-
-            for key, entry in self.cache.items():
-                age_hours = (current_time - entry["timestamp"]).total_seconds() / 3600
-                if age_hours >= self.ttl_hours:
-                    expired_keys.append(key)
+            expired_count = self._expire(time.monotonic())
 
-            for key in expired_keys:
-                del self.cache[key]
-                if key in self.access_times:
-                    del self.access_times[key]
-
-            # Si aún está lleno, remover las menos accedidas
-            if len(self.cache) >= self.max_entries:
-                # Ordenar por último acceso
-                sorted_keys = sorted(
-                    self.access_times.keys(), key=lambda k: self.access_times[k]
-                )
+            # Si aún está lleno, expulsar las menos usadas hasta el 80%
+            evicted = 0
+            if len(self.cache) > self.max_entries:
+                while len(self.cache) > self.max_entries * 0.8:
+                    self.cache.popitem(last=False)
+                    evicted += 1
+            remaining = len(self.cache)
 
-                # Remover el 20% más antiguo
-                remove_count = max(1, len(sorted_keys) // 5)
-                for key in sorted_keys[:remove_count]:
-                    if key in self.cache:
-                        del self.cache[key]
-                    if key in self.access_times:
-                        del self.access_times[key]
+        if self.store is not None:
+            try:
+                expired_count += self.store.purge_expired()
+            except sqlite3.Error as e:
+                logger.error(f"❌ Error limpiando cache persistente: {e}")
 
-            logger.info(
-                f"🧹 Cache limpiado: {len(expired_keys)} expiradas, {len(self.cache)} entradas restantes"
-            )
+        logger.info(
+            f"🧹 Cache limpiado: {expired_count} expiradas, {evicted} expulsadas, {remaining} entradas restantes"
+        )
 
-        except Exception as e:
-            logger.error(f"❌ Error limpiando cache: {e}")
+    def clear(self):
+        """Vacía el cache"""
+        with self._lock:
+            self.cache.clear()
+            self.expiry_heap.clear()
+        if self.store is not None:
+            try:
+                self.store.clear()
+            except sqlite3.Error as e:
+                logger.error(f"❌ Error vaciando cache persistente: {e}")
 
     def get_stats(self) -> Dict[str, Any]:
         """Obtiene estadísticas del cache"""
-        try:
-            current_time = datetime.now()
+        now = time.monotonic()
+        counts = [0] * len(self.AGE_LABELS)
+        bounds = self.AGE_BOUNDS
+        with self._lock:
+            expired_count = self._expire(now)
             total_entries = len(self.cache)
-            expired_count = 0
-            age_distribution = {
-                "0-1h": 0,
-                "1-6h": 0,
-                "6-12h": 0,
-                "12-24h": 0,
-                "+24h": 0,
-            }
-
             for entry in self.cache.values():
-                age_hours = (current_time - entry["timestamp"]).total_seconds() / 3600
-
-                if age_hours >= self.ttl_hours:
-                    expired_count += 1
-                elif age_hours < 1:
-                    age_distribution["0-1h"] += 1
-                elif age_hours < 6:
-                    age_distribution["1-6h"] += 1
-                elif age_hours < 12:
-                    age_distribution["6-12h"] += 1
-                elif age_hours < 24:
-                    age_distribution["12-24h"] += 1
-                else:
-                    age_distribution["+24h"] += 1
+                counts[bisect_right(bounds, now - entry.stored_at)] += 1
 
-            return {
-                "total_entries": total_entries,
-                "expired_entries": expired_count,
-                "valid_entries": total_entries - expired_count,
-                "max_entries": self.max_entries,
-                "usage_percent": (total_entries / self.max_entries) * 100,
-                "ttl_hours": self.ttl_hours,
-                "age_distribution": age_distribution,
-            }
+        return {
+            "total_entries": total_entries,
+            "expired_entries": expired_count,
+            "valid_entries": total_entries,
+            "max_entries": self.max_entries,
+            "usage_percent": (total_entries / self.max_entries) * 100,
+            "ttl_hours": self.ttl_hours,
+            "age_distribution": dict(zip(self.AGE_LABELS, counts)),
+        }
 
-        except Exception as e:
-            logger.error(f"❌ Error obteniendo estadísticas de cache: {e}")
-            return {}
+
+class AsyncTokenBucket:
+    """Token bucket adaptativo para limitar requests sin bloquear el event loop
+
+    Cada acquire reserva un token (el saldo puede quedar negativo) y espera
+    con asyncio.sleep lo que falte, así las esperas concurrentes quedan en
+    fila sin necesitar un asyncio.Lock ligado a un loop concreto.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.max_rate = rate
+        self.min_rate = rate / 8
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> float:
+        """Consume un token esperando si hace falta; retorna los segundos esperados"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def decrease_rate(self):
+        """Reduce la tasa a la mitad ante un 429"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def increase_rate(self):
+        """Recupera la tasa gradualmente tras una respuesta exitosa"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
 
 
 class VehicleScraper:
@@ -222,70 +530,75 @@ class VehicleScraper:
 
     def __init__(self, use_cache: bool = True):
         self.config = VehicleScraperConfig()
-        self.cache = VehicleCache() if use_cache else None
-        self.session = self._create_session()
+        cache_config = self.config.CACHE_CONFIG
+        self.cache = (
+            VehicleCache(
+                ttl_hours=cache_config["ttl_hours"],
+                max_entries=cache_config["max_entries"],
+                persist_path=cache_config.get("persist_path"),
+            )
+            if use_cache and cache_config.get("enabled", True)
+            else None
+        )
+        # Una sesión HTTP por event loop: una sesión no puede usarse fuera del
+        # loop que la creó
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
         self.last_request_time = {}
+        # Plantillas de las APIs activas, en orden de prioridad
+        self._api_tmpls = {
+            api_name: _build_api_template(api_config)
+            for api_name, api_config in self.config.APIS.items()
+            if api_config.get("active", True)
+        }
+        self.limiters = {
+            api_name: AsyncTokenBucket(1.0 / tmpl.rate_limit)
+            for api_name, tmpl in self._api_tmpls.items()
+        }
         self.request_count = {"today": 0, "total": 0}
-        self.success_rate = {"successful": 0, "total": 0}
-
-    def _create_session(self) -> requests.Session:
-        """Crea sesión HTTP optimizada"""
-        session = requests.Session()
-
-        # Configurar retry strategy
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-            backoff_factor=1,
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        # Headers por defecto
-        session.headers.update(
-            {
-                "Accept": "application/json, text/html, application/xhtml+xml, application/xml;q=0.9, */*;q=0.8",
-                "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-                "Cache-Control": "no-cache",
-                "Pragma": "no-cache",
-                "Upgrade-Insecure-Requests": "1",
-            }
+        # Pool de headers aleatorios precalculados, usados en rotación
+        self._header_cycle = itertools.cycle(
+            tuple(
+                _random_headers(self.config.USER_AGENTS)
+                for _ in range(self.config.HEADER_POOL_SIZE)
+            )
         )
+        # Consultas en curso por placa normalizada (singleflight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.success_rate = {"successful": 0, "total": 0}
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Obtiene la sesión HTTP del event loop actual (se crea en el primer uso)"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # Las sesiones de loops ya cerrados no pueden reutilizarse
+            for otro_loop in [l for l in self._sessions if l.is_closed()]:
+                del self._sessions[otro_loop]
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self.config.CONNECTOR_CONFIG),
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers=self.config.DEFAULT_HEADERS,
+            )
+            self._sessions[loop] = session
         return session
 
     def _get_random_headers(self) -> Dict[str, str]:
-        """Obtiene headers aleatorios para evitar detección"""
-        return {
-            "User-Agent": random.choice(self.config.USER_AGENTS),
-            "X-Forwarded-For": f"{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}",
-            "X-Real-IP": f"{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}",
-        }
-
-    def _apply_rate_limit(self, api_name: str):
-        """Aplica rate limiting por API"""
-        try:
-            api_config = self.config.APIS.get(api_name, {})
-            rate_limit = api_config.get("rate_limit", 1.0)
+        """Obtiene headers aleatorios para evitar detección (no modificar)"""
+        return next(self._header_cycle)
 
-            if api_name in self.last_request_time:
-                elapsed = time.time() - self.last_request_time[api_name]
-                if elapsed < rate_limit:
-                    sleep_time = rate_limit - elapsed
-                    logger.info(
-                        f"⏱️ Rate limiting: esperando {sleep_time:.2f}s para {api_name}"
-                    )
-                    time.sleep(sleep_time)
+    async def _apply_rate_limit(self, api_name: str):
+        """Aplica rate limiting por API cediendo el event loop mientras espera"""
+        limiter = self.limiters.get(api_name)
+        if limiter is None:
+            tmpl = self._api_tmpls.get(api_name)
+            rate_limit = tmpl.rate_limit if tmpl else 1.0
+            limiter = self.limiters[api_name] = AsyncTokenBucket(1.0 / rate_limit)
 
-            self.last_request_time[api_name] = time.time()
+        sleep_time = await limiter.acquire()
+        if sleep_time > 0:
+            logger.info(f"⏱️ Rate limiting: esperado {sleep_time:.2f}s para {api_name}")
 
-        except Exception as e:
-            logger.error(f"❌ Error aplicando rate limit: {e}")
+        self.last_request_time[api_name] = time.time()
 
     async def consultar_vehiculo(self, placa: str) -> VehiculoCompleto:
         """
@@ -298,8 +611,8 @@ class VehicleScraper:
         vehiculo.timestamp_consulta = datetime.now()
 
         # Validar y normalizar placa
-        es_valida, placa_normalizada, error_placa = ValidadorEcuatoriano.validar_placa(
-            placa
+        es_valida, placa_normalizada, error_placa = _validar_placa(
+            placa.upper().translate(_PLACA_CLEAN)
         )
         if not es_valida:
             vehiculo.consulta_exitosa = False
@@ -315,38 +628,97 @@ class VehicleScraper:
             f"🚀 Iniciando consulta ECPlacas 2.0 para: {placa} → {placa_normalizada}"
         )
 
-        # Intentar APIs en orden de prioridad
-        apis_ordenadas = [
-            (name, config)
-            for name, config in self.config.APIS.items()
-            if config.get("active", True)
-        ]
-
-        for api_name, api_config in apis_ordenadas:
+        # Consultas simultáneas de la misma placa comparten un solo resultado.
+        # Solo dentro del mismo event loop: con un loop por hilo de worker, los
+        # hilos distintos consultan la API cada uno por su cuenta
+        loop = asyncio.get_running_loop()
+        en_curso = self._inflight.get(placa_normalizada)
+        if en_curso is not None and en_curso.get_loop() is loop:
+            logger.info(f"🔗 Reutilizando consulta en curso para {placa_normalizada}")
             try:
-                logger.info(f"🔍 Intentando API: {api_name}")
-
-                # Verificar cache primero
-                if self.cache:
-                    cached_data = self.cache.get(placa_normalizada, api_name)
-                    if cached_data:
-                        vehiculo.procesar_datos_api(cached_data)
-                        vehiculo.consulta_exitosa = True
-                        vehiculo.tiempo_consulta = time.time() - start_time
-                        logger.info(
-                            f"✅ Consulta exitosa desde CACHE para {placa_normalizada}"
-                        )
-                        return vehiculo
+                compartido = await asyncio.shield(en_curso)
+            except asyncio.CancelledError:
+                if not en_curso.cancelled():
+                    raise
+                # La consulta original fue cancelada: consultar por cuenta propia
+            else:
+                return self._copiar_resultado(compartido, placa, start_time)
+
+        fut = loop.create_future()
+        self._inflight[placa_normalizada] = fut
+        try:
+            resultado = await self._consultar_apis(
+                vehiculo, placa_normalizada, start_time
+            )
+            # Los que esperan copian este resultado, no el que recibe el llamador
+            fut.set_result(copy.copy(resultado))
+            return resultado
+        except BaseException:
+            fut.cancel()
+            raise
+        finally:
+            if self._inflight.get(placa_normalizada) is fut:
+                del self._inflight[placa_normalizada]
+
+    @staticmethod
+    def _copiar_resultado(
+        compartido: VehiculoCompleto, placa: str, start_time: float
+    ) -> VehiculoCompleto:
+        """Copia propia de un resultado compartido con los datos de este llamador"""
+        vehiculo = copy.copy(compartido)
+        vehiculo.placa_original = placa
+        vehiculo.tiempo_consulta = time.time() - start_time
+        return vehiculo
+
+    async def _consultar_apis(
+        self, vehiculo: VehiculoCompleto, placa_normalizada: str, start_time: float
+    ) -> VehiculoCompleto:
+        """Consulta cache y APIs para una placa ya normalizada"""
+        # APIs activas en orden de prioridad
+        apis_ordenadas = list(self._api_tmpls.items())
 
-                # Aplicar rate limiting
-                self._apply_rate_limit(api_name)
+        # Verificar cache primero
+        if self.cache:
+            for api_name, _ in apis_ordenadas:
+                cached_data = self.cache.get(placa_normalizada, api_name)
+                if cached_data:
+                    vehiculo.procesar_datos_api(cached_data)
+                    vehiculo.consulta_exitosa = True
+                    vehiculo.tiempo_consulta = time.time() - start_time
+                    logger.info(
+                        f"✅ Consulta exitosa desde CACHE para {placa_normalizada}"
+                    )
+                    return vehiculo
 
-                # Realizar consulta
-                api_response = await self._consultar_api(
-                    api_name, api_config, placa_normalizada
+        # Lanzar las APIs escalonadas: la siguiente arranca si la anterior falla
+        # o tarda más que HEDGE_DELAY; gana la primera respuesta válida
+        pendientes = iter(apis_ordenadas)
+        tasks: Dict[asyncio.Task, str] = {}
+        try:
+            while True:
+                if not tasks or all(t.done() for t in tasks):
+                    siguiente = next(pendientes, None)
+                    if siguiente is None:
+                        break
+                    api_name, tmpl = siguiente
+                    task = asyncio.create_task(
+                        self._one_attempt(api_name, tmpl, placa_normalizada)
+                    )
+                    tasks[task] = api_name
+
+                activas = {t for t in tasks if not t.done()}
+                done, _ = await asyncio.wait(
+                    activas,
+                    timeout=self.config.HEDGE_DELAY,
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
 
-                if api_response and self._validar_respuesta(api_response):
+                for task in done:
+                    api_name = tasks[task]
+                    api_response = task.result()
+                    if api_response is None:
+                        continue
+
                     # Procesar datos exitosos
                     vehiculo.procesar_datos_api(api_response)
                     vehiculo.consulta_exitosa = True
@@ -363,19 +735,22 @@ class VehicleScraper:
                         f"✅ Consulta exitosa desde {api_name} para {placa_normalizada} ({vehiculo.tiempo_consulta:.2f}s)"
                     )
                     return vehiculo
-                else:
-                    logger.warning(
-                        f"⚠️ API {api_name} retornó datos inválidos para {placa_normalizada}"
-                    )
-                    continue
-
-            except Exception as e:
-                logger.error(f"❌ Error en API {api_name}: {e}")
-                continue
 
-            finally:
-                self.success_rate["total"] += 1
-                self.request_count["total"] += 1
+                # Sin respuesta a tiempo: lanzar la siguiente API en paralelo
+                if not done:
+                    siguiente = next(pendientes, None)
+                    if siguiente is not None:
+                        api_name, tmpl = siguiente
+                        task = asyncio.create_task(
+                            self._one_attempt(api_name, tmpl, placa_normalizada)
+                        )
+                        tasks[task] = api_name
+        finally:
+            # Cancelar las consultas perdedoras
+            perdedoras = [t for t in tasks if not t.done()]
+            for task in perdedoras:
+                task.cancel()
+            await asyncio.gather(*perdedoras, return_exceptions=True)
 
         # Si llegamos aquí, todas las APIs fallaron
         vehiculo.consulta_exitosa = False
@@ -385,58 +760,134 @@ class VehicleScraper:
         logger.error(f"❌ Todas las APIs fallaron para {placa_normalizada}")
         return vehiculo
 
+    async def _one_attempt(
+        self, api_name: str, tmpl: _ApiTemplate, placa: str
+    ) -> Optional[Dict]:
+        """Consulta una API y retorna la respuesta solo si es válida"""
+        try:
+            logger.info(f"🔍 Intentando API: {api_name}")
+
+            # Aplicar rate limiting
+            await self._apply_rate_limit(api_name)
+
+            # Realizar consulta
+            api_response = await self._consultar_api(api_name, tmpl, placa)
+
+            if api_response and self._validar_respuesta(api_response):
+                self.limiters[api_name].increase_rate()
+                return api_response
+
+            logger.warning(f"⚠️ API {api_name} retornó datos inválidos para {placa}")
+            return None
+
+        except Exception as e:
+            logger.error(f"❌ Error en API {api_name}: {e}")
+            return None
+
+        finally:
+            self.success_rate["total"] += 1
+            self.request_count["total"] += 1
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Calcula la espera antes de reintentar
+
+        Respeta Retry-After (segundos o fecha HTTP) si el servidor lo envía;
+        si no, usa backoff exponencial con tope y jitter aleatorio.
+        """
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    fecha = parsedate_to_datetime(retry_after)
+                    return max(
+                        0.0, (fecha - datetime.now(fecha.tzinfo)).total_seconds()
+                    )
+                except (TypeError, ValueError):
+                    pass
+
+        delay = self.config.RETRY_BACKOFF_BASE * 2**attempt
+        return min(self.config.RETRY_BACKOFF_CAP, delay * random.uniform(0.5, 1.5))
+
     async def _consultar_api(
-        self, api_name: str, api_config: Dict, placa: str
+        self, api_name: str, tmpl: _ApiTemplate, placa: str
     ) -> Optional[Dict]:
         """Consulta una API específica"""
         try:
-            # Construir URL
-            base_url = api_config["base_url"]
-            endpoint = api_config["endpoint"]
-            url = f"{base_url}{endpoint}"
-
-            # Parámetros
-            params = api_config.get("params", {}).copy()
-            params["identidad"] = placa
+            url = tmpl.url
+            params = {**tmpl.base_params, "identidad": placa}
 
             # Headers aleatorios
             headers = self._get_random_headers()
 
-            # Timeout
-            timeout = api_config.get("timeout", 30)
+            # Reintentos
+            retry_attempts = tmpl.retries
 
             logger.info(f"📡 Consultando {url} con placa {placa}")
 
-            # Realizar request
-            response = self.session.get(
-                url, params=params, headers=headers, timeout=timeout, verify=True
-            )
-
-            response.raise_for_status()
-
-            # Parsear respuesta
-            if response.headers.get("content-type", "").startswith("application/json"):
-                data = response.json()
-            else:
-                # Intentar parsear como JSON de todas formas
+            # Realizar request con la sesión compartida
+            session = await self._get_session()
+            for attempt in range(retry_attempts):
+                last_attempt = attempt == retry_attempts - 1
                 try:
-                    data = response.json()
-                except:
-                    logger.error(f"❌ Respuesta no es JSON válido desde {api_name}")
-                    return None
-
-            logger.info(
-                f"✅ Respuesta exitosa desde {api_name} ({len(json.dumps(data))} chars)"
-            )
+                    async with session.get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=tmpl.timeout,
+                    ) as response:
+                        if response.status == 429 and api_name in self.limiters:
+                            self.limiters[api_name].decrease_rate()
+
+                        if (
+                            response.status in self.config.RETRY_STATUSES
+                            and not last_attempt
+                        ):
+                            delay = self._retry_delay(
+                                attempt, response.headers.get("Retry-After")
+                            )
+                            if delay > self.config.RETRY_BACKOFF_CAP:
+                                logger.warning(
+                                    f"⏳ {api_name} pide esperar {delay:.0f}s, se omite el reintento"
+                                )
+                                return None
+                            logger.warning(
+                                f"🔁 {api_name} respondió {response.status}, reintentando en {delay:.1f}s"
+                            )
+                        else:
+                            response.raise_for_status()
+
+                            # Parsear respuesta (aunque el content-type no sea JSON)
+                            raw = await response.read()
+                            try:
+                                data = _json_loads(raw)
+                            except ValueError:
+                                logger.error(
+                                    f"❌ Respuesta no es JSON válido desde {api_name}"
+                                )
+                                return None
+                            break
+
+                    # Esperar fuera del async with: la conexión ya fue liberada
+                    await asyncio.sleep(delay)
+
+                except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+                    if last_attempt:
+                        raise
+                    await asyncio.sleep(self._retry_delay(attempt))
+
+            logger.info(f"✅ Respuesta exitosa desde {api_name} ({len(raw)} bytes)")
             return data
 
-        except requests.exceptions.Timeout:
-            logger.error(f"⏱️ Timeout en API {api_name} después de {timeout}s")
+        except asyncio.TimeoutError:
+            logger.error(
+                f"⏱️ Timeout en API {api_name} después de {tmpl.timeout_seconds}s"
+            )
             return None
-        except requests.exceptions.ConnectionError:
+        except aiohttp.ClientConnectionError:
             logger.error(f"🔌 Error de conexión en API {api_name}")
             return None
-        except requests.exceptions.HTTPError as e:
+        except aiohttp.ClientResponseError as e:
             logger.error(f"🌐 Error HTTP en API {api_name}: {e}")
             return None
         except Exception as e:
@@ -445,46 +896,41 @@ class VehicleScraper:
 
     def _validar_respuesta(self, data: Dict) -> bool:
         """Valida que la respuesta de la API sea válida"""
-        try:
-            if not isinstance(data, dict):
-                return False
-
-            # Verificar estructura básica
-            if "codError" not in data:
-                return False
-
-            # Verificar código de error
-            cod_error = data.get("codError")
-            if cod_error != "0":
-                mensaje_error = data.get("mensajeError", "Error desconocido")
-                logger.warning(f"⚠️ API retornó error: {cod_error} - {mensaje_error}")
-                return False
-
-            # Verificar que tenga campos de datos
-            campos = data.get("campos", {})
-            if not campos:
-                logger.warning("⚠️ Respuesta sin campos de datos")
-                return False
-
-            # Verificar al menos un conjunto de datos importante
-            datos_importantes = [
-                "lsDatosIdentificacion",
-                "lsDatosModelo",
-                "lsOtrasCaracteristicas",
-                "lsRevision",
-            ]
+        if not isinstance(data, dict):
+            return False
 
-            tiene_datos = any(campos.get(campo) for campo in datos_importantes)
-            if not tiene_datos:
-                logger.warning("⚠️ Respuesta sin datos vehiculares importantes")
-                return False
+        # Verificar estructura básica
+        if "codError" not in data:
+            return False
 
-            return True
+        # Verificar código de error
+        cod_error = data.get("codError")
+        if cod_error != "0":
+            mensaje_error = data.get("mensajeError", "Error desconocido")
+            logger.warning(f"⚠️ API retornó error: {cod_error} - {mensaje_error}")
+            return False
 
-        except Exception as e:
-            logger.error(f"❌ Error validando respuesta: {e}")
+        # Verificar que tenga campos de datos
+        campos = data.get("campos", {})
+        if not campos or not isinstance(campos, dict):
+            logger.warning("⚠️ Respuesta sin campos de datos")
             return False
 
+        # Verificar al menos un conjunto de datos importante
+        datos_importantes = [
+            "lsDatosIdentificacion",
+            "lsDatosModelo",
+            "lsOtrasCaracteristicas",
+            "lsRevision",
+        ]
+
+        tiene_datos = any(campos.get(campo) for campo in datos_importantes)
+        if not tiene_datos:
+            logger.warning("⚠️ Respuesta sin datos vehiculares importantes")
+            return False
+
+        return True
+
     def get_statistics(self) -> Dict[str, Any]:
         """Obtiene estadísticas del scraper"""
         try:
@@ -526,63 +972,103 @@ class VehicleScraper:
     def clear_cache(self):
         """Limpia completamente el cache"""
         if self.cache:
-            self.cache.cache.clear()
-            self.cache.access_times.clear()
+            self.cache.clear()
             logger.info("🧹 Cache limpiado completamente")
 
     def test_apis(self, placa_test: str = "TBX0160") -> Dict[str, Any]:
         """Prueba todas las APIs con una placa de testing"""
-        results = {}
+        return asyncio.run(self._probar_apis(placa_test, close_session=True))
 
-        for api_name, api_config in self.config.APIS.items():
-            if not api_config.get("active", True):
-                results[api_name] = {"status": "inactive"}
-                continue
+    async def _probar_apis(
+        self, placa_test: str = "TBX0160", close_session: bool = False
+    ) -> Dict[str, Any]:
+        """Prueba todas las APIs en paralelo dentro del event loop actual"""
+        try:
+            probes = await asyncio.gather(
+                *(
+                    self._probar_api(api_name, tmpl, placa_test)
+                    for api_name, tmpl in self._api_tmpls.items()
+                )
+            )
+        finally:
+            # asyncio.run cierra su loop al terminar, y con él la sesión
+            if close_session:
+                await self.close()
 
-            try:
-                start_time = time.time()
+        probes_por_api = dict(zip(self._api_tmpls, probes))
+        return {
+            api_name: probes_por_api.get(api_name, {"status": "inactive"})
+            for api_name in self.config.APIS
+        }
 
-                # Aplicar rate limiting
-                self._apply_rate_limit(api_name)
+    async def _probar_api(
+        self, api_name: str, tmpl: _ApiTemplate, placa_test: str
+    ) -> Dict[str, Any]:
+        """Prueba una API y retorna su resultado"""
+        try:
+            start_time = time.time()
 
-                # Realizar consulta de prueba
-                response = asyncio.run(
-                    self._consultar_api(api_name, api_config, placa_test)
-                )
+            # Aplicar rate limiting
+            await self._apply_rate_limit(api_name)
 
-                elapsed_time = time.time() - start_time
+            # Realizar consulta de prueba
+            response = await self._consultar_api(api_name, tmpl, placa_test)
 
-                if response and self._validar_respuesta(response):
-                    results[api_name] = {
-                        "status": "success",
-                        "response_time": round(elapsed_time, 2),
-                        "data_fields": list(response.get("campos", {}).keys()),
-                        "message": "API funcionando correctamente",
-                    }
-                else:
-                    results[api_name] = {
-                        "status": "error",
-                        "response_time": round(elapsed_time, 2),
-                        "message": "Respuesta inválida o vacía",
-                    }
+            elapsed_time = time.time() - start_time
 
-            except Exception as e:
-                results[api_name] = {"status": "error", "message": str(e)}
+            if response and self._validar_respuesta(response):
+                return {
+                    "status": "success",
+                    "response_time": round(elapsed_time, 2),
+                    "data_fields": list(response.get("campos", {}).keys()),
+                    "message": "API funcionando correctamente",
+                }
+            return {
+                "status": "error",
+                "response_time": round(elapsed_time, 2),
+                "message": "Respuesta inválida o vacía",
+            }
 
-        return results
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
 
-    def close(self):
+    async def close(self):
         """Cierra recursos del scraper"""
         try:
-            if self.session:
-                self.session.close()
+            loop = asyncio.get_running_loop()
+            sessions, self._sessions = self._sessions, {}
+            for session_loop, session in sessions.items():
+                if session.closed or session_loop.is_closed():
+                    continue
+                if session_loop is loop:
+                    await session.close()
+                elif session_loop.is_running():
+                    # La sesión pertenece a otro hilo: cerrarla dentro de su loop
+                    await asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+                    )
+                else:
+                    # Loop detenido: el cierre corre cuando vuelva a ejecutarse
+                    session_loop.call_soon_threadsafe(
+                        session_loop.create_task, session.close()
+                    )
             logger.info("🔒 Scraper cerrado correctamente")
         except Exception as e:
             logger.error(f"❌ Error cerrando scraper: {e}")
 
 
-# Instancia global del scraper
-vehicle_scraper = VehicleScraper()
+# Instancia global del scraper, creada en el primer uso
+@lru_cache(maxsize=1)
+def get_scraper() -> VehicleScraper:
+    """Obtiene la instancia global del scraper (se crea al primer llamado)"""
+    return VehicleScraper()
+
+
+def __getattr__(name: str):
+    """Compatibilidad: ``vehicle_scraper`` se resuelve de forma perezosa"""
+    if name == "vehicle_scraper":
+        return get_scraper()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Función de conveniencia para uso directo
@@ -590,17 +1076,18 @@ async def consultar_placa(placa: str) -> VehiculoCompleto:
     """
     Función de conveniencia para consultar una placa
     """
-    return await vehicle_scraper.consultar_vehiculo(placa)
+    return await get_scraper().consultar_vehiculo(placa)
 
 
 if __name__ == "__main__":
     # Pruebas del scraper
     async def test_scraper():
         print("🧪 Probando ECPlacas Scraper...")
+        vehicle_scraper = get_scraper()
 
         # Prueba de APIs
         print("\n📡 Probando APIs...")
-        api_results = vehicle_scraper.test_apis()
+        api_results = await vehicle_scraper._probar_apis()
         for api_name, result in api_results.items():
             status = result["status"]
             emoji = "✅" if status == "success" else "❌" if status == "error" else "⏸️"
@@ -613,10 +1100,9 @@ if __name__ == "__main__":
         if vehiculo.consulta_exitosa:
             print(f"✅ Consulta exitosa:")
             print(f"   Placa: {vehiculo.numero_placa}")
-            print(f"   Marca: {vehiculo.modelo.marca}")
-            print(f"   Modelo: {vehiculo.modelo.modelo}")
-            print(f"   Año: {vehiculo.modelo.anio_fabricacion}")
-            print(f"   Estado: {vehiculo.analisis.estado_matricula.value}")
+            print(f"   Marca: {vehiculo.descripcion_marca}")
+            print(f"   Modelo: {vehiculo.descripcion_modelo}")
+            print(f"   Estado: {vehiculo.estado_matricula}")
             print(f"   Tiempo: {vehiculo.tiempo_consulta:.2f}s")
         else:
             print(f"❌ Consulta fallida: {vehiculo.mensaje_error}")
@@ -629,7 +1115,7 @@ if __name__ == "__main__":
         if stats["cache_stats"]:
             print(f"   Cache entries: {stats['cache_stats']['valid_entries']}")
 
-        vehicle_scraper.close()
+        await vehicle_scraper.close()
         print("\n✅ Pruebas completadas")
 
     # Ejecutar pruebas
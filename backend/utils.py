@@ -10,27 +10,76 @@ Funciones de utilidad para ECPlacas 2.0
 
 import base64
 import hashlib
+import ipaddress
 import json
 import logging
 import re
 import secrets
 import smtplib
+import socket
 import string
+import threading
 import time
 from datetime import datetime, timedelta
 from email import encoders
-from email.mime.base import MimeBase
-from email.mime.multipart import MimeMultipart
-from email.mime.text import MimeText
-from functools import wraps
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from functools import lru_cache, wraps
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import qrcode
+# Generación de códigos QR (opcional)
+try:
+    import qrcode
+except ImportError:
+    qrcode = None
 
 logger = logging.getLogger(__name__)
 
+# Expresiones regulares compiladas una sola vez al importar el módulo
+_NON_WORD_SPACE_RE = re.compile(r"[^\w\s]")
+_NON_WORD_RE = re.compile(r"[^\w]")
+_NON_NAME_RE = re.compile(r"[^a-zA-ZáéíóúñÁÉÍÓÚÑ\s]")
+_NON_DIGIT_RE = re.compile(r"\D")
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\-_\.]")
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+_DANGEROUS_RE = re.compile(
+    r"javascript:|vbscript:|script|onload|onerror|[<>\"'&]", re.IGNORECASE
+)
+
+# Tabla que elimina todo carácter ASCII que no sea dígito
+_ASCII_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not 48 <= c <= 57)
+)
+
+# Formateadores de moneda enlazados una sola vez
+_USD_FORMAT = "${:,.2f}".format
+_AMOUNT_FORMAT = "{:,.2f}".format
+
+# Tiempo relativo: (segundos mínimos, segundos por unidad, singular, plural)
+_RELATIVE_TIME_UNITS = (
+    (366 * 86400, 365 * 86400, "año", "años"),
+    (31 * 86400, 30 * 86400, "mes", "meses"),
+    (86400, 86400, "día", "días"),
+    (3601, 3600, "hora", "horas"),
+    (61, 60, "minuto", "minutos"),
+)
+
+# Alfabeto de tokens: cada byte < 248 se mapea a uno de los 62 caracteres
+_TOKEN_ALPHABET = (string.ascii_letters + string.digits).encode("ascii")
+_TOKEN_TABLE = bytes(_TOKEN_ALPHABET[b % len(_TOKEN_ALPHABET)] for b in range(256))
+_TOKEN_REJECTED = bytes(range(248, 256))
+
+_SESSION_PREFIX = "ecplacas_"
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str, format_str: str) -> datetime:
+    """strptime memoizado (las fechas se repiten mucho en listados)"""
+    return datetime.strptime(date_str, format_str)
+
 
 class TextUtils:
     """Utilidades para procesamiento de texto"""
@@ -42,9 +91,9 @@ class TextUtils:
             return ""
 
         if allow_spaces:
-            return re.sub(r"[^\w\s]", "", text).strip()
+            return _NON_WORD_SPACE_RE.sub("", text).strip()
         else:
-            return re.sub(r"[^\w]", "", text).strip()
+            return _NON_WORD_RE.sub("", text).strip()
 
     @staticmethod
     def normalize_name(name: str) -> str:
@@ -53,7 +102,7 @@ class TextUtils:
             return ""
 
         # Remover caracteres especiales excepto letras, espacios y acentos
-        clean_name = re.sub(r"[^a-zA-ZáéíóúñÁÉÍÓÚÑ\s]", "", name)
+        clean_name = _NON_NAME_RE.sub("", name)
 
         # Convertir a título y normalizar espacios
         return " ".join(clean_name.upper().split())
@@ -64,8 +113,11 @@ class TextUtils:
         if not phone:
             return ""
 
-        # Remover todo excepto dígitos
-        digits_only = re.sub(r"\D", "", phone)
+        # Remover todo excepto dígitos (str.translate si es ASCII)
+        if phone.isascii():
+            digits_only = phone.translate(_ASCII_NON_DIGITS)
+        else:
+            digits_only = _NON_DIGIT_RE.sub("", phone)
 
         # Formatear según código de país
         if country_code == "+593":  # Ecuador
@@ -83,10 +135,9 @@ class TextUtils:
         """Formatear cantidad como moneda"""
         try:
             if currency == "USD":
-                return f"${amount:,.2f}"
-            else:
-                return f"{amount:,.2f} {currency}"
-        except:
+                return _USD_FORMAT(amount)
+            return f"{_AMOUNT_FORMAT(amount)} {currency}"
+        except (TypeError, ValueError):
             return str(amount)
 
     @staticmethod
@@ -108,16 +159,19 @@ class DateUtils:
     def parse_date(date_str: str, format_str: str = "%d-%m-%Y") -> Optional[datetime]:
         """Parsear string de fecha a datetime"""
         try:
-            return datetime.strptime(date_str.split(" ")[0], format_str)
-        except:
+            return _parse_date_cached(date_str.split(" ", 1)[0], format_str)
+        except (AttributeError, TypeError, ValueError):
             return None
 
     @staticmethod
     def format_date(date_obj: datetime, format_str: str = "%d-%m-%Y") -> str:
         """Formatear datetime a string"""
         try:
+            # Formato por defecto con enteros, sin pasar por strftime
+            if format_str == "%d-%m-%Y":
+                return f"{date_obj.day:02d}-{date_obj.month:02d}-{date_obj.year}"
             return date_obj.strftime(format_str)
-        except:
+        except (AttributeError, TypeError, ValueError):
             return ""
 
     @staticmethod
@@ -145,25 +199,15 @@ class DateUtils:
     def format_relative_time(date_obj: datetime) -> str:
         """Formatear fecha en tiempo relativo"""
         try:
-            now = datetime.now()
-            diff = now - date_obj
-
-            if diff.days > 365:
-                years = diff.days // 365
-                return f"hace {years} año{'s' if years > 1 else ''}"
-            elif diff.days > 30:
-                months = diff.days // 30
-                return f"hace {months} mes{'es' if months > 1 else ''}"
-            elif diff.days > 0:
-                return f"hace {diff.days} día{'s' if diff.days > 1 else ''}"
-            elif diff.seconds > 3600:
-                hours = diff.seconds // 3600
-                return f"hace {hours} hora{'s' if hours > 1 else ''}"
-            elif diff.seconds > 60:
-                minutes = diff.seconds // 60
-                return f"hace {minutes} minuto{'s' if minutes > 1 else ''}"
-            else:
-                return "hace un momento"
+            diff = datetime.now() - date_obj
+            elapsed = diff.days * 86400 + diff.seconds
+
+            for minimum, unit, singular, plural in _RELATIVE_TIME_UNITS:
+                if elapsed >= minimum:
+                    count = elapsed // unit
+                    return f"hace {count} {singular if count == 1 else plural}"
+
+            return "hace un momento"
         except:
             return "fecha desconocida"
 
@@ -174,20 +218,29 @@ class SecurityUtils:
     @staticmethod
     def generate_token(length: int = 32) -> str:
         """Generar token aleatorio seguro"""
-        alphabet = string.ascii_letters + string.digits
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+        # Bytes aleatorios mapeados al alfabeto en C; se descartan los >= 248
+        # para que las 62 letras/dígitos queden equiprobables
+        token = b""
+        while len(token) < length:
+            token += secrets.token_bytes(length - len(token) + 8).translate(
+                _TOKEN_TABLE, _TOKEN_REJECTED
+            )
+        return token[:length].decode("ascii")
 
     @staticmethod
     def hash_string(text: str, salt: str = "") -> str:
-        """Crear hash SHA256 de un string"""
-        return hashlib.sha256((text + salt).encode()).hexdigest()
+        """Crear hash BLAKE2b (256 bits) de un string, usando la sal como clave"""
+        key = salt.encode("utf-8")
+        if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+            key = hashlib.blake2b(key).digest()
+        return hashlib.blake2b(
+            text.encode("utf-8"), key=key, digest_size=32
+        ).hexdigest()
 
     @staticmethod
     def generate_session_id() -> str:
         """Generar ID de sesión único"""
-        timestamp = str(int(time.time() * 1000))
-        random_part = secrets.token_hex(8)
-        return f"ecplacas_{timestamp}_{random_part}"
+        return f"{_SESSION_PREFIX}{int(time.time() * 1000)}_{secrets.token_hex(8)}"
 
     @staticmethod
     def sanitize_input(text: str) -> str:
@@ -195,81 +248,82 @@ class SecurityUtils:
         if not text:
             return ""
 
-        # Remover caracteres peligrosos
-        dangerous_chars = [
-            "<",
-            ">",
-            '"',
-            "'",
-            "&",
-            "script",
-            "javascript:",
-            "vbscript:",
-            "onload",
-            "onerror",
-        ]
-
-        clean_text = text
-        for char in dangerous_chars:
-            clean_text = clean_text.replace(char, "")
+        # Remover caracteres peligrosos en una pasada, repitiendo hasta que no
+        # queden (evita que "scr<ipt" se recomponga al quitar el "<")
+        clean_text, removed = _DANGEROUS_RE.subn("", text)
+        while removed:
+            clean_text, removed = _DANGEROUS_RE.subn("", clean_text)
 
         return clean_text.strip()
 
     @staticmethod
     def validate_ip(ip: str) -> bool:
         """Validar formato de dirección IP"""
+        # Camino rápido: validación en C sin crear objetos
+        if isinstance(ip, str):
+            for family in (socket.AF_INET, socket.AF_INET6):
+                try:
+                    socket.inet_pton(family, ip)
+                    return True
+                except (OSError, ValueError):
+                    pass
+
+        # Casos restantes (zona IPv6, enteros) y rechazo definitivo
         try:
-            import ipaddress
-
             ipaddress.ip_address(ip)
             return True
-        except:
+        except ValueError:
             return False
 
 
 class RateLimiter:
-    """Limitador de velocidad para APIs"""
+    """Limitador de velocidad para APIs (token bucket por identificador)"""
+
+    # Cada cuántas llamadas se barren los identificadores inactivos
+    GC_INTERVAL = 1024
 
     def __init__(self, max_requests: int = 50, time_window: int = 3600):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = {}
+        self.refill_rate = max_requests / time_window
+        # identificador -> [tokens disponibles, última recarga]
+        self.buckets: Dict[str, List[float]] = {}
+        self._calls_since_gc = 0
 
     def is_allowed(self, identifier: str) -> Tuple[bool, int]:
         """Verificar si se permite la request"""
         current_time = time.time()
 
-        # Limpiar requests antiguos
-        self._cleanup_old_requests(current_time)
-
-        # Obtener requests del identificador
-        if identifier not in self.requests:
-            self.requests[identifier] = []
+        # Limpiar periódicamente los identificadores inactivos
+        self._calls_since_gc += 1
+        if self._calls_since_gc >= self.GC_INTERVAL:
+            self._calls_since_gc = 0
+            self._cleanup_old_requests(current_time)
 
-        user_requests = self.requests[identifier]
+        bucket = self.buckets.get(identifier)
+        if bucket is None:
+            bucket = self.buckets[identifier] = [float(self.max_requests), current_time]
+        else:
+            # Recargar tokens según el tiempo transcurrido
+            elapsed = current_time - bucket[1]
+            bucket[0] = min(self.max_requests, bucket[0] + elapsed * self.refill_rate)
+            bucket[1] = current_time
 
         # Verificar límite
-        if len(user_requests) >= self.max_requests:
-            return False, self.max_requests - len(user_requests)
+        if bucket[0] < 1:
+            return False, 0
 
-        # Agregar nueva request
-        user_requests.append(current_time)
-        return True, self.max_requests - len(user_requests)
+        bucket[0] -= 1
+        return True, int(bucket[0])
 
     def _cleanup_old_requests(self, current_time: float):
-        """Limpiar requests antiguas"""
+        """Limpiar identificadores inactivos (su bucket ya estaría lleno)"""
         cutoff_time = current_time - self.time_window
 
-        for identifier in list(self.requests.keys()):
-            self.requests[identifier] = [
-                req_time
-                for req_time in self.requests[identifier]
-                if req_time > cutoff_time
-            ]
-
-            # Remover identificadores sin requests
-            if not self.requests[identifier]:
-                del self.requests[identifier]
+        for identifier in [
+            key for key, bucket in self.buckets.items() if bucket[1] <= cutoff_time
+        ]:
+            del self.buckets[identifier]
 
 
 class FileUtils:
@@ -311,7 +365,7 @@ class FileUtils:
     def safe_filename(filename: str) -> str:
         """Crear nombre de archivo seguro"""
         # Remover caracteres peligrosos
-        safe_chars = re.sub(r"[^\w\-_\.]", "_", filename)
+        safe_chars = _UNSAFE_FILENAME_RE.sub("_", filename)
 
         # Limitar longitud
         if len(safe_chars) > 100:
@@ -323,40 +377,70 @@ class FileUtils:
         return safe_chars
 
 
+# Instancias QRCode reutilizables por hilo, indexadas por (tamaño, borde)
+_qr_pool = threading.local()
+
+
+def _get_qr(size: int, border: int) -> "qrcode.QRCode":
+    """Obtener un QRCode limpio del pool del hilo actual"""
+    pool = getattr(_qr_pool, "codes", None)
+    if pool is None:
+        pool = _qr_pool.codes = {}
+
+    qr = pool.get((size, border))
+    if qr is None:
+        qr = pool[(size, border)] = qrcode.QRCode(
+            version=1,
+            error_correction=qrcode.constants.ERROR_CORRECT_L,
+            box_size=size,
+            border=border,
+        )
+    else:
+        qr.clear()
+        # make(fit=True) parte de la versión actual: volver a la mínima
+        qr.version = 1
+    return qr
+
+
+@lru_cache(maxsize=512)
+def _qr_png_b64(data: str, size: int, border: int) -> str:
+    """Renderizar QR como PNG en base64 (memoizado por contenido y tamaño)"""
+    qr = _get_qr(size, border)
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    img = qr.make_image(fill_color="black", back_color="white")
+
+    buffer = BytesIO()
+    img.save(buffer, format="PNG")
+    # getbuffer() evita copiar el PNG; base64 es ASCII puro
+    return base64.b64encode(buffer.getbuffer()).decode("ascii")
+
+
 class QRCodeGenerator:
     """Generador de códigos QR"""
 
     @staticmethod
     def generate_qr(data: str, size: int = 10, border: int = 4) -> str:
         """Generar código QR y retornar como base64"""
+        if qrcode is None:
+            logger.warning("qrcode no disponible: no se genera el código QR")
+            return ""
         try:
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=size,
-                border=border,
-            )
-            qr.add_data(data)
-            qr.make(fit=True)
-
-            img = qr.make_image(fill_color="black", back_color="white")
-
-            buffer = BytesIO()
-            img.save(buffer, format="PNG")
-            img_str = base64.b64encode(buffer.getvalue()).decode()
-
-            return f"data:image/png;base64,{img_str}"
+            return f"data:image/png;base64,{_qr_png_b64(data, size, border)}"
         except Exception as e:
             logger.error(f"Error generando QR: {e}")
             return ""
 
     @staticmethod
-    def generate_verification_qr(session_id: str, placa: str) -> str:
-        """Generar QR de verificación para consulta"""
+    def generate_verification_qr(
+        session_id: str, placa: str, timestamp: Optional[str] = None
+    ) -> str:
+        """Generar QR de verificación (un timestamp fijo reutiliza el QR en reenvíos)"""
         verification_data = {
             "session_id": session_id,
             "placa": placa,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "service": "ECPlacas 2.0",
             "version": "2.0.0",
         }
@@ -390,40 +474,89 @@ class EmailService:
         attachments: List[Dict] = None,
     ) -> bool:
         """Enviar email"""
+        return self.send_batch(
+            [
+                {
+                    "to_email": to_email,
+                    "subject": subject,
+                    "body": body,
+                    "is_html": is_html,
+                    "attachments": attachments,
+                }
+            ]
+        )[0]
+
+    def send_batch(self, emails: List[Dict]) -> List[bool]:
+        """Enviar varios emails reutilizando una sola conexión SMTP
+
+        Cada elemento de ``emails`` lleva los mismos argumentos que send_email;
+        retorna si cada envío tuvo éxito, en el mismo orden.
+        """
+        results = [False] * len(emails)
+        if not emails:
+            return results
+
         try:
-            msg = MimeMultipart()
-            msg["From"] = self.username
-            msg["To"] = to_email
-            msg["Subject"] = subject
-
-            # Agregar cuerpo
-            mime_type = "html" if is_html else "plain"
-            msg.attach(MimeText(body, mime_type, "utf-8"))
-
-            # Agregar adjuntos
-            if attachments:
-                for attachment in attachments:
-                    self._add_attachment(msg, attachment)
-
-            # Enviar email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
-
-            logger.info(f"✅ Email enviado exitosamente a {to_email}")
-            return True
+            with self._open_connection() as server:
+                for index, email in enumerate(emails):
+                    try:
+                        server.send_message(self._build_message(**email))
+                        results[index] = True
+                        logger.info(
+                            f"✅ Email enviado exitosamente a {email['to_email']}"
+                        )
+                    except smtplib.SMTPServerDisconnected:
+                        raise
+                    except Exception as e:
+                        logger.error(f"❌ Error enviando email: {e}")
 
         except Exception as e:
             logger.error(f"❌ Error enviando email: {e}")
-            return False
 
-    def _add_attachment(self, msg: MimeMultipart, attachment: Dict):
+        return results
+
+    def _open_connection(self) -> smtplib.SMTP:
+        """Abrir conexión SMTP autenticada (usar como context manager)"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            if self.use_tls:
+                server.starttls()
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        is_html: bool = False,
+        attachments: List[Dict] = None,
+    ) -> MIMEMultipart:
+        """Construir el mensaje MIME de un email"""
+        msg = MIMEMultipart()
+        msg["From"] = self.username
+        msg["To"] = to_email
+        msg["Subject"] = subject
+
+        # Agregar cuerpo
+        mime_type = "html" if is_html else "plain"
+        msg.attach(MIMEText(body, mime_type, "utf-8"))
+
+        # Agregar adjuntos
+        if attachments:
+            for attachment in attachments:
+                self._add_attachment(msg, attachment)
+
+        return msg
+
+    def _add_attachment(self, msg: MIMEMultipart, attachment: Dict):
         """Agregar adjunto al email"""
         try:
             with open(attachment["path"], "rb") as file:
-                part = MimeBase("application", "octet-stream")
+                part = MIMEBase("application", "octet-stream")
                 part.set_payload(file.read())
                 encoders.encode_base64(part)
                 part.add_header(
@@ -442,16 +575,17 @@ class TemplateEngine:
     def render_template(template: str, context: Dict[str, Any]) -> str:
         """Renderizar plantilla con contexto"""
         try:
-            result = template
-            for key, value in context.items():
-                placeholder = f"{{{{{key}}}}}"
-                result = result.replace(placeholder, str(value))
-            return result
+            # Una sola pasada; los placeholders sin valor quedan tal cual
+            return _PLACEHOLDER_RE.sub(
+                lambda match: str(context.get(match.group(1), match.group(0))),
+                template,
+            )
         except Exception as e:
             logger.error(f"Error renderizando plantilla: {e}")
             return template
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_email_template(template_name: str = "consultation_result") -> str:
         """Obtener plantilla de email"""
         templates = {
@@ -22,6 +22,8 @@ import json
 import time
 import sys
 import os
+from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any, List, Optional
@@ -282,6 +284,803 @@ class TestAPIEndpoints:
             assert response.status_code != 404
 
 
+class TestAPIBlueprint:
+    """Pruebas de las rutas adicionales del blueprint de API."""
+
+    @pytest.fixture
+    def api_client(self):
+        """Cliente con el blueprint de API registrado."""
+        from flask import Flask
+        from backend.routes.api_routes import api_bp
+
+        api_app = Flask(__name__)
+        api_app.register_blueprint(api_bp, url_prefix="/api")
+        return api_app.test_client()
+
+    def test_list_endpoints(self, api_client):
+        """Test del listado agrupado de endpoints."""
+        first = api_client.get('/api/endpoints').get_json()
+        second = api_client.get('/api/endpoints').get_json()
+
+        assert first['success'] is True
+        assert first['endpoints'] == second['endpoints']
+        paths = [e['path'] for e in first['endpoints']['api']]
+        assert '/api/endpoints' in paths
+        assert first['total_endpoints'] == sum(
+            first['endpoints_por_categoria'].values()
+        )
+
+    def test_version_etag_not_modified(self, api_client):
+        """Test de revalidación con ETag en endpoints estáticos."""
+        response = api_client.get('/api/version')
+        etag = response.headers.get('ETag')
+
+        assert response.status_code == 200
+        assert etag
+
+        cached = api_client.get('/api/version', headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.data == b''
+
+    def test_ping(self, api_client):
+        """Test del endpoint de ping pre-serializado."""
+        data = api_client.get('/api/ping').get_json()
+
+        assert data['success'] is True
+        assert data['message'] == 'pong'
+        assert data['timestamp']
+
+    def test_validate_batch_compact(self, api_client):
+        """Test de validación por lotes en formato normal y compacto."""
+        payload = {'placas': ['ABC123', 'X1', 'ABC123'], 'cedulas': ['1710034065']}
+
+        normal = api_client.post('/api/validate/batch', json=payload).get_json()
+        assert normal['resumen']['placas_procesadas'] == 2
+        assert normal['resumen']['placas_validas'] == 1
+        assert normal['resultados']['placas']['ABC123']['normalizada'] == 'ABC0123'
+
+        compact = api_client.post(
+            '/api/validate/batch?compact=1', json=payload
+        ).get_json()
+        placas = compact['resultados']['placas']
+        assert placas['normalizada'][0] == 'ABC0123'
+        assert placas['entrada'] == ['ABC123', 'X1']
+        assert placas['es_valida'] == [True, False]
+        assert compact['resumen']['cedulas_validas'] == 1
+        assert compact['resultados']['cedulas']['provincia'] == ['Pichincha']
+
+    def test_validate_batch_rejects_bad_payloads(self, api_client):
+        """Test de rechazo de cuerpos grandes o JSON inválido en lote."""
+        big = {'placas': ['ABC1234'] * 10000}
+        response = api_client.post('/api/validate/batch', json=big)
+        assert response.status_code == 413
+
+        response = api_client.post(
+            '/api/validate/batch', data='{no json', content_type='application/json'
+        )
+        assert response.status_code == 400
+
+    def test_monitoring_status_cached(self, api_client):
+        """Test del snapshot de monitoreo compartido entre requests."""
+        start = time.monotonic()
+        first = api_client.get('/api/monitoring/status').get_json()
+        second = api_client.get('/api/monitoring/status').get_json()
+
+        assert time.monotonic() - start < 1
+        assert first['status'] == 'healthy'
+        assert first['memory'] == second['memory']
+
+
+class TestMonitoring:
+    """Pruebas del monitoreo de sistema de los blueprints API y admin."""
+
+    def test_performance_before_first_sample(self, monkeypatch):
+        """Test de cpu_percent pendiente hasta la primera muestra del hilo."""
+        pytest.importorskip('psutil')
+        from flask import Flask
+        from backend.routes import admin_routes
+
+        admin_routes.stop_cpu_sampler()
+        monkeypatch.setattr(admin_routes, '_ensure_cpu_sampler', lambda: None)
+        monkeypatch.setattr(
+            admin_routes.psutil, 'cpu_percent',
+            Mock(side_effect=AssertionError('cpu_percent en el hilo de la request')),
+        )
+        with Flask(__name__).app_context():
+            pending = admin_routes.performance_metrics().get_json()
+            monkeypatch.setattr(admin_routes, '_LATEST_CPU_PERCENT', 37.5)
+            sampled = admin_routes.performance_metrics().get_json()
+
+        assert pending['success'] is True
+        assert pending['cpu']['percent'] is None
+        assert pending['cpu']['status'] == 'measuring'
+        assert sampled['cpu']['percent'] == 37.5
+        assert sampled['cpu']['status'] == 'ok'
+
+    @pytest.mark.parametrize('module_name', ['api_routes', 'admin_routes'])
+    def test_process_handle_follows_pid(self, monkeypatch, module_name):
+        """Test del handle de psutil recreado cuando cambia el pid (fork)."""
+        pytest.importorskip('psutil')
+        import importlib
+
+        module = importlib.import_module(f'backend.routes.{module_name}')
+        current = module._get_process()
+        assert current.pid == os.getpid()
+        assert module._get_process() is current
+
+        # Simular el proceso hijo de un fork: otro pid, otro handle
+        monkeypatch.setattr(module.os, 'getpid', os.getppid)
+        child = module._get_process()
+        assert child.pid == os.getppid()
+        assert child is not current
+
+    def test_monitoring_status_reads_cpu_sampler(self, monkeypatch):
+        """Test del snapshot de monitoreo con la CPU del hilo de muestreo."""
+        pytest.importorskip('psutil')
+        from flask import Flask
+        from backend.routes import admin_routes, api_routes
+
+        monkeypatch.setattr(admin_routes, '_ensure_cpu_sampler', lambda: None)
+        monkeypatch.setattr(admin_routes, '_LATEST_CPU_PERCENT', 12.5)
+        monkeypatch.setattr(
+            api_routes.psutil, 'cpu_percent',
+            Mock(side_effect=AssertionError('cpu_percent en el hilo de la request')),
+        )
+        monkeypatch.setitem(api_routes._monitoring_cache, 'data', None)
+        with Flask(__name__).test_request_context('/api/monitoring/status'):
+            data = api_routes.monitoring_status().get_json()
+
+        assert data['cpu_percent'] == 12.5
+
+    def test_cpu_sampler_can_be_stopped(self):
+        """Test de detención y reinicio del hilo de muestreo de CPU."""
+        pytest.importorskip('psutil')
+        from backend.routes import admin_routes
+
+        admin_routes._ensure_cpu_sampler()
+        thread = admin_routes._cpu_sampler_thread
+        assert thread.is_alive()
+
+        admin_routes.stop_cpu_sampler(timeout=5)
+        assert not thread.is_alive()
+        assert admin_routes._LATEST_CPU_PERCENT is None
+
+        admin_routes._ensure_cpu_sampler()
+        assert admin_routes._cpu_sampler_thread is not thread
+        admin_routes.stop_cpu_sampler(timeout=5)
+
+
+class TestJSONSerialization:
+    """Pruebas del serializador JSON con y sin orjson."""
+
+    PAYLOAD = {
+        'timestamp': datetime(2024, 1, 2, 3, 4, 5, 6),
+        'zeta': [float('nan'), 1.5, float('inf')],
+        'alfa': {'placa': 'PBX1234', 'marca': 'Kía'},
+        'monto': Decimal('12.50'),
+    }
+
+    def test_fallback_matches_orjson(self, monkeypatch):
+        """Test de salida idéntica con orjson y con el json estándar."""
+        import backend.app as backend_app
+
+        with_orjson = backend_app.json_bytes(self.PAYLOAD)
+        monkeypatch.setattr(backend_app, 'orjson', None)
+        fallback = backend_app.json_bytes(self.PAYLOAD)
+
+        assert with_orjson == fallback
+        assert json.loads(fallback) == {
+            'alfa': {'marca': 'Kía', 'placa': 'PBX1234'},
+            'monto': '12.50',
+            'timestamp': '2024-01-02T03:04:05.000006',
+            'zeta': [None, 1.5, None],
+        }
+        assert fallback.index(b'"alfa"') < fallback.index(b'"zeta"')
+
+    def test_ojson_response_without_orjson(self, monkeypatch):
+        """Test de ojson y build_result_body sin orjson instalado."""
+        from flask import Flask
+        import backend.app as backend_app
+
+        expected = backend_app.json_bytes(self.PAYLOAD)
+        monkeypatch.setattr(backend_app, 'orjson', None)
+        with Flask(__name__).app_context():
+            response = backend_app.ojson(self.PAYLOAD, 201)
+
+        assert response.status_code == 201
+        assert response.mimetype == 'application/json'
+        assert response.get_data() == expected
+
+        body = backend_app.build_result_body(
+            'sesion', {'result': {'tiempo_consulta': float('nan')}}
+        )
+        assert json.loads(body)['response_time'] is None
+
+
+class TestUtils:
+    """Pruebas de las utilidades del sistema."""
+
+    def test_hash_string_keyed_blake2b(self):
+        """Test del hash BLAKE2b con la sal como clave."""
+        import hashlib
+        from backend.utils import SecurityUtils
+
+        digest = SecurityUtils.hash_string('PBX1234', 'sal')
+
+        assert digest == hashlib.blake2b(
+            b'PBX1234', key=b'sal', digest_size=32
+        ).hexdigest()
+        assert len(digest) == 64
+        assert digest != SecurityUtils.hash_string('PBX1234')
+        # Sales más largas que la clave máxima se reducen con un hash previo
+        assert len(SecurityUtils.hash_string('PBX1234', 'x' * 100)) == 64
+
+    def test_format_relative_time(self):
+        """Test del tiempo relativo para fechas pasadas y futuras."""
+        from datetime import timedelta
+        from backend.utils import DateUtils
+
+        now = datetime.now()
+
+        assert DateUtils.format_relative_time(now + timedelta(hours=2)) == 'hace un momento'
+        assert DateUtils.format_relative_time(now - timedelta(seconds=10)) == 'hace un momento'
+        assert DateUtils.format_relative_time(now - timedelta(hours=2, seconds=5)) == 'hace 2 horas'
+        assert DateUtils.format_relative_time(now - timedelta(days=1, seconds=5)) == 'hace 1 día'
+        assert DateUtils.format_relative_time(None) == 'fecha desconocida'
+
+    def test_validate_ip(self):
+        """Test de validación de IPv4, IPv6 y entradas inválidas."""
+        from backend.utils import SecurityUtils
+
+        for ip in ('192.168.1.1', '::1', '2001:db8::1', 'fe80::1%eth0'):
+            assert SecurityUtils.validate_ip(ip), ip
+        for ip in ('256.1.1.1', '1.2.3', 'abc', '', '192.168.1.1 '):
+            assert not SecurityUtils.validate_ip(ip), ip
+
+    def test_rate_limiter_token_bucket(self):
+        """Test del token bucket: agota, rechaza y recarga con el tiempo."""
+        from backend.utils import RateLimiter
+
+        limiter = RateLimiter(max_requests=2, time_window=60)
+
+        assert limiter.is_allowed('1.1.1.1') == (True, 1)
+        assert limiter.is_allowed('1.1.1.1') == (True, 0)
+        assert limiter.is_allowed('1.1.1.1') == (False, 0)
+        assert limiter.is_allowed('2.2.2.2') == (True, 1)
+
+        # 30 segundos de espera recargan un token (2 por minuto)
+        limiter.buckets['1.1.1.1'][1] -= 30
+        assert limiter.is_allowed('1.1.1.1')[0] is True
+        assert limiter.is_allowed('1.1.1.1')[0] is False
+
+    def test_parse_and_format_date(self):
+        """Test de parseo y formato de fechas con el formato por defecto."""
+        from backend.utils import DateUtils
+
+        assert DateUtils.parse_date('05-03-2024') == datetime(2024, 3, 5)
+        assert DateUtils.parse_date('05-03-2024 10:30:00') == datetime(2024, 3, 5)
+        assert DateUtils.parse_date('2024/03/05', '%Y/%m/%d') == datetime(2024, 3, 5)
+        assert DateUtils.parse_date('no es fecha') is None
+        assert DateUtils.parse_date(None) is None
+
+        fecha = datetime(2024, 3, 5, 10, 30)
+        assert DateUtils.format_date(fecha) == fecha.strftime('%d-%m-%Y') == '05-03-2024'
+        assert DateUtils.format_date(fecha, '%Y/%m/%d %H:%M') == '2024/03/05 10:30'
+        assert DateUtils.format_date(None) == ''
+
+    def test_email_batch_reuses_connection(self, tmp_path):
+        """Test de mensajes MIME enviados por una sola conexión SMTP."""
+        from backend.utils import EmailService
+
+        adjunto = tmp_path / 'reporte.txt'
+        adjunto.write_text('contenido')
+        service = EmailService('smtp.example.com', 587, 'ecplacas@example.com', 'x')
+        server = MagicMock()
+        server.__enter__.return_value = server
+
+        with patch('backend.utils.smtplib.SMTP', return_value=server) as smtp:
+            results = service.send_batch([
+                {'to_email': 'a@example.com', 'subject': 'A', 'body': 'uno'},
+                {
+                    'to_email': 'b@example.com', 'subject': 'B', 'body': '<b>dos</b>',
+                    'is_html': True,
+                    'attachments': [{'path': str(adjunto), 'filename': 'reporte.txt'}],
+                },
+            ])
+
+        assert results == [True, True]
+        assert smtp.call_count == 1
+        sent = [call.args[0] for call in server.send_message.call_args_list]
+        assert [msg['To'] for msg in sent] == ['a@example.com', 'b@example.com']
+        assert len(sent[1].get_payload()) == 2
+
+
+class TestFrontendBlueprint:
+    """Pruebas del blueprint que sirve el frontend."""
+
+    @pytest.fixture
+    def frontend_client(self):
+        """Cliente con el blueprint de frontend registrado."""
+        from flask import Flask
+        from backend.routes import frontend_routes
+
+        frontend_routes.invalidate_static_index()
+        frontend_app = Flask(__name__)
+        frontend_app.register_blueprint(frontend_routes.frontend_bp)
+        return frontend_app.test_client()
+
+    def test_serve_css_from_index(self, frontend_client):
+        """Test de archivos servidos desde el índice estático."""
+        response = frontend_client.get('/css/main.css')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/css'
+        assert response.headers['Cache-Control'] == 'public, max-age=86400'
+        missing = frontend_client.get('/css/missing.css')
+        assert missing.status_code == 404
+        assert missing.headers['Cache-Control'] == 'no-store'
+        assert frontend_client.get('/js/../index.html').status_code == 404
+
+    def test_small_css_body_cached(self, frontend_client):
+        """Test del LRU de cuerpos CSS/JS pequeños."""
+        from backend.routes import frontend_routes
+
+        first = frontend_client.get('/css/main.css')
+        second = frontend_client.get('/css/main.css')
+
+        assert first.data == second.data
+        assert first.data in frontend_routes._body_cache.values()
+
+    def test_css_gzip_variant(self, frontend_client):
+        """Test de la variante gzip con Vary y ETag propio."""
+        import gzip
+
+        plain = frontend_client.get('/css/main.css')
+        packed = frontend_client.get(
+            '/css/main.css', headers={'Accept-Encoding': 'gzip'}
+        )
+
+        assert packed.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in packed.headers['Vary']
+        assert packed.headers['ETag'] != plain.headers['ETag']
+        assert gzip.decompress(packed.data) == plain.data
+
+    def test_healthcheck_counts_from_index(self, frontend_client):
+        """Test de los conteos del healthcheck leídos del índice."""
+        data = frontend_client.get('/healthcheck?refresh=1').get_json()
+
+        assert data['frontend_available'] is True
+        assert data['static_files'] == {'css': 1, 'js': 0, 'images': 0}
+
+    def test_head_static_without_body(self, frontend_client):
+        """Test de HEAD respondido solo con cabeceras."""
+        from backend.routes import frontend_routes
+
+        frontend_routes._clear_body_cache()
+        response = frontend_client.head('/css/main.css')
+
+        assert response.status_code == 200
+        assert response.data == b''
+        assert response.content_length == os.path.getsize(
+            os.path.join(os.path.dirname(__file__), '..', 'frontend', 'css', 'main.css')
+        )
+        assert not frontend_routes._body_cache
+
+    def test_head_gzip_uses_only_cached_variant(self, frontend_client):
+        """Test de HEAD con gzip sin leer ni comprimir el archivo."""
+        from backend.routes import frontend_routes
+
+        gzip_headers = {'Accept-Encoding': 'gzip'}
+        frontend_routes._clear_body_cache()
+        cold = frontend_client.head('/css/main.css', headers=gzip_headers)
+
+        assert cold.status_code == 200
+        assert 'Content-Encoding' not in cold.headers
+        assert not cold.headers['ETag'].endswith('-gz"')
+        assert not frontend_routes._body_cache
+
+        packed = frontend_client.get('/css/main.css', headers=gzip_headers)
+        warm = frontend_client.head('/css/main.css', headers=gzip_headers)
+
+        assert warm.headers['Content-Encoding'] == 'gzip'
+        assert warm.headers['ETag'] == packed.headers['ETag']
+        assert warm.content_length == len(packed.data)
+
+    def test_unsatisfiable_range_closes_file(self, monkeypatch):
+        """Test de cierre del archivo cuando el rango pedido no es válido."""
+        from flask import Flask
+        from werkzeug.exceptions import RequestedRangeNotSatisfiable
+        from backend.routes import frontend_routes
+
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            opened.append(open(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(frontend_routes, 'open', tracking_open, raising=False)
+        frontend_routes.invalidate_static_index()
+        with Flask(__name__).test_request_context(
+            '/index.html', headers={'Range': 'bytes=99999999-'}
+        ):
+            static_file = frontend_routes.find_static_file(
+                'index.html', frontend_routes._ROOT_PREFIXES
+            )
+            with pytest.raises(RequestedRangeNotSatisfiable):
+                frontend_routes._sendfile(static_file, 'text/html', 'no-cache')
+
+        assert len(opened) == 1
+        assert opened[0].closed
+
+    @pytest.fixture
+    def temp_frontend(self, tmp_path, monkeypatch):
+        """Frontend temporal para simular despliegues de archivos."""
+        from flask import Flask
+        from backend.routes import frontend_routes
+
+        (tmp_path / 'css').mkdir()
+        (tmp_path / 'css' / 'app.css').write_text('body{}')
+        monkeypatch.setattr(frontend_routes, 'get_frontend_path', lambda: tmp_path)
+        frontend_routes.invalidate_static_index()
+        frontend_app = Flask(__name__)
+        frontend_app.register_blueprint(frontend_routes.frontend_bp)
+        yield tmp_path, frontend_app.test_client()
+        frontend_routes.invalidate_static_index()
+
+    def test_static_index_revalidated_after_ttl(self, temp_frontend, monkeypatch):
+        """Test de archivos redeployados servidos con su nuevo tamaño y ETag."""
+        from backend.routes import frontend_routes
+
+        root, client = temp_frontend
+        monkeypatch.setattr(frontend_routes, '_STATIC_INDEX_TTL', 0.0)
+        first = client.get('/css/app.css')
+        assert first.data == b'body{}'
+
+        (root / 'css' / 'app.css').write_text('body{color:red}')
+        os.utime(root / 'css' / 'app.css', (time.time() + 5, time.time() + 5))
+        second = client.get('/css/app.css')
+
+        assert second.data == b'body{color:red}'
+        assert second.content_length == len(b'body{color:red}')
+        assert second.headers['ETag'] != first.headers['ETag']
+
+    def test_size_mismatch_expires_static_index(self, temp_frontend):
+        """Test de entrada del índice desactualizada detectada al leer el archivo."""
+        from backend.routes import frontend_routes
+
+        root, _ = temp_frontend
+        stale = frontend_routes.find_static_file('app.css', ('css/',))
+        (root / 'css' / 'app.css').write_text('body{margin:0}')
+
+        assert frontend_routes._cached_body(stale) == b'body{margin:0}'
+        assert frontend_routes._cached_gzip(stale) == b''
+        assert stale not in frontend_routes._body_cache
+        assert (stale, 'gzip') not in frontend_routes._body_cache
+        fresh = frontend_routes.find_static_file('app.css', ('css/',))
+        assert fresh.size == len(b'body{margin:0}')
+
+    def test_gzip_skipped_for_changed_file(self, temp_frontend):
+        """Test de archivo cambiado servido sin gzip bajo el ETag viejo."""
+        from backend.routes import frontend_routes
+
+        root, client = temp_frontend
+        frontend_routes.get_static_index()
+        (root / 'css' / 'app.css').write_text('body{padding:0;margin:0}' * 4)
+        response = client.get('/css/app.css', headers={'Accept-Encoding': 'gzip'})
+
+        assert 'Content-Encoding' not in response.headers
+        assert not response.headers['ETag'].endswith('-gz"')
+        assert response.data == b'body{padding:0;margin:0}' * 4
+
+    def test_spa_fallback_served_from_memory(self):
+        """Test del index.html de la SPA servido desde el LRU."""
+        from flask import Flask
+        from werkzeug.exceptions import NotFound
+        from backend.routes import frontend_routes
+
+        frontend_routes.invalidate_static_index()
+        frontend_app = Flask(__name__)
+        with frontend_app.test_request_context('/consulta'):
+            response = frontend_routes.frontend_not_found(NotFound())
+            body = response.get_data()
+        with frontend_app.test_request_context('/css/x.css'):
+            static_miss = frontend_routes.frontend_not_found(NotFound())
+
+        assert response.status_code == 200
+        assert body in frontend_routes._body_cache.values()
+        assert static_miss.code == 404
+
+    def test_serve_asset_with_file_wrapper(self, frontend_client):
+        """Test del envío vía wsgi.file_wrapper del servidor."""
+        from werkzeug.wsgi import FileWrapper
+
+        plain = frontend_client.get('/assets/admin.html')
+        wrapped = frontend_client.get(
+            '/assets/admin.html', environ_overrides={'wsgi.file_wrapper': FileWrapper}
+        )
+
+        assert wrapped.status_code == 200
+        assert wrapped.data == plain.data
+        assert wrapped.content_length == len(plain.data)
+
+    def test_static_not_modified(self, frontend_client):
+        """Test de revalidación con ETag y Last-Modified."""
+        first = frontend_client.get('/css/main.css')
+        etag = first.headers['ETag']
+
+        by_etag = frontend_client.get(
+            '/css/main.css', headers={'If-None-Match': etag}
+        )
+        by_date = frontend_client.get(
+            '/css/main.css',
+            headers={'If-Modified-Since': first.headers['Last-Modified']},
+        )
+
+        assert by_etag.status_code == 304
+        assert by_etag.data == b''
+        assert by_date.status_code == 304
+
+    def test_static_range_request(self, frontend_client):
+        """Test de Range sobre archivos en memoria y en disco."""
+        for url in ('/css/main.css', '/assets/admin.html'):
+            full = frontend_client.get(url)
+            partial = frontend_client.get(url, headers={'Range': 'bytes=0-9'})
+
+            assert partial.status_code == 206
+            assert partial.data == full.data[:10]
+
+    def test_default_manifest_prerendered(self, frontend_client):
+        """Test del manifest por defecto pre-renderizado con ETag."""
+        first = frontend_client.get('/manifest.json')
+        second = frontend_client.get(
+            '/manifest.json', headers={'If-None-Match': first.headers['ETag']}
+        )
+
+        assert first.get_json()['short_name'] == 'ECPlacas 2.0'
+        assert second.status_code == 304
+
+
+class TestVehicleScraper:
+    """Pruebas del scraper vehicular contra una API local simulada."""
+
+    @pytest.fixture
+    def ant_api(self):
+        """Servidor HTTP local que responde como la API de la ANT."""
+        import threading
+        from types import SimpleNamespace
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        body = json.dumps({
+            'codError': '0',
+            'campos': {'lsDatosIdentificacion': [{'descripcion_marca': 'KIA'}]},
+        }).encode()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.server.hits.append(self.path)
+                if self.server.statuses:
+                    # Respuesta de error programada por la prueba, con un cuerpo
+                    # grande que el cliente no termina de recibir sin leerlo
+                    error_body = b'x' * (1024 * 1024)
+                    self.send_response(self.server.statuses.pop(0))
+                    self.send_header('Retry-After', '0.3')
+                    self.send_header('Content-Length', str(len(error_body)))
+                    self.end_headers()
+                    try:
+                        self.wfile.write(error_body)
+                    except OSError:
+                        pass
+                    return
+                time.sleep(0.2)
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        server.hits = []
+        server.statuses = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield SimpleNamespace(
+            url=f'http://127.0.0.1:{server.server_port}/datosVehiculo.jsp',
+            hits=server.hits,
+            statuses=server.statuses,
+        )
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def scraper(self, ant_api):
+        """Scraper sin cache apuntando a la API simulada."""
+        import dataclasses
+        from backend.scraper import AsyncTokenBucket, VehicleScraper
+
+        scraper = VehicleScraper(use_cache=False)
+        scraper._api_tmpls = {
+            name: dataclasses.replace(tmpl, url=ant_api.url)
+            for name, tmpl in scraper._api_tmpls.items()
+        }
+        scraper.limiters = {name: AsyncTokenBucket(1000.0) for name in scraper.limiters}
+        return scraper
+
+    @contextmanager
+    def _loop_thread(self):
+        """Event loop corriendo en un hilo propio, como los workers de la app."""
+        import threading
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            yield loop
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+
+    def test_one_session_per_loop_closed_on_close(self, scraper):
+        """Test de una sesión por event loop, todas cerradas en close()."""
+        def run(loop, coro):
+            return asyncio.run_coroutine_threadsafe(coro, loop).result(10)
+
+        with self._loop_thread() as loop_a, self._loop_thread() as loop_b:
+            first = run(loop_a, scraper.consultar_vehiculo('ABC123'))
+            session_a = scraper._sessions[loop_a]
+            run(loop_b, scraper.consultar_vehiculo('ABC123'))
+            run(loop_a, scraper.consultar_vehiculo('PBX1234'))
+
+            assert first.consulta_exitosa
+            assert first.placa_normalizada == 'ABC0123'
+            assert first.descripcion_marca == 'KIA'
+            assert scraper._sessions[loop_a] is session_a
+            assert set(scraper._sessions) == {loop_a, loop_b}
+
+            sessions = list(scraper._sessions.values())
+            run(loop_a, scraper.close())
+
+            assert all(session.closed for session in sessions)
+            assert scraper._sessions == {}
+
+    def test_coalesced_callers_get_own_copy(self, scraper, ant_api):
+        """Test de consultas simultáneas con una sola llamada y copias propias."""
+        async def scenario():
+            try:
+                return await asyncio.gather(
+                    scraper.consultar_vehiculo('ABC123'),
+                    scraper.consultar_vehiculo('abc-0123'),
+                )
+            finally:
+                await scraper.close()
+
+        first, second = asyncio.run(scenario())
+
+        assert len(ant_api.hits) == 1
+        assert first is not second
+        assert first.placa_original == 'ABC123'
+        assert second.placa_original == 'abc-0123'
+        assert first.placa_normalizada == second.placa_normalizada == 'ABC0123'
+        second.mensaje_error = 'modificado'
+        assert first.mensaje_error == ''
+
+    def test_retry_waits_without_holding_connection(self, scraper, ant_api, monkeypatch):
+        """Test de la espera de reintento con la conexión ya devuelta."""
+        real_sleep = asyncio.sleep
+        held = []
+
+        async def watching_sleep(delay, *args, **kwargs):
+            if delay >= 0.3:
+                held.append(sum(
+                    len(session.connector._acquired)
+                    for session in scraper._sessions.values()
+                ))
+            return await real_sleep(delay, *args, **kwargs)
+
+        async def scenario():
+            name, tmpl = next(iter(scraper._api_tmpls.items()))
+            try:
+                return await scraper._consultar_api(name, tmpl, 'ABC0123')
+            finally:
+                await scraper.close()
+
+        ant_api.statuses.append(503)
+        monkeypatch.setattr(asyncio, 'sleep', watching_sleep)
+        data = asyncio.run(scenario())
+
+        assert data['codError'] == '0'
+        assert len(ant_api.hits) == 2
+        assert held == [0]
+
+    def test_closed_session_replaced(self, scraper):
+        """Test de reemplazo de una sesión cerrada en el mismo loop."""
+        async def scenario():
+            old = await scraper._get_session()
+            await old.close()
+            new = await scraper._get_session()
+            await scraper.close()
+            return old, new
+
+        old, new = asyncio.run(scenario())
+
+        assert old is not new
+        assert new.closed
+
+    def test_invalid_plate_skips_network(self, scraper):
+        """Test de placa inválida rechazada sin abrir sesión."""
+        vehiculo = asyncio.run(scraper.consultar_vehiculo('A1'))
+
+        assert not vehiculo.consulta_exitosa
+        assert 'Placa inválida' in vehiculo.mensaje_error
+        assert scraper._sessions == {}
+
+    def test_cache_shared_across_threads(self, monkeypatch):
+        """Test del cache usado desde varios hilos (un event loop por worker)."""
+        import threading
+        from backend import scraper as scraper_module
+        from backend.scraper import VehicleCache
+
+        # Miles de HIT/SET: no llenar el log de la aplicación
+        monkeypatch.setattr(scraper_module.logger, 'disabled', True)
+        cache = VehicleCache(ttl_hours=0.0001, max_entries=50)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    placa = f'ABC{(i + offset) % 120:04d}'
+                    cache.set(placa, 'ant_principal', {'i': i})
+                    cache.get(placa, 'ant_principal')
+                    if i % 50 == 0:
+                        cache.get_stats()
+            except Exception as e:  # pragma: no cover - solo si hay carrera
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(6)]
+        # Cambios de hilo muy frecuentes para provocar intercalados
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        heap = cache.expiry_heap
+        assert errors == []
+        assert len(cache.cache) <= cache.max_entries
+        assert all(heap[(i - 1) // 2] <= heap[i] for i in range(1, len(heap)))
+
+    def test_persistent_cache_opt_in(self):
+        """Test del respaldo SQLite desactivado por defecto."""
+        from backend.scraper import VehicleScraperConfig
+
+        if not os.getenv('ECPLACAS_SCRAPER_CACHE_PATH'):
+            assert VehicleScraperConfig.CACHE_CONFIG['persist_path'] is None
+
+    def test_persistent_cache_reload_and_expiry(self, tmp_path):
+        """Test de persistencia, recarga en otra instancia y vencimiento."""
+        from backend.scraper import VehicleCache
+
+        db_path = str(tmp_path / 'cache' / 'scraper.sqlite')
+        data = {'codError': '0', 'campos': {'placa': 'ABC0123'}}
+
+        VehicleCache(persist_path=db_path).set('ABC0123', 'ant_principal', data)
+        reloaded = VehicleCache(persist_path=db_path)
+        assert reloaded.get('ABC0123', 'ant_principal') == data
+        assert reloaded.get('ABC0123', 'ant_backup') is None
+
+        # Con TTL cero la entrada vence al guardarse
+        expired = VehicleCache(ttl_hours=0, persist_path=db_path)
+        expired.set('XYZ0001', 'ant_principal', data)
+        assert VehicleCache(persist_path=db_path).get('XYZ0001', 'ant_principal') is None
+        assert expired.store.purge_expired() == 1
+
+
 # ==========================================
 # PRUEBAS DE RENDIMIENTO
 # ==========================================
@@ -433,6 +1232,33 @@ class TestSustainability:
         # Verificar que la base de datos sigue funcionando
         assert database.verificar_conexion()
 
+    def test_consultation_store_bounded(self):
+        """Test del store de consultas acotado con conteo por estado."""
+        from app import ConsultationStore
+
+        store = ConsultationStore(maxsize=3)
+        for i in range(5):
+            store[f'session_{i}'] = {'status': 'iniciando'}
+        store['session_4'] = {'status': 'completado'}
+
+        assert len(store) == 3
+        assert 'session_0' not in store
+        assert store.status_counts['iniciando'] == 2
+        assert store.status_counts['completado'] == 1
+
+        store['session_3'] = {
+            'status': 'completado',
+            'result': {'propietario_encontrado': True},
+        }
+        assert store.owners_found == 1
+
+        del store['session_3']
+        del store['session_4']
+        assert store.status_counts['completado'] == 0
+        assert store.owners_found == 0
+        assert store.stale_sessions(3600) == []
+        assert store.stale_sessions(0) == list(store)
+
 
 # ==========================================
 # PRUEBAS DE SEGURIDAD